@@ -0,0 +1,181 @@
+"""Benchmarks of the hot paths of the genetic algorithms and sudoku solvers.
+
+All benchmarks use fixed seeds. Results are emitted as JSON mapping each
+benchmark to its value, unit and whether higher values are better, and can
+be compared against a stored baseline to catch performance regressions.
+
+Usage::
+
+    python -m benchmarks.bench --output bench_output.json
+    python -m benchmarks.bench --compare benchmarks/baseline.json
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+import timeit
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from genetic_algorithm_starter_kit.core import (Organism, Population,
+                                                VectorizedPopulation)
+from sudoku_solver.data.sudoku_configurations import valid_starting_position
+from sudoku_solver.sudoku import RandomSudoku, Sudoku
+from sudoku_solver.utils import evolve, parse, score_fitness, validate
+
+from .corpus import BACKTRACKING_GRADES, PUZZLES
+
+SEED = 0
+
+Results = Dict[str, Dict[str, object]]
+
+
+def _metric(value: float, unit: str, higher_is_better: bool = False) -> Dict[str, object]:
+    return {"value": value, "unit": unit, "higher_is_better": higher_is_better}
+
+
+def _best_time(func: Callable, repeat: int = 5, number: int = 1) -> float:
+    """Best time per call in seconds over several repetitions."""
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number
+
+
+def _target_chromosome(length: int) -> str:
+    return "".join(random.Random(SEED).choices(Organism.GENES, k=length))
+
+
+def bench_population() -> Results:
+    """Generations per second and time to solution of the string-matching populations."""
+    results = {}
+    engines = {
+        "population": (Population, [(100, 10), (300, 20)]),
+        "vectorized_population": (VectorizedPopulation, [(1000, 50), (10000, 30)]),
+    }
+    for name, (cls, configurations) in engines.items():
+        for size, length in configurations:
+            population = cls(size, _target_chromosome(length), seed=SEED)
+            start = time.perf_counter()
+            generation_count = population.evolve(reporters=()).generations
+            duration = time.perf_counter() - start
+            key = f"{name}.size_{size}.length_{length}"
+            results[f"{key}.time_to_solution"] = _metric(duration, "s")
+            results[f"{key}.generations_per_second"] = _metric(generation_count / duration, "1/s", True)
+    return results
+
+
+def bench_sudoku_generation() -> Results:
+    """Time per generation of the genetic algorithm for sudokus."""
+    results = {}
+    for size in [500, 2000]:
+        rng = np.random.default_rng(SEED)
+        population = RandomSudoku.create_population(valid_starting_position, size, rng)
+        scores = evolve.score_population(population)
+
+        def generation():
+            nonlocal population, scores
+            population, scores = evolve.breed(population, scores, lift_factor=0.1, rng=rng)
+
+        results[f"sudoku_evolve.size_{size}.time_per_generation"] = _metric(_best_time(generation, repeat=10), "s")
+    return results
+
+
+def bench_scoring() -> Results:
+    """Cost of fitness scoring and validation of a single board and of batches."""
+    sudoku = RandomSudoku(valid_starting_position)
+    sudoku.fill_empty_cells(np.random.default_rng(SEED))
+    board = sudoku.board
+    functions = {
+        "score_boxes": lambda: score_fitness.score_boxes(board, normalize=True),
+        "score_cols": lambda: score_fitness.score_cols(board, normalize=True),
+        "score_rows": lambda: score_fitness.score_rows(board, normalize=True),
+        "are_valid_rows": lambda: validate.are_valid_rows(board),
+        "are_valid_cols": lambda: validate.are_valid_cols(board),
+        "are_valid_boxes": lambda: validate.are_valid_boxes(board),
+    }
+    results = {
+        f"{name}.time_per_board": _metric(_best_time(func, number=1000), "s")
+        for name, func in functions.items()
+    }
+    boards = np.random.default_rng(SEED).integers(1, 10, size=(10000, 9, 9))
+    results["score_many.time_per_board"] = _metric(
+        _best_time(lambda: score_fitness.score_many(boards)) / len(boards), "s"
+    )
+    return results
+
+
+def bench_solve() -> Results:
+    """Solve times of the backtracking solvers on the graded corpus."""
+    results = {}
+    for grade, puzzle in PUZZLES.items():
+        board = parse.parse_board(puzzle)
+        methods = ["propagation"] + (["backtracking"] if grade in BACKTRACKING_GRADES else [])
+        for method in methods:
+            repeat = 5 if method == "propagation" else 1
+            duration = _best_time(lambda: Sudoku(board).solve(method=method), repeat=repeat)
+            results[f"solve.{method}.{grade}"] = _metric(duration, "s")
+    return results
+
+
+BENCHMARKS = {
+    "population": bench_population,
+    "sudoku_generation": bench_sudoku_generation,
+    "scoring": bench_scoring,
+    "solve": bench_solve,
+}
+
+
+def run(names: List[str] = None) -> Results:
+    """Run benchmarks of given names, all by default."""
+    results = {}
+    for name in names or BENCHMARKS:
+        results.update(BENCHMARKS[name]())
+    return results
+
+
+def compare(results: Results, baseline: Results, tolerance: float) -> List[str]:
+    """Compare results against baseline and describe all regressions.
+
+    A benchmark regresses if it is worse than its baseline value by more
+    than the given relative tolerance.
+    """
+    regressions = []
+    for name, metric in results.items():
+        if name not in baseline:
+            continue
+        value, reference = metric["value"], baseline[name]["value"]
+        if metric["higher_is_better"]:
+            regressed = value < reference * (1 - tolerance)
+        else:
+            regressed = value > reference * (1 + tolerance)
+        if regressed:
+            regressions.append(f"{name}: {value:.6g} {metric['unit']} (baseline {reference:.6g} {metric['unit']})")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the genetic algorithms and sudoku solvers.")
+    parser.add_argument("--benchmarks", nargs="+", choices=list(BENCHMARKS), default=None)
+    parser.add_argument("--output", help="write results as JSON to this file instead of stdout")
+    parser.add_argument("--compare", metavar="BASELINE", help="JSON file of baseline results")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="relative slowdown tolerated (default: 0.5)")
+    args = parser.parse_args()
+
+    results = run(args.benchmarks)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=4)
+    else:
+        print(json.dumps(results, indent=4))
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        if regressions := compare(results, baseline, args.tolerance):
+            print("Performance regressions:", *regressions, sep="\n", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
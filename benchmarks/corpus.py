@@ -0,0 +1,22 @@
+"""Graded corpus of sudoku puzzles for benchmarking the solvers.
+
+Puzzles are given as lines of 81 characters (see ``sudoku_solver.utils.parse``)
+and graded from easy to hard by the effort of the naive backtracking solver.
+"""
+
+from sudoku_solver.data.sudoku_configurations import valid_starting_position
+from sudoku_solver.utils import parse
+
+PUZZLES = {
+    "easy": parse.format_board(valid_starting_position),
+    "medium": "003020600900305001001806400008102900700000008006708200002609500800203009005010300",
+    "hard": "000000907000420180000705026100904000050000040000507009920108000034059000507000000",
+    # naive backtracking takes minutes to hours on the puzzles below
+    "very_hard": "4.....8.5.3..........7......2.....6.....8.4......1.......6.3.7.5..2.....1.4......",
+    "17_clues": "000000010400000000020000000000050407008000300001090000300400200050100000000806000",
+    "ai_escargot": "100007090030020008009600500005300900010080002600004000300000010040000007007000300",
+    "inkala_2012": "800000000003600000070090200050007000000045700000100030001000068008500010090000400",
+}
+
+# Grades which the naive backtracking solver finishes within seconds
+BACKTRACKING_GRADES = ("easy", "medium", "hard")
@@ -0,0 +1,100 @@
+"""Memoization of fitness scores.
+
+Populations under high selection pressure contain many duplicate genomes,
+e.g. lifted elites and children identical to a parent. A ``FitnessCache``
+keyed on the genome bytes avoids scoring them again. It is bounded and
+evicts the least recently used scores first.
+"""
+
+from collections import OrderedDict
+from typing import Any, Hashable, NamedTuple
+
+import numpy as np
+
+from .fitness import BatchFitness
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class FitnessCache:
+    """Bounded LRU cache of fitness scores.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of cached scores, by default 100000.
+    """
+
+    def __init__(self, maxsize: int = 100_000) -> None:
+        if maxsize < 1:
+            raise ValueError("Cache size must be positive.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._scores = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._scores
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Cached score for key, counting the lookup as hit or miss."""
+        try:
+            score = self._scores[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._scores.move_to_end(key)
+        self.hits += 1
+        return score
+
+    def put(self, key: Hashable, score: Any) -> None:
+        """Cache score for key, evicting the least recently used if full."""
+        self._scores[key] = score
+        self._scores.move_to_end(key)
+        if len(self._scores) > self.maxsize:
+            self._scores.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all scores and reset the counters."""
+        self._scores.clear()
+        self.hits = self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Hit and miss counters and size of the cache."""
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._scores))
+
+
+class CachedFitness:
+    """Batch fitness function scoring only genomes missing from a cache.
+
+    Genomes are keyed on their bytes. Missing genomes are scored with a
+    single call of the wrapped function, duplicates within a batch once.
+    """
+
+    def __init__(self, func: BatchFitness, cache: FitnessCache) -> None:
+        self.func = func
+        self.cache = cache
+
+    def __call__(self, genomes: np.ndarray) -> np.ndarray:
+        scores = np.empty(len(genomes))
+        missing = {}
+        for idx, genome in enumerate(genomes):
+            key = genome.tobytes()
+            if (score := self.cache.get(key)) is None:
+                missing.setdefault(key, []).append(idx)
+            else:
+                scores[idx] = score
+        if missing:
+            rows = [indices[0] for indices in missing.values()]
+            for (key, indices), score in zip(missing.items(), np.asarray(self.func(genomes[rows])).tolist()):
+                scores[indices] = score
+                self.cache.put(key, score)
+        return scores
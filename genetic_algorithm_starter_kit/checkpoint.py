@@ -0,0 +1,79 @@
+"""Snapshots of evolution state for checkpointing and resuming runs.
+
+A checkpoint file consists of a magic number, the length of a JSON header,
+the header and the raw bytes of arrays, each aligned to 64 bytes. The header
+holds the array layout and arbitrary JSON serializable state, e.g. the
+generation count and the states of random number generators. Arrays are
+written in bulk and read back memory-mapped, so snapshots of large
+populations cost little more than copying their bytes. Files are replaced
+atomically, thus a run killed while checkpointing keeps its last snapshot.
+"""
+
+import json
+import os
+import struct
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+MAGIC = b"GACKPT01"
+_ALIGNMENT = 64
+
+
+def save(path: str, state: Dict[str, Any], **arrays: np.ndarray) -> None:
+    """Write state and arrays to a checkpoint file."""
+    layout = {}
+    offset = 0
+    for name, array in arrays.items():
+        offset = -(-offset // _ALIGNMENT) * _ALIGNMENT
+        layout[name] = {"dtype": array.dtype.str, "shape": array.shape, "offset": offset}
+        offset += array.nbytes
+    header = json.dumps({"state": state, "arrays": layout}).encode()
+    # data starts aligned after magic number, header length and header
+    data_start = -(-(len(MAGIC) + 8 + len(header)) // _ALIGNMENT) * _ALIGNMENT
+    header += b" " * (data_start - len(MAGIC) - 8 - len(header))
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as file:
+        file.write(MAGIC + struct.pack("<Q", len(header)) + header)
+        for name, array in arrays.items():
+            file.seek(data_start + layout[name]["offset"])
+            np.ascontiguousarray(array).tofile(file)
+        file.truncate(data_start + offset)
+    os.replace(tmp_path, path)
+
+
+def load(path: str) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+    """Read state and read-only memory-mapped arrays from a checkpoint file."""
+    with open(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a checkpoint file.")
+        header_size, = struct.unpack("<Q", file.read(8))
+        header = json.loads(file.read(header_size))
+    data_start = len(MAGIC) + 8 + header_size
+    arrays = {}
+    for name, layout in header["arrays"].items():
+        shape = tuple(layout["shape"])
+        if np.prod(shape) == 0:
+            arrays[name] = np.empty(shape, dtype=layout["dtype"])
+        else:
+            arrays[name] = np.memmap(
+                path, dtype=layout["dtype"], mode="r", offset=data_start + layout["offset"], shape=shape
+            )
+    return header["state"], arrays
+
+
+def random_state(rng: np.random.Generator) -> Dict[str, Any]:
+    """JSON serializable state of a numpy generator.
+
+    Evolution loops draw all random numbers from their generator, so the
+    global state of the random module is not part of a checkpoint.
+    """
+    return {"numpy": rng.bit_generator.state}
+
+
+def restore_random_state(state: Dict[str, Any]) -> np.random.Generator:
+    """Return a numpy generator from its state, leaving the random module untouched."""
+    bit_generator = getattr(np.random, state["numpy"]["bit_generator"])()
+    bit_generator.state = state["numpy"]
+    return np.random.Generator(bit_generator)
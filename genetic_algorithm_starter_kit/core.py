@@ -8,138 +8,688 @@ specific genetic algorithm. The code here has evolved and mutated from [1].
 
 from __future__ import annotations
 
-import random
 from abc import abstractmethod
-from typing import List
+from functools import lru_cache, partial
+from typing import Dict, List, Sequence, Tuple, Type
+
+import numpy as np
+
+from . import checkpoint, selection
+from .cache import CachedFitness, FitnessCache
+from .fitness import BatchFitness, TargetMatch
+from .profiling import NULL_PROFILER, NullProfiler
+from .reporting import GenerationEvent, Reporter, default_reporters
+from .termination import RESTART, EvolutionResult, Termination
+
+
+@lru_cache(maxsize=None)
+def _gene_tables(genes: Tuple[str, ...]) -> Tuple[np.ndarray, np.ndarray]:
+    """Array of genes and lookup table from code points to indices into genes, -1 if not a gene."""
+    codes = [ord(gene) for gene in genes]
+    table = np.full(max(codes) + 1, -1, dtype=np.int16)
+    table[codes] = np.arange(len(genes))
+    return np.array(genes), table
 
 
 class Organism:
 
+    # Alphabet of genes, which subclasses may override. Genomes encode genes
+    # as indices into the alphabet of their class, see ``encode``.
     GENES = list(
         """abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ1234567890,.-;:_!'"*#%&/()=?@${[]} """
     )
 
+    # Optional batch fitness function, see ``fitness.BatchFitness``, which
+    # populations of a subclass use unless given another fitness function.
+    # Define it as a staticmethod.
+    batch_fitness: BatchFitness = None
+
+    # Probabilities below which a gene is inherited from self and from the
+    # mate, else mutated. Restarts escalate the mutation rate from these.
+    prob_cutoffs = {
+        "self": 0.45,
+        "mate": 0.45 * 2,
+    }
+
     def __init__(self, chromosome: str = "") -> None:
         self.chromosome = chromosome
 
+    @property
+    def chromosome(self) -> str:
+        return self._chromosome
+
+    @chromosome.setter
+    def chromosome(self, chromosome: str) -> None:
+        # any change of the genome invalidates a cached fitness score
+        self._chromosome = chromosome
+        self.fitness = None
+
     def __repr__(self) -> str:
         return rf"Chromosome: {self.chromosome}"
 
     @classmethod
-    def create(cls, chromosome_length: int = None) -> Organism:
+    def create(cls, chromosome_length: int = None, rng: np.random.Generator = None) -> Organism:
         """Create chromosome of given or random length."""
+        rng = np.random.default_rng(rng)
         if not chromosome_length:
-            chromosome_length = random.choice(range(5, 50))
-        chromosome = "".join([random.choice(cls.GENES) for _ in range(chromosome_length)])
-        return cls(chromosome)
+            chromosome_length = int(rng.integers(5, 50))
+        genes = rng.integers(0, len(cls.GENES), chromosome_length).tolist()
+        return cls("".join([cls.GENES[gene] for gene in genes]))
+
+    @classmethod
+    def encode(cls, chromosome: str) -> np.ndarray:
+        """Encode chromosome as array of indices into ``GENES`` of the class."""
+        _, gene_table = _gene_tables(tuple(cls.GENES))
+        codes = np.frombuffer(chromosome.encode("utf-32-le"), dtype=np.uint32)
+        genome = gene_table[np.minimum(codes, len(gene_table) - 1)]
+        invalid = (genome < 0) | (codes >= len(gene_table))
+        if invalid.any():
+            raise ValueError(f"Gene {chromosome[np.argmax(invalid)]!r} is not in {cls.__name__}.GENES.")
+        return genome.astype(np.uint8)
+
+    @classmethod
+    def decode(cls, genome: np.ndarray) -> str:
+        """Decode array of gene indices into a chromosome."""
+        gene_array, _ = _gene_tables(tuple(cls.GENES))
+        return "".join(gene_array[genome])
 
     @abstractmethod
-    def reproduce(self, *args) -> Organism:
-        pass
+    def reproduce(
+        self, mate: Organism, rng: np.random.Generator = None, prob_cutoffs: Dict[str, float] = None
+    ) -> Organism:
+        """Produce an offspring with a mate.
+
+        Populations pass their random number generator, so that seeded runs
+        are reproducible, and after restarts (see ``termination.Restart``)
+        escalated probability cutoffs. Subclasses must accept both arguments,
+        overriding ``reproduce(self, mate)`` only is no longer supported.
+        """
 
 
 class Individual(Organism):
 
-    prob_cutoffs = {
-        "self": 0.45,
-        "mate": 0.45 * 2,
-    }
-
     def __init__(self, chromosome: str = "", *args):
         super().__init__(chromosome, *args)
 
-    def reproduce(self, mate: Individual) -> Individual:
-        """Perform reproduction and produce new offspring."""
+    def reproduce(
+        self, mate: Individual, rng: np.random.Generator = None, prob_cutoffs: Dict[str, float] = None
+    ) -> Individual:
+        """Perform reproduction and produce new offspring.
+
+        Random numbers for all genes are drawn from the generator at once.
+        Probability cutoffs other than ``Individual.prob_cutoffs`` change the
+        mutation rate.
+        """
+        rng = np.random.default_rng(rng)
+        prob_cutoffs = prob_cutoffs or self.prob_cutoffs
+        n_genes = len(self.chromosome)
+        probs = rng.random(n_genes).tolist()
+        mutations = rng.integers(0, len(self.GENES), n_genes).tolist()
         child_chromosome = []
-        for gene_self, gene_mate in zip(self.chromosome, mate.chromosome):
-            prob = random.random()
-            if prob < self.prob_cutoffs["self"]:
+        for gene_self, gene_mate, prob, mutation in zip(self.chromosome, mate.chromosome, probs, mutations):
+            if prob < prob_cutoffs["self"]:
                 # get gene from self
                 child_chromosome.append(gene_self)
-            elif prob < self.prob_cutoffs["mate"]:
+            elif prob < prob_cutoffs["mate"]:
                 # get gene from mate
                 child_chromosome.append(gene_mate)
             else:
                 # random mutation
-                child_chromosome.append(random.choice(super().GENES))
-        return Individual("".join(child_chromosome))
+                child_chromosome.append(self.GENES[mutation])
+        return type(self)("".join(child_chromosome))
 
 
 class Population:
-    """Create and evolve a population towards a target chromosome."""
-
-    def __init__(self, size: int, target_chromosome: str = "") -> None:
-        self.individuals = self._create_population(size, target_chromosome)
+    """Create and evolve a population towards a target chromosome.
+
+    Parameters
+    ----------
+    size : int
+        Number of individuals.
+    target_chromosome : str, optional
+        Chromosome to evolve towards, scored by the fraction of matching genes.
+    fitness : BatchFitness, optional
+        Batch fitness function used instead of matching a target, by default
+        ``organism.batch_fitness``. It scores genomes of indices into the
+        ``GENES`` of the organism. Evolution stops at a fitness score of 1.
+    organism : type, optional
+        Organism subclass of the individuals, by default ``Individual``.
+    chromosome_length : int, optional
+        Chromosome length if there is no target, by default random.
+    cache : FitnessCache, optional
+        Cache of fitness scores keyed on genomes, exposed as ``cache``.
+    seed : int, np.random.SeedSequence or np.random.Generator, optional
+        Seed of the random number generator of the population, which is
+        passed on to ``organism.create`` and ``reproduce``.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        target_chromosome: str = "",
+        fitness: BatchFitness = None,
+        organism: Type[Organism] = Individual,
+        chromosome_length: int = None,
+        cache: FitnessCache = None,
+        seed: int = None,
+    ) -> None:
+        self._rng = np.random.default_rng(seed)
+        if target_chromosome:
+            chromosome_length = len(target_chromosome)
+        elif not chromosome_length:
+            chromosome_length = int(self._rng.integers(5, 50))
+        self.individuals = [organism.create(chromosome_length, self._rng) for _ in range(size)]
+        self._organism = organism
         self._target_chromosome = target_chromosome
+        self._fitness = _fitness_function(fitness, organism, target_chromosome, cache)
+        self.cache = cache
+        # the default fitness can be scored per gene and incrementally
+        self._target_fitness = fitness is None and organism.batch_fitness is None
+        self._generation = 1
+        # progress of the termination and escalated cutoffs of a resumed run
+        self._termination_state = None
+        self._prob_cutoffs = None
 
-    @staticmethod
-    def _create_population(size: int, target_chromosome: str) -> List[Individual]:
-        """Create a populations of given size and chromosome length."""
-        if not target_chromosome:
-            target_chromosome = "".join(["_"] * random.choice(range(5, 50)))
-        return [Individual.create(len(target_chromosome)) for _ in range(size)]
-
-    def fitness_score(self, individual: Individual) -> int:
-        """Fitness score for an individual w.r.t. a target."""
+    @classmethod
+    def resume(
+        cls,
+        checkpoint_path: str,
+        fitness: BatchFitness = None,
+        organism: Type[Organism] = Individual,
+        cache: FitnessCache = None,
+    ) -> Population:
+        """Restore population from a checkpoint saved by ``evolve``.
+
+        Evolving the restored population continues exactly as the run which
+        saved the checkpoint would have. Fitness functions are not saved and
+        need to be passed again unless the population evolves to a target.
+        Likewise, the criteria of the termination need to be passed to
+        ``evolve`` again, which continues from the saved restarts, stagnation
+        and elapsed time and with the escalated mutation rate.
+        """
+        state, genomes, scores = _load_checkpoint(checkpoint_path)
+        population = cls(0, state["target_chromosome"], fitness, organism, genomes.shape[1], cache)
+        population.individuals = [organism(organism.decode(genome)) for genome in genomes]
+        for individual, score in zip(population.individuals, scores.tolist()):
+            individual.fitness = score
+        population._rng = checkpoint.restore_random_state(state["random_state"])
+        population._generation = state["generation"]
+        population._termination_state = state.get("termination")
+        population._prob_cutoffs = state.get("prob_cutoffs")
+        return population
+
+    def fitness_score(self, individual: Individual) -> float:
+        """Fitness score for an individual, by default w.r.t. a target."""
+        if not self._target_fitness:
+            return float(self._fitness(self._organism.encode(individual.chromosome)[np.newaxis])[0])
         score = 0
         for idx, gene in enumerate(individual.chromosome):
             if gene == self._target_chromosome[idx]:
                 score += 1
         return score/len(self._target_chromosome)
 
-    def evolve(self, verbose: bool = True) -> None:
-        """Evolve towards a target chromosome.
+    def mutate(self, individual: Individual, changes: Dict[int, str]) -> Individual:
+        """Produce offspring which differs in given genes (index to gene).
 
-        TODO Refactor.
+        If the fitness score of the individual is cached, the offspring is
+        scored incrementally by only comparing the changed genes to the target.
+        """
+        chromosome = list(individual.chromosome)
+        for idx, gene in changes.items():
+            chromosome[idx] = gene
+        child = type(individual)("".join(chromosome))
+        if individual.fitness is not None and self._target_fitness:
+            n_genes = len(self._target_chromosome)
+            score = round(individual.fitness * n_genes)
+            for idx, gene in changes.items():
+                target_gene = self._target_chromosome[idx]
+                score += (gene == target_gene) - (individual.chromosome[idx] == target_gene)
+            child.fitness = score / n_genes
+        return child
+
+    def _fitness_scores(self, individuals: List[Individual]) -> List[float]:
+        """Fitness scores for individuals, scoring only those not cached yet.
+
+        All unscored individuals are scored with a single call of the batch
+        fitness function.
         """
-        if not self._target_chromosome:
-            raise ValueError("Cannot evolve. Target chromosome missing.")
+        unscored = [individual for individual in individuals if individual.fitness is None]
+        if unscored:
+            genomes = self._organism.encode("".join(individual.chromosome for individual in unscored))
+            scores = self._fitness(genomes.reshape(len(unscored), -1))
+            for individual, score in zip(unscored, scores.tolist()):
+                individual.fitness = score
+        return [individual.fitness for individual in individuals]
+
+    def evolve(
+        self,
+        verbose: bool = True,
+        selection_strategy: str = "truncation",
+        checkpoint_path: str = None,
+        checkpoint_interval: int = 100,
+        termination: Termination = None,
+        reporters: Sequence[Reporter] = None,
+        profiler: NullProfiler = None,
+        steady_state: int = None,
+    ) -> EvolutionResult:
+        """Evolve towards a target chromosome.
 
+        Parents are selected with one of the strategies of
+        ``genetic_algorithm_starter_kit.selection``, by default uniformly from
+        the fittest half of the population. If a checkpoint path is given, the
+        population is saved to it every ``checkpoint_interval`` generations
+        (see ``resume``).
+
+        By default each generation replaces the population but its fittest
+        tenth. With ``steady_state`` set, each generation instead breeds that
+        many children, which overwrite the least fit individuals in place,
+        and only the children are scored.
+
+        The evolution stops on any criterion of ``termination``, by default
+        once the target is found, and may restart a stagnating population
+        (see ``genetic_algorithm_starter_kit.termination``). Escalating the
+        mutation rate passes ``prob_cutoffs`` on to ``reproduce``. Returns
+        the fittest chromosome, its fitness score, the generation count and
+        the stop reason. The final population is kept in ``individuals`` by
+        decreasing order of fitness score.
+
+        Progress is reported to ``reporters`` (see
+        ``genetic_algorithm_starter_kit.reporting``), by default printed at
+        most every 0.1 seconds on new lines if ``verbose``. No reporters
+        evolve silently. A ``profiler`` records the cost of the phases of
+        each generation (see ``genetic_algorithm_starter_kit.profiling``).
+        """
+        if self._fitness is None:
+            raise ValueError("Cannot evolve. Target chromosome or fitness function missing.")
+        selection.check_steady_state(steady_state, len(self.individuals))
+
+        select_parents = selection.get_strategy(selection_strategy)
+        termination = termination or Termination()
+        termination.start()
+        if self._termination_state is not None:
+            termination.restore(self._termination_state)
+        rng = self._rng
         cutoff_factor = 0.1
-        generation_count = 1
+        generation_count = self._generation
         population = self.individuals
-        target_found = False
-
-        def print_out(generation_count: int, fittest_individual: Individual):
-            """Print out during evolution."""
-            print(
+        if steady_state:
+            # the population is a fixed buffer overwritten in place
+            population = population.copy()
+        reproduce_kwargs = {} if self._prob_cutoffs is None else {"prob_cutoffs": self._prob_cutoffs}
+        self._termination_state = self._prob_cutoffs = None
+        if reporters is None:
+            reporters = default_reporters(verbose)
+        if profiler is None:
+            profiler = NULL_PROFILER
+
+        def format_line(generation_count: int, fittest_individual: Individual) -> str:
+            """Progress line of a generation."""
+            return (
                 f"GENERATION: {str(generation_count).zfill(7)}"
-                f"\tFITNESS SCORE: {str(round(self.fitness_score(fittest_individual), 4)).zfill(7)}"
-                f"\tFITTEST INDIVIDUAL: {fittest_individual.chromosome}",
-                end="\n" if verbose else "\r",
+                f"\tFITNESS SCORE: {str(round(fittest_individual.fitness, 4)).zfill(7)}"
+                f"\tFITTEST INDIVIDUAL: {fittest_individual.chromosome}"
             )
 
-        while not target_found:
+        with profiler.phase("score"):
+            scores = np.array(self._fitness_scores(population))
+        while True:
+
+            profiler.mark_generation(generation_count)
+            fittest = np.argmax(scores)
+            fittest_individual = population[fittest]
+            if reporters:
+                with profiler.phase("report"):
+                    event = GenerationEvent(
+                        generation_count, scores, fittest, partial(format_line, generation_count, fittest_individual)
+                    )
+                    for reporter in reporters:
+                        reporter.on_generation(event)
+
+            # stop e.g. if fittest individual has fitness score of 1
+            stop_reason = termination.check(generation_count, fittest_individual.fitness)
+            if stop_reason == RESTART:
+                restart = termination.restart
+                with profiler.phase("init"):
+                    population = population.copy()
+                    chromosome_length = len(population[0].chromosome)
+                    for idx in selection.worst_indices(scores, restart.n_reseeded(len(population))):
+                        population[idx] = self._organism.create(chromosome_length, rng)
+                with profiler.phase("score"):
+                    scores = np.array(self._fitness_scores(population))
+                reproduce_kwargs["prob_cutoffs"] = restart.escalate(
+                    reproduce_kwargs.get("prob_cutoffs", self._organism.prob_cutoffs)
+                )
+            elif stop_reason:
+                break
+
+            if checkpoint_path and generation_count % checkpoint_interval == 0:
+                with profiler.phase("checkpoint"):
+                    genomes = self._organism.encode("".join(individual.chromosome for individual in population))
+                    _save_checkpoint(
+                        checkpoint_path,
+                        genomes.reshape(len(population), -1),
+                        scores,
+                        generation_count,
+                        rng,
+                        self._target_chromosome,
+                        termination,
+                        reproduce_kwargs.get("prob_cutoffs"),
+                    )
+
+            if steady_state:
+                with profiler.phase("select"):
+                    parents = select_parents(scores, 2 * steady_state, rng).reshape(2, steady_state)
+                    slots = selection.worst_indices(scores, steady_state)
+                with profiler.phase("reproduce"):
+                    children = [
+                        population[idx1].reproduce(population[idx2], rng, **reproduce_kwargs)
+                        for idx1, idx2 in zip(*parents.tolist())
+                    ]
+                # children overwrite the least fit individuals
+                with profiler.phase("score"):
+                    scores[slots] = self._fitness_scores(children)
+                for slot, child in zip(slots.tolist(), children):
+                    population[slot] = child
+                generation_count += 1
+                continue
+
+            with profiler.phase("select"):
+                # fittest individuals go to next generation
+                n_fittest_individuals = int(cutoff_factor * len(population))
+                new_generation = [population[idx] for idx in selection.elite_indices(scores, n_fittest_individuals)]
+                n_children = len(population) - n_fittest_individuals
+                parents = select_parents(scores, 2 * n_children, rng).reshape(2, n_children)
+
+            # selected parents mate to produce offspring
+            with profiler.phase("reproduce"):
+                for idx1, idx2 in zip(*parents.tolist()):
+                    new_generation.append(population[idx1].reproduce(population[idx2], rng, **reproduce_kwargs))
 
-            # sort population by decreasing order of fitness score
-            population = sorted(
-                population,
-                key=lambda x: self.fitness_score(x),
-                reverse=True,
-            )
+            population = new_generation
+            with profiler.phase("score"):
+                scores = np.array(self._fitness_scores(population))
+            generation_count += 1
 
-            # if fittest individual has fitness score of 1 we are done
-            if self.fitness_score(fittest_individual := population[0]) == 1.0:
-                target_found = True
+        profiler.finish()
+        # keep population sorted by decreasing order of fitness score
+        self.individuals = [population[idx] for idx in np.argsort(-scores, kind="stable").tolist()]
+        result = termination.result(
+            fittest_individual.chromosome, fittest_individual.fitness, generation_count, stop_reason
+        )
+        with profiler.phase("report"):
+            for reporter in reporters:
+                reporter.on_finish(result)
+        return result
+
+
+class VectorizedPopulation:
+    """Create and evolve a population stored as a 2-D array of gene indices.
+
+    Each row of ``genomes`` is one individual whose genes are encoded as
+    indices into ``Organism.GENES``. Fitness scoring, crossover and mutation
+    are computed for a whole generation at once with vectorized masks, which
+    follows the same rules as ``Population.evolve``. A batch fitness function
+    and a fitness cache (see ``Population``) score all children of a
+    generation in one call.
+    """
+
+    _GENES = Organism.GENES
+
+    def __init__(
+        self,
+        size: int,
+        target_chromosome: str = "",
+        seed: int = None,
+        fitness: BatchFitness = None,
+        chromosome_length: int = None,
+        cache: FitnessCache = None,
+    ) -> None:
+        self._rng = np.random.default_rng(seed)
+        self._target_chromosome = target_chromosome
+        if target_chromosome:
+            chromosome_length = len(target_chromosome)
+        elif not chromosome_length:
+            chromosome_length = int(self._rng.integers(5, 50))
+        self._fitness = _fitness_function(fitness, Organism, target_chromosome, cache)
+        self.cache = cache
+        self.genomes = self._rng.integers(
+            0, len(self._GENES), size=(size, chromosome_length), dtype=np.uint8
+        )
+        self._generation = 1
+        self._scores = None
+        # progress of the termination and escalated cutoffs of a resumed run
+        self._termination_state = None
+        self._prob_cutoffs = None
 
-            print_out(generation_count, fittest_individual)
+    @classmethod
+    def resume(
+        cls, checkpoint_path: str, fitness: BatchFitness = None, cache: FitnessCache = None
+    ) -> VectorizedPopulation:
+        """Restore population from a checkpoint saved by ``evolve``.
+
+        Evolving the restored population continues exactly as the run which
+        saved the checkpoint would have. Fitness functions are not saved and
+        need to be passed again unless the population evolves to a target.
+        Likewise, the criteria of the termination need to be passed to
+        ``evolve`` again, which continues from the saved restarts, stagnation
+        and elapsed time and with the escalated mutation rate.
+        """
+        state, genomes, scores = _load_checkpoint(checkpoint_path)
+        population = cls(
+            0, state["target_chromosome"], fitness=fitness, chromosome_length=genomes.shape[1], cache=cache
+        )
+        population.genomes = np.array(genomes)
+        population._scores = np.array(scores)
+        population._rng = checkpoint.restore_random_state(state["random_state"])
+        population._generation = state["generation"]
+        population._termination_state = state.get("termination")
+        population._prob_cutoffs = state.get("prob_cutoffs")
+        return population
 
-            # generate new offsprings for new generation
-            new_generation = []
+    @staticmethod
+    def encode(chromosome: str) -> np.ndarray:
+        """Encode chromosome as array of indices into ``Organism.GENES``."""
+        return Organism.encode(chromosome)
 
-            # fittest individuals go to next generation
-            n_fittest_individuals = int(cutoff_factor * len(population))
-            new_generation.extend(population[:n_fittest_individuals])
+    @staticmethod
+    def decode(genome: np.ndarray) -> str:
+        """Decode array of gene indices into a chromosome."""
+        return Organism.decode(genome)
+
+    @property
+    def individuals(self) -> List[Individual]:
+        """Population as individuals with decoded chromosomes."""
+        return [Individual(self.decode(genome)) for genome in self.genomes]
+
+    def fitness_scores(self, genomes: np.ndarray = None) -> np.ndarray:
+        """Fitness scores for all genomes, by default w.r.t. a target."""
+        if self._fitness is None:
+            raise ValueError("Target chromosome or fitness function missing.")
+        if genomes is None:
+            genomes = self.genomes
+        return np.asarray(self._fitness(genomes), dtype=float)
+
+    def evolve(
+        self,
+        verbose: bool = True,
+        selection_strategy: str = "truncation",
+        checkpoint_path: str = None,
+        checkpoint_interval: int = 100,
+        termination: Termination = None,
+        reporters: Sequence[Reporter] = None,
+        profiler: NullProfiler = None,
+        steady_state: int = None,
+    ) -> EvolutionResult:
+        """Evolve towards a target chromosome.
 
-            # 50% of fittest Individuals will mate to produce offspring
-            idx = len(population) - n_fittest_individuals
-            for _ in range(idx):
-                parent1 = random.choice(population[:len(population)//2])
-                parent2 = random.choice(population[:len(population)//2])
-                child = parent1.reproduce(parent2)
-                new_generation.append(child)
+        Parents are selected with one of the strategies of
+        ``genetic_algorithm_starter_kit.selection``. If a checkpoint path is
+        given, the population is saved to it every ``checkpoint_interval``
+        generations (see ``resume``). The evolution stops on any criterion of
+        ``termination`` like ``Population.evolve``, which also describes the
+        returned result, the reporting of progress, profiling and the
+        ``steady_state`` mode, in which children overwrite the rows of the
+        least fit genomes in place.
+        """
+        if self._fitness is None:
+            raise ValueError("Cannot evolve. Target chromosome or fitness function missing.")
+        selection.check_steady_state(steady_state, len(self.genomes))
+
+        select_parents = selection.get_strategy(selection_strategy)
+        termination = termination or Termination()
+        termination.start()
+        if self._termination_state is not None:
+            termination.restore(self._termination_state)
+        prob_cutoffs = self._prob_cutoffs or Individual.prob_cutoffs
+        self._termination_state = self._prob_cutoffs = None
+        cutoff_factor = 0.1
+        generation_count = self._generation
+        genomes = self.genomes
+        if profiler is None:
+            profiler = NULL_PROFILER
+        with profiler.phase("score"):
+            scores = self.fitness_scores(genomes) if self._scores is None else self._scores
+        self._generation, self._scores = 1, None
+        if steady_state:
+            # genomes and scores are fixed buffers overwritten in place
+            genomes, scores = genomes.copy(), np.array(scores, dtype=float)
+
+        n_genes = len(self._GENES)
+        n_fittest_individuals = int(cutoff_factor * len(genomes))
+        n_children = steady_state or len(genomes) - n_fittest_individuals
+        shape = (n_children, genomes.shape[1])
+        if reporters is None:
+            reporters = default_reporters(verbose)
+
+        def format_line(generation_count: int, fitness_score: float, fittest_genome: np.ndarray) -> str:
+            """Progress line of a generation."""
+            return (
+                f"GENERATION: {str(generation_count).zfill(7)}"
+                f"\tFITNESS SCORE: {str(round(fitness_score, 4)).zfill(7)}"
+                f"\tFITTEST INDIVIDUAL: {self.decode(fittest_genome)}"
+            )
 
-            population = new_generation
+        while True:
+
+            profiler.mark_generation(generation_count)
+            fittest = np.argmax(scores)
+            best_score = scores[fittest]
+            if reporters:
+                with profiler.phase("report"):
+                    line = partial(format_line, generation_count, best_score, genomes[fittest])
+                    event = GenerationEvent(generation_count, scores, fittest, line)
+                    for reporter in reporters:
+                        reporter.on_generation(event)
+
+            # stop e.g. if fittest individual has fitness score of 1
+            stop_reason = termination.check(generation_count, best_score)
+            if stop_reason == RESTART:
+                restart = termination.restart
+                with profiler.phase("init"):
+                    reseeded = selection.worst_indices(scores, restart.n_reseeded(len(genomes)))
+                    genomes = genomes.copy()
+                    genomes[reseeded] = self._rng.integers(
+                        0, n_genes, (len(reseeded), genomes.shape[1]), dtype=np.uint8
+                    )
+                with profiler.phase("score"):
+                    scores = scores.copy()
+                    scores[reseeded] = self.fitness_scores(genomes[reseeded])
+                prob_cutoffs = restart.escalate(prob_cutoffs)
+            elif stop_reason:
+                break
+
+            if checkpoint_path and generation_count % checkpoint_interval == 0:
+                with profiler.phase("checkpoint"):
+                    _save_checkpoint(
+                        checkpoint_path,
+                        genomes,
+                        scores,
+                        generation_count,
+                        self._rng,
+                        self._target_chromosome,
+                        termination,
+                        prob_cutoffs,
+                    )
+
+            with profiler.phase("select"):
+                parents = select_parents(scores, 2 * n_children, self._rng)
+                if steady_state:
+                    slots = selection.worst_indices(scores, steady_state)
+                else:
+                    elites = selection.elite_indices(scores, n_fittest_individuals)
+
+            # selected parents mate to produce offspring
+            with profiler.phase("reproduce"):
+                parents_self, parents_mate = genomes[parents[:n_children]], genomes[parents[n_children:]]
+                prob = self._rng.random(shape)
+                children = np.where(prob < prob_cutoffs["self"], parents_self, parents_mate)
+                # random mutation
+                mutated = prob >= prob_cutoffs["mate"]
+                children[mutated] = self._rng.integers(0, n_genes, np.count_nonzero(mutated), dtype=np.uint8)
+
+            # fittest individuals go to next generation, only children need scoring
+            with profiler.phase("score"):
+                children_scores = self.fitness_scores(children)
+            if steady_state:
+                # children overwrite the least fit genomes
+                genomes[slots], scores[slots] = children, children_scores
+            else:
+                genomes = np.concatenate([genomes[elites], children])
+                scores = np.concatenate([scores[elites], children_scores])
             generation_count += 1
 
-        print("\nDone.")
+        profiler.finish()
+        # keep population sorted by decreasing order of fitness score
+        self.genomes = genomes[np.argsort(-scores, kind="stable")]
+        result = termination.result(self.decode(genomes[fittest]), float(best_score), generation_count, stop_reason)
+        with profiler.phase("report"):
+            for reporter in reporters:
+                reporter.on_finish(result)
+        return result
+
+
+def _fitness_function(
+    fitness: BatchFitness, organism: Type[Organism], target_chromosome: str, cache: FitnessCache = None
+) -> BatchFitness:
+    """Given fitness function, else the organism's, else matching a target.
+
+    The fitness function looks up scores in the cache if one is given.
+    """
+    if fitness is None:
+        fitness = organism.batch_fitness
+    if fitness is None and target_chromosome:
+        fitness = TargetMatch(organism.encode(target_chromosome))
+    if fitness is not None and cache is not None:
+        fitness = CachedFitness(fitness, cache)
+    return fitness
+
+
+def _save_checkpoint(
+    path: str,
+    genomes: np.ndarray,
+    scores: np.ndarray,
+    generation_count: int,
+    rng: np.random.Generator,
+    target_chromosome: str,
+    termination: Termination,
+    prob_cutoffs: Dict[str, float] = None,
+) -> None:
+    """Write genomes, scores, generation count, random and termination states to a checkpoint file.
+
+    Probability cutoffs escalated by restarts are saved too, None stands for
+    the defaults of the organism.
+    """
+    state = {
+        "generation": generation_count,
+        "target_chromosome": target_chromosome,
+        "random_state": checkpoint.random_state(rng),
+        "termination": termination.state(),
+        "prob_cutoffs": prob_cutoffs,
+    }
+    checkpoint.save(path, state, genomes=genomes, scores=np.asarray(scores, dtype=float))
+
+
+def _load_checkpoint(path: str) -> Tuple[dict, np.ndarray, np.ndarray]:
+    """Read state, genomes and scores from a checkpoint file."""
+    state, arrays = checkpoint.load(path)
+    return state, arrays["genomes"], arrays["scores"]
@@ -0,0 +1,103 @@
+"""Fitness functions for populations of organisms.
+
+A batch fitness function maps a 2-D array of genomes, one row of gene indices
+per individual, to a 1-D array with one fitness score per row. Populations
+call it once per generation for all individuals which need scoring, so the
+per-individual call overhead is paid only by per-individual fitness functions,
+which are wrapped by ``PerIndividual``. Expensive fitness functions can be
+spread across the workers of a thread or process pool with ``PerIndividual``
+or ``Chunked``.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Executor
+from typing import Callable, Protocol
+
+import numpy as np
+
+
+class BatchFitness(Protocol):
+    """Map an (N, L) array of genomes to an array of N fitness scores."""
+
+    def __call__(self, genomes: np.ndarray) -> np.ndarray:
+        ...
+
+
+class TargetMatch:
+    """Fraction of genes matching a target genome."""
+
+    def __init__(self, target: np.ndarray) -> None:
+        self.target = np.asarray(target)
+
+    def __call__(self, genomes: np.ndarray) -> np.ndarray:
+        return (genomes == self.target).mean(axis=1)
+
+
+class PerIndividual:
+    """Batch fitness function calling a fitness function per chromosome.
+
+    Parameters
+    ----------
+    func : callable
+        Fitness function mapping a chromosome to its fitness score. It must
+        be picklable if ``executor`` is a process pool.
+    decode : callable
+        Decode a genome into the chromosome passed to ``func``.
+    executor : concurrent.futures.Executor, optional
+        Pool to evaluate ``func`` in, by default it is called sequentially.
+    chunksize : int, optional
+        Number of chromosomes sent to a process pool worker at once.
+    """
+
+    def __init__(
+        self,
+        func: Callable[[str], float],
+        decode: Callable[[np.ndarray], str],
+        executor: Executor = None,
+        chunksize: int = 1,
+    ) -> None:
+        if chunksize < 1:
+            raise ValueError("Chunk size must be positive.")
+        self.func = func
+        self.decode = decode
+        self.executor = executor
+        self.chunksize = chunksize
+
+    def __call__(self, genomes: np.ndarray) -> np.ndarray:
+        chromosomes = [self.decode(genome) for genome in genomes]
+        if self.executor is None:
+            scores = map(self.func, chromosomes)
+        else:
+            scores = self.executor.map(self.func, chromosomes, chunksize=self.chunksize)
+        return np.fromiter(scores, dtype=float, count=len(chromosomes))
+
+
+class Chunked:
+    """Batch fitness function evaluated on chunks of genomes in a pool.
+
+    Worthwhile for batch fitness functions which release the GIL (with a
+    thread pool) or are expensive enough to amortize sending genomes to
+    other processes (with a process pool).
+
+    Parameters
+    ----------
+    func : BatchFitness
+        Batch fitness function evaluated per chunk. It must be picklable if
+        ``executor`` is a process pool.
+    executor : concurrent.futures.Executor
+        Pool the chunks are evaluated in.
+    n_chunks : int, optional
+        Number of chunks the genomes are split into, by default 4.
+    """
+
+    def __init__(self, func: BatchFitness, executor: Executor, n_chunks: int = 4) -> None:
+        if n_chunks < 1:
+            raise ValueError("Number of chunks must be positive.")
+        self.func = func
+        self.executor = executor
+        self.n_chunks = n_chunks
+
+    def __call__(self, genomes: np.ndarray) -> np.ndarray:
+        chunks = np.array_split(genomes, min(self.n_chunks, max(len(genomes), 1)))
+        return np.concatenate(list(self.executor.map(self.func, chunks)))
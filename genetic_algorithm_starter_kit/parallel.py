@@ -0,0 +1,157 @@
+"""Multiprocess fitness evaluation on shared memory.
+
+Sending a generation to a process pool pickles every genome to the workers
+and every score back, which easily costs more than scoring itself. A
+``SharedMemoryFitness`` instead keeps the genomes and the fitness scores of a
+generation in ``multiprocessing.shared_memory`` blocks which the workers map
+once. Each generation, the genomes are copied into their block, every worker
+scores a disjoint slice of rows in place and writes the scores into theirs,
+and only the slice bounds and a completion message per worker cross process
+boundaries. Blocks are reused across generations and only grow.
+
+Batches smaller than ``min_batch_size`` and evaluators with a single worker
+score in-process. Since each row is scored independently, the scores do not
+depend on the number of workers, so the fallback is exactly deterministic.
+
+Usage::
+
+    with SharedMemoryFitness(fitness, workers=8) as parallel_fitness:
+        population = VectorizedPopulation(10_000, fitness=parallel_fitness)
+        population.evolve()
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from .fitness import BatchFitness
+
+
+class _Buffer(NamedTuple):
+    """Array of given shape and dtype at the start of a named shared memory block."""
+
+    name: str
+    shape: Tuple[int, ...]
+    dtype: str
+
+
+# state of a worker process, set by its initializer
+_worker_func: Optional[BatchFitness] = None
+_worker_blocks: Dict[str, shared_memory.SharedMemory] = {}
+
+
+def _init_worker(func: BatchFitness) -> None:
+    global _worker_func
+    _worker_func = func
+
+
+def _worker_array(buffer: _Buffer) -> np.ndarray:
+    """Map buffer into the worker, attaching to its block on first use."""
+    if buffer.name not in _worker_blocks:
+        _worker_blocks[buffer.name] = shared_memory.SharedMemory(name=buffer.name)
+    return np.ndarray(buffer.shape, dtype=buffer.dtype, buffer=_worker_blocks[buffer.name].buf)
+
+
+def _evaluate_slice(genomes: _Buffer, scores: _Buffer, start: int, stop: int) -> None:
+    """Score rows start to stop of the genomes into the scores, in a worker."""
+    # detach from blocks replaced by larger ones
+    for name in set(_worker_blocks).difference((genomes.name, scores.name)):
+        _worker_blocks.pop(name).close()
+    _worker_array(scores)[start:stop] = _worker_func(_worker_array(genomes)[start:stop])
+
+
+class SharedMemoryFitness:
+    """Batch fitness function evaluated by worker processes on shared memory.
+
+    Parameters
+    ----------
+    func : BatchFitness
+        Batch fitness function scoring each row of genomes independently. It
+        is pickled once per worker, so it must be picklable, e.g. a module
+        level function or an instance of ``fitness.TargetMatch``.
+    workers : int, optional
+        Number of worker processes, by default the number of CPUs. A single
+        worker scores in-process.
+    min_batch_size : int, optional
+        Smallest batch scored by the workers, smaller batches are scored
+        in-process. Default is 256.
+    score_shape : Tuple[int, ...], optional
+        Shape of the scores of a genome, e.g. ``(3,)`` for several fitness
+        components. Default is a single score.
+    """
+
+    def __init__(
+        self,
+        func: BatchFitness,
+        workers: int = None,
+        min_batch_size: int = 256,
+        score_shape: Tuple[int, ...] = (),
+    ) -> None:
+        if workers is not None and workers < 1:
+            raise ValueError("Number of workers must be positive.")
+        self.func = func
+        self.workers = workers or os.cpu_count() or 1
+        self.min_batch_size = max(min_batch_size, 1)
+        self.score_shape = tuple(score_shape)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._blocks: Dict[str, shared_memory.SharedMemory] = {}
+
+    @property
+    def parallel(self) -> bool:
+        """Whether large batches are scored by worker processes."""
+        return self.workers > 1
+
+    def __call__(self, genomes: np.ndarray) -> np.ndarray:
+        genomes = np.asarray(genomes)
+        if not self.parallel or len(genomes) < self.min_batch_size:
+            return np.asarray(self.func(genomes), dtype=float)
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self.workers, initializer=_init_worker, initargs=(self.func,))
+        genome_buffer, shared_genomes = self._array("genomes", genomes.shape, genomes.dtype)
+        score_buffer, shared_scores = self._array("scores", (len(genomes), *self.score_shape), np.dtype(float))
+        np.copyto(shared_genomes, genomes)
+        bounds = np.linspace(0, len(genomes), self.workers + 1).astype(int).tolist()
+        futures = [
+            self._executor.submit(_evaluate_slice, genome_buffer, score_buffer, start, stop)
+            for start, stop in zip(bounds[:-1], bounds[1:])
+            if start < stop
+        ]
+        # generation barrier, re-raises errors of the workers
+        for future in futures:
+            future.result()
+        return shared_scores.copy()
+
+    def _array(self, role: str, shape: Tuple[int, ...], dtype: np.dtype) -> Tuple[_Buffer, np.ndarray]:
+        """Shared array of given role, replacing its block by a twice as large one if too small."""
+        size = max(int(np.prod(shape)) * np.dtype(dtype).itemsize, 1)
+        block = self._blocks.get(role)
+        if block is None or block.size < size:
+            if block is not None:
+                _release(block)
+            block = self._blocks[role] = shared_memory.SharedMemory(create=True, size=2 * size)
+        return _Buffer(block.name, tuple(shape), np.dtype(dtype).str), np.ndarray(shape, dtype, buffer=block.buf)
+
+    def close(self) -> None:
+        """Stop the workers and free the shared memory."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        for block in self._blocks.values():
+            _release(block)
+        self._blocks.clear()
+
+    def __enter__(self) -> SharedMemoryFitness:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _release(block: shared_memory.SharedMemory) -> None:
+    block.close()
+    block.unlink()
@@ -0,0 +1,216 @@
+"""Optional profiling of the phases of evolution loops.
+
+Evolution loops time their phases, i.e. creating individuals ("init"),
+fitness scoring ("score"), parent selection ("select"), crossover and
+mutation ("reproduce"), reporting ("report") and checkpointing
+("checkpoint"), in ``profiler.phase`` contexts, mark the start of each
+generation with ``profiler.mark_generation`` and the end of the loop with
+``profiler.finish``. By default loops use the ``NULL_PROFILER``, whose
+contexts do nothing.
+
+A ``Profiler`` accumulates wall time and call counts per phase and the wall
+time of each generation. Entered as a context manager, it may also trace the
+memory allocated per generation with ``tracemalloc`` and run ``cProfile``::
+
+    with Profiler(trace_allocations=True, cprofile=True, trace_events=True) as profiler:
+        population.evolve(profiler=profiler)
+    print(profiler.report().format())
+    profiler.dump_stats("evolve.pstats")
+    profiler.dump_trace("evolve.json")  # open in chrome://tracing or Perfetto
+
+Tracing allocations and cProfile slow down the loop considerably, timing
+phases only costs a few clock reads per generation. Tracing phase events
+keeps a record per phase call in memory for the whole run.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import cProfile
+import json
+import os
+import time
+import tracemalloc
+from typing import ContextManager, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+
+class ProfileReport(NamedTuple):
+    """Cost per phase and per generation of profiled evolutions."""
+
+    # records with fields phase, calls, seconds and mean (seconds per call)
+    phases: np.ndarray
+    # records with fields generation, seconds, allocated (net bytes) and peak (bytes above the start)
+    generations: np.ndarray
+
+    def format(self) -> str:
+        """Table of the phases, most expensive first, and a summary of the generations."""
+        total = self.phases["seconds"].sum()
+        lines = [f"{'PHASE':<12}{'CALLS':>10}{'SECONDS':>12}{'MEAN (ms)':>12}{'SHARE':>8}"]
+        for phase, calls, seconds, mean in self.phases[np.argsort(-self.phases["seconds"], kind="stable")]:
+            share = seconds / total if total else 0.0
+            lines.append(f"{phase:<12}{calls:>10}{seconds:>12.4f}{1000 * mean:>12.4f}{share:>8.1%}")
+        if len(self.generations):
+            lines.append(
+                f"{len(self.generations)} generations, "
+                f"{self.generations['seconds'].mean() * 1000:.4f} ms and "
+                f"{self.generations['allocated'].mean():.0f} bytes allocated per generation on average"
+            )
+        return "\n".join(lines)
+
+
+class NullProfiler:
+    """Profiler which records nothing, the default of evolution loops."""
+
+    def phase(self, name: str) -> ContextManager:
+        """Context timing a phase of the loop."""
+        return _NULL_PHASE
+
+    def mark_generation(self, generation: int) -> None:
+        """Mark the start of a generation, which ends the previous one."""
+
+    def finish(self) -> None:
+        """Mark the end of the loop, which ends its last generation."""
+
+
+_NULL_PHASE = contextlib.nullcontext()
+NULL_PROFILER = NullProfiler()
+
+
+class _Phase:
+    """Reusable context accumulating the calls and wall time of a phase."""
+
+    __slots__ = ("name", "calls", "nanoseconds", "_start", "_events")
+
+    def __init__(self, name: str, events: Optional[List[Tuple[str, int, int]]]) -> None:
+        self.name = name
+        self.calls = 0
+        self.nanoseconds = 0
+        self._start = 0
+        self._events = events
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter_ns()
+
+    def __exit__(self, *exc_info) -> None:
+        stop = time.perf_counter_ns()
+        self.calls += 1
+        self.nanoseconds += stop - self._start
+        if self._events is not None:
+            self._events.append((self.name, self._start, stop - self._start))
+
+
+class Profiler(NullProfiler):
+    """Record wall time and calls per phase and the cost of each generation.
+
+    Parameters
+    ----------
+    trace_allocations : bool, optional
+        Trace memory allocated per generation with ``tracemalloc`` while the
+        profiler is entered as a context manager. Default is False.
+    cprofile : bool, optional
+        Run ``cProfile`` while the profiler is entered, see ``dump_stats``.
+        Default is False.
+    trace_events : bool, optional
+        Keep an event per phase call for ``dump_trace``. Events accumulate
+        for the whole run, so this is meant for short runs. Default is False.
+    """
+
+    generation_dtype = np.dtype([("generation", np.int64), ("seconds", np.float64), ("allocated", np.int64),
+                                 ("peak", np.int64)])
+    phase_dtype = np.dtype([("phase", "U16"), ("calls", np.int64), ("seconds", np.float64),
+                            ("mean", np.float64)])
+
+    def __init__(self, trace_allocations: bool = False, cprofile: bool = False, trace_events: bool = False) -> None:
+        self.trace_allocations = trace_allocations
+        self._events: Optional[List[Tuple[str, int, int]]] = [] if trace_events else None
+        self._phases: Dict[str, _Phase] = {}
+        # generation, start time, duration, allocated and peak memory
+        self._generations: List[Tuple[int, int, int, int, int]] = []
+        # generation, start time and traced memory at the start of the current generation
+        self._current: Optional[Tuple[int, int, int]] = None
+        self._origin = time.perf_counter_ns()
+        self._cprofile = cProfile.Profile() if cprofile else None
+        self._started_tracemalloc = False
+
+    def phase(self, name: str) -> _Phase:
+        phase = self._phases.get(name)
+        if phase is None:
+            phase = self._phases[name] = _Phase(name, self._events)
+        return phase
+
+    def mark_generation(self, generation: int) -> None:
+        now = time.perf_counter_ns()
+        memory = self._close_generation(now)
+        self._current = (generation, now, memory)
+
+    def finish(self) -> None:
+        self._close_generation(time.perf_counter_ns())
+
+    def _close_generation(self, now: int) -> int:
+        """Record the current generation if there is one, return the traced memory."""
+        memory, peak = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+        if self._current is not None:
+            generation, start, start_memory = self._current
+            self._generations.append(
+                (generation, start, now - start, memory - start_memory, max(peak - start_memory, 0))
+            )
+            self._current = None
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        return memory
+
+    def __enter__(self) -> Profiler:
+        if self.trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        if self._cprofile is not None:
+            self._cprofile.enable()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        self.finish()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def report(self) -> ProfileReport:
+        """Cost per phase and per generation recorded so far."""
+        phases = np.array(
+            [(phase.name, phase.calls, phase.nanoseconds / 1e9, phase.nanoseconds / 1e9 / max(phase.calls, 1))
+             for phase in self._phases.values()],
+            dtype=self.phase_dtype,
+        )
+        generations = np.array(
+            [(generation, duration / 1e9, allocated, peak)
+             for generation, _, duration, allocated, peak in self._generations],
+            dtype=self.generation_dtype,
+        )
+        return ProfileReport(phases, generations)
+
+    def dump_stats(self, path: str) -> None:
+        """Write the statistics of ``cProfile`` to a file readable by ``pstats``."""
+        if self._cprofile is None:
+            raise ValueError("Profiler was created without cprofile.")
+        self._cprofile.dump_stats(path)
+
+    def dump_trace(self, path: str) -> None:
+        """Write phase calls and generations as Chrome trace events in JSON."""
+        if self._events is None:
+            raise ValueError("Profiler was created without trace_events.")
+        pid = os.getpid()
+        events = [
+            {"name": f"generation {generation}", "cat": "generation", "ph": "X", "pid": pid, "tid": 0,
+             "ts": (start - self._origin) / 1000, "dur": duration / 1000}
+            for generation, start, duration, *_ in self._generations
+        ]
+        events.extend(
+            {"name": name, "cat": "phase", "ph": "X", "pid": pid, "tid": 0,
+             "ts": (start - self._origin) / 1000, "dur": duration / 1000}
+            for name, start, duration in self._events
+        )
+        with open(path, "w") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
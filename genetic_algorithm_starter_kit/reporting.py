@@ -0,0 +1,172 @@
+"""Observers reporting the progress of evolutions.
+
+Evolution loops notify a sequence of reporters once per generation with a
+``GenerationEvent`` and once at the end with the ``EvolutionResult``.
+Statistics of an event, i.e. the best and mean fitness score and the
+diversity of the population, are computed from the scores the loop already
+has, and only when a reporter asks for them. Likewise, the progress line of
+the fittest individual is only formatted when printed. Evolving with an empty
+sequence of reporters is silent and skips events altogether.
+"""
+
+import sys
+import time
+from typing import Any, Callable, List, NamedTuple, Optional, TextIO
+
+import numpy as np
+
+from .termination import EvolutionResult
+
+
+class GenerationEvent(NamedTuple):
+    generation: int
+    scores: np.ndarray
+    fittest: int
+    # formats the progress line of the generation
+    format: Callable[[], str]
+
+    @property
+    def best(self) -> float:
+        """Fitness score of the fittest individual."""
+        return float(self.scores[self.fittest])
+
+    @property
+    def mean(self) -> float:
+        """Mean fitness score of the population."""
+        return float(self.scores.mean())
+
+    @property
+    def diversity(self) -> float:
+        """Standard deviation of the fitness scores of the population."""
+        return float(self.scores.std())
+
+
+class Reporter:
+    """Base class of reporters, which ignores all events."""
+
+    def on_generation(self, event: GenerationEvent) -> None:
+        """Called after scoring each generation."""
+
+    def on_finish(self, result: EvolutionResult) -> None:
+        """Called once the evolution stopped."""
+
+
+class PrintReporter(Reporter):
+    """Print progress lines, throttled by generation interval and time.
+
+    Parameters
+    ----------
+    end : str, optional
+        End of each line, e.g. "\\r" to overwrite the previous line. Default
+        is a newline.
+    interval : int, optional
+        Number of generations between printed lines. Default is 1.
+    min_seconds : float, optional
+        Minimum wall-clock seconds between printed lines. Default is 0.
+    format_best : Callable, optional
+        Formats the fittest individual of the result printed at the end, by
+        default it is not printed.
+    stream : TextIO, optional
+        Stream to print to, by default stdout.
+
+    The line of the last generation is always printed.
+    """
+
+    def __init__(
+        self,
+        end: str = "\n",
+        interval: int = 1,
+        min_seconds: float = 0.0,
+        format_best: Callable[[Any], str] = None,
+        stream: TextIO = None,
+    ) -> None:
+        if interval < 1:
+            raise ValueError("Interval must be at least one generation.")
+        self.end = end
+        self.interval = interval
+        self.min_seconds = min_seconds
+        self.format_best = format_best
+        self.stream = stream
+        self._next_generation = None
+        self._next_time = float("-inf")
+        self._pending = None
+
+    def on_generation(self, event: GenerationEvent) -> None:
+        if self._next_generation is not None and event.generation < self._next_generation:
+            self._pending = event
+            return
+        now = time.perf_counter()
+        if now < self._next_time:
+            self._pending = event
+            return
+        self._print(event)
+        self._next_generation = event.generation + self.interval
+        self._next_time = now + self.min_seconds
+
+    def on_finish(self, result: EvolutionResult) -> None:
+        if self._pending is not None:
+            self._print(self._pending)
+        if self.format_best is not None:
+            print("\n\nFittest Individual:", file=self._stream)
+            print(self.format_best(result.best), file=self._stream)
+        print("\nDone.", file=self._stream)
+        self._next_generation, self._next_time = None, float("-inf")
+
+    @property
+    def _stream(self) -> TextIO:
+        # resolved on use, so redirecting stdout after construction works
+        return self.stream or sys.stdout
+
+    def _print(self, event: GenerationEvent) -> None:
+        print(event.format(), end=self.end, file=self._stream)
+        self._pending = None
+
+
+class HistoryCollector(Reporter):
+    """Collect statistics of generations into a compact structured array.
+
+    Parameters
+    ----------
+    interval : int, optional
+        Number of generations between records. Default is 1.
+    capacity : int, optional
+        Initial number of records, doubled when exhausted. Default is 1024.
+    """
+
+    dtype = np.dtype([("generation", np.int64), ("best", np.float32), ("mean", np.float32),
+                      ("diversity", np.float32)])
+
+    def __init__(self, interval: int = 1, capacity: int = 1024) -> None:
+        if interval < 1 or capacity < 1:
+            raise ValueError("Interval and capacity must be at least one.")
+        self.interval = interval
+        self._records = np.empty(capacity, dtype=self.dtype)
+        self._size = 0
+        self.result: Optional[EvolutionResult] = None
+
+    def on_generation(self, event: GenerationEvent) -> None:
+        if event.generation % self.interval:
+            return
+        if self._size == len(self._records):
+            self._records = np.resize(self._records, 2 * len(self._records))
+        self._records[self._size] = (event.generation, event.best, event.mean, event.diversity)
+        self._size += 1
+
+    def on_finish(self, result: EvolutionResult) -> None:
+        self.result = result
+
+    @property
+    def history(self) -> np.ndarray:
+        """Records of generations with fields generation, best, mean and diversity."""
+        return self._records[:self._size]
+
+    def __len__(self) -> int:
+        return self._size
+
+
+def default_reporters(verbose: bool, format_best: Callable[[Any], str] = None) -> List[Reporter]:
+    """Reporters used unless others are given: printing lines at most every 0.1 seconds.
+
+    Lines end with a newline if ``verbose``, else they overwrite each other.
+    """
+    return [PrintReporter(end="\n" if verbose else "\r", min_seconds=0.1, format_best=format_best)]
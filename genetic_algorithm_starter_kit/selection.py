@@ -0,0 +1,82 @@
+"""Selection strategies for genetic algorithms.
+
+Strategies draw parents in bulk from an array of fitness scores and return
+their indices, so that a whole generation of parents is selected at once.
+Elites are extracted with a partial selection instead of sorting the entire
+population.
+"""
+
+from typing import Callable
+
+import numpy as np
+
+
+def elite_indices(scores: np.ndarray, n: int) -> np.ndarray:
+    """Indices of the n fittest individuals by decreasing order of fitness score."""
+    if n <= 0:
+        return np.empty(0, dtype=np.intp)
+    if n < len(scores):
+        candidates = np.argpartition(-scores, n - 1)[:n]
+    else:
+        candidates = np.arange(len(scores))
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+def worst_indices(scores: np.ndarray, n: int) -> np.ndarray:
+    """Indices of the n least fit individuals in arbitrary order."""
+    if n <= 0:
+        return np.empty(0, dtype=np.intp)
+    if n >= len(scores):
+        return np.arange(len(scores))
+    return np.argpartition(scores, n - 1)[:n]
+
+
+def check_steady_state(steady_state: int, size: int) -> None:
+    """Raise if steady-state children, replacing the worst individuals, do not fit into a population of given size."""
+    if steady_state is not None and not 0 < steady_state < size:
+        raise ValueError(f"Steady-state children must be between 1 and {size - 1}, got {steady_state}.")
+
+
+def truncation(scores: np.ndarray, n: int, rng: np.random.Generator, fraction: float = 0.5) -> np.ndarray:
+    """Draw n parents uniformly from the fittest fraction of the population."""
+    candidates = elite_indices(scores, max(int(fraction * len(scores)), 1))
+    return candidates[rng.integers(0, len(candidates), n)]
+
+
+def tournament(scores: np.ndarray, n: int, rng: np.random.Generator, size: int = 2) -> np.ndarray:
+    """Draw n parents, each the fittest of `size` randomly chosen individuals."""
+    contestants = rng.integers(0, len(scores), (n, size))
+    winners = np.argmax(scores[contestants], axis=1)
+    return contestants[np.arange(n), winners]
+
+
+def roulette(scores: np.ndarray, n: int, rng: np.random.Generator) -> np.ndarray:
+    """Draw n parents with probability proportional to fitness score.
+
+    Uses stochastic universal sampling, i.e. n evenly spaced pointers with a
+    single random offset, which has minimal spread around the expected
+    number of offspring of each individual.
+    """
+    weights = np.clip(scores, 0, None).cumsum()
+    if weights[-1] <= 0:
+        return rng.integers(0, len(scores), n)
+    step = weights[-1] / n
+    pointers = rng.uniform(0, step) + step * np.arange(n)
+    parents = np.minimum(np.searchsorted(weights, pointers, side="right"), len(scores) - 1)
+    # pointers are ordered, shuffle to pair parents randomly
+    return rng.permutation(parents)
+
+
+STRATEGIES = {
+    "truncation": truncation,
+    "tournament": tournament,
+    "roulette": roulette,
+}
+
+
+def get_strategy(name: str) -> Callable[[np.ndarray, int, np.random.Generator], np.ndarray]:
+    """Selection strategy of given name."""
+    try:
+        return STRATEGIES[name]
+    except KeyError:
+        raise ValueError(f"Unknown selection strategy: {name}") from None
@@ -0,0 +1,172 @@
+"""Termination criteria and restart policies of evolutions.
+
+An evolution stops as soon as any criterion of its ``Termination`` is met:
+the fittest individual reaches a target fitness, a maximum number of
+generations or a wall-clock time budget is exhausted, or the best fitness
+has not improved for a number of generations (stagnation). On stagnation an
+optional ``Restart`` policy first tries to escape a local optimum by
+reseeding the least fit part of the population and escalating the mutation
+rate. The outcome of a run is summarized by an ``EvolutionResult``.
+"""
+
+import time
+from typing import Any, Dict, NamedTuple, Optional
+
+TARGET_FITNESS = "target_fitness"
+MAX_GENERATIONS = "max_generations"
+TIME_BUDGET = "time_budget"
+STAGNATION = "stagnation"
+# not a stop reason, the population needs to be restarted
+RESTART = "restart"
+
+
+class EvolutionResult(NamedTuple):
+    best: Any
+    best_fitness: float
+    generations: int
+    stop_reason: str
+    elapsed: float
+    restarts: int = 0
+
+    @property
+    def solved(self) -> bool:
+        """Whether the evolution stopped because it reached the target fitness."""
+        return self.stop_reason == TARGET_FITNESS
+
+
+class Restart:
+    """Policy to restart a stagnating population.
+
+    Parameters
+    ----------
+    reseed_fraction : float, optional
+        Fraction of the population, the least fit, replaced by random
+        individuals. Default is 0.5.
+    mutation_factor : float, optional
+        Factor the mutation rate is multiplied with per restart. Default is 2.
+    max_mutation_rate : float, optional
+        Upper bound of the escalated mutation rate. Default is 0.5.
+    max_restarts : int, optional
+        Number of restarts after which stagnation stops the evolution, by
+        default unlimited.
+    """
+
+    def __init__(
+        self,
+        reseed_fraction: float = 0.5,
+        mutation_factor: float = 2.0,
+        max_mutation_rate: float = 0.5,
+        max_restarts: int = None,
+    ) -> None:
+        if not 0 <= reseed_fraction <= 1:
+            raise ValueError("Reseed fraction must be between 0 and 1.")
+        if mutation_factor < 1 or not 0 <= max_mutation_rate <= 1:
+            raise ValueError("Mutation rate can only be escalated up to a rate of at most 1.")
+        self.reseed_fraction = reseed_fraction
+        self.mutation_factor = mutation_factor
+        self.max_mutation_rate = max_mutation_rate
+        self.max_restarts = max_restarts
+
+    def n_reseeded(self, population_size: int) -> int:
+        """Number of least fit individuals to replace by random ones."""
+        return int(self.reseed_fraction * population_size)
+
+    def escalate(self, prob_cutoffs: Dict[str, float]) -> Dict[str, float]:
+        """Reproduction probability cutoffs with escalated mutation rate.
+
+        Genes not mutated are still inherited from self and mate in the same
+        proportion.
+        """
+        mutation_rate = max(1 - prob_cutoffs["mate"], 0.0)
+        mutation_rate = max(min(mutation_rate * self.mutation_factor, self.max_mutation_rate), mutation_rate)
+        share_self = prob_cutoffs["self"] / prob_cutoffs["mate"] if prob_cutoffs["mate"] else 0.5
+        return {"self": share_self * (1 - mutation_rate), "mate": 1 - mutation_rate}
+
+
+class Termination:
+    """Stop conditions of an evolution, checked once per generation.
+
+    Parameters
+    ----------
+    target_fitness : float, optional
+        Fitness score of the fittest individual to stop at. Default is 1.
+    max_generations : int, optional
+        Generation to stop at, by default unlimited.
+    time_budget : float, optional
+        Wall-clock seconds to stop after, by default unlimited.
+    stagnation_window : int, optional
+        Number of generations without improvement of the best fitness score
+        to stop or restart after, by default unlimited.
+    restart : Restart, optional
+        Policy applied on stagnation before stopping, by default none.
+    """
+
+    def __init__(
+        self,
+        target_fitness: float = 1.0,
+        max_generations: int = None,
+        time_budget: float = None,
+        stagnation_window: int = None,
+        restart: Restart = None,
+    ) -> None:
+        if restart is not None and stagnation_window is None:
+            raise ValueError("Restarts require a stagnation window.")
+        self.target_fitness = target_fitness
+        self.max_generations = max_generations
+        self.time_budget = time_budget
+        self.stagnation_window = stagnation_window
+        self.restart = restart
+        self.start()
+
+    def start(self) -> None:
+        """Start timer and reset the stagnation and restart counters."""
+        self._start_time = time.perf_counter()
+        self._best_fitness = float("-inf")
+        self._last_improvement = None
+        self.restarts = 0
+
+    def state(self) -> Dict[str, Any]:
+        """JSON serializable progress of the run, e.g. for checkpoints."""
+        return {
+            "elapsed": self.elapsed,
+            "best_fitness": None if self._last_improvement is None else self._best_fitness,
+            "last_improvement": self._last_improvement,
+            "restarts": self.restarts,
+        }
+
+    def restore(self, state: Dict[str, Any]) -> None:
+        """Continue the progress of a run saved by ``state``, e.g. after ``start``."""
+        self._start_time = time.perf_counter() - state["elapsed"]
+        self._best_fitness = float("-inf") if state["best_fitness"] is None else state["best_fitness"]
+        self._last_improvement = state["last_improvement"]
+        self.restarts = state["restarts"]
+
+    @property
+    def elapsed(self) -> float:
+        """Wall-clock seconds since start."""
+        return time.perf_counter() - self._start_time
+
+    def check(self, generation_count: int, best_fitness: float) -> Optional[str]:
+        """Reason to stop after a generation, ``RESTART`` or None to continue."""
+        if best_fitness >= self.target_fitness:
+            return TARGET_FITNESS
+        if best_fitness > self._best_fitness or self._last_improvement is None:
+            self._best_fitness = max(best_fitness, self._best_fitness)
+            self._last_improvement = generation_count
+        if self.max_generations is not None and generation_count >= self.max_generations:
+            return MAX_GENERATIONS
+        if self.time_budget is not None and self.elapsed >= self.time_budget:
+            return TIME_BUDGET
+        if self.stagnation_window is not None and generation_count - self._last_improvement >= self.stagnation_window:
+            if self.restart is None or (
+                self.restart.max_restarts is not None and self.restarts >= self.restart.max_restarts
+            ):
+                return STAGNATION
+            self.restarts += 1
+            self._last_improvement = generation_count
+            return RESTART
+        return None
+
+    def result(self, best: Any, best_fitness: float, generation_count: int, stop_reason: str) -> EvolutionResult:
+        """Result of an evolution stopped for given reason."""
+        return EvolutionResult(best, best_fitness, generation_count, stop_reason, self.elapsed, self.restarts)
@@ -0,0 +1,212 @@
+"""A module for solving large files of sudokus in bulk.
+
+Puzzles are streamed from text files with one sudoku of 81 characters per
+line (see ``sudoku_solver.utils.parse``), optionally gzip-compressed, and are
+fanned out in chunks across a pool of worker processes. Solutions are
+written in input order as soon as they are available while only a bounded
+number of chunks is held in memory.
+
+Usage::
+
+    python -m sudoku_solver.batch puzzles.txt.gz solutions.txt --workers 8
+"""
+
+import argparse
+import gzip
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import IO, Iterable, Iterator, List
+
+import numpy as np
+
+from genetic_algorithm_starter_kit.termination import Termination
+
+from .sudoku import Sudoku
+from .utils import parse
+
+ENGINES = ("propagation", "backtracking", "evolve")
+
+
+def _open(path: str, mode: str) -> IO[str]:
+    """Open text file, transparently (de)compressing files ending in '.gz'."""
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t")
+    return open(path, mode)
+
+
+def read_puzzles(path: str) -> Iterator[str]:
+    """Stream puzzle lines from file, skipping blank lines and '#' comments."""
+    with _open(path, "r") as file:
+        for line in file:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                yield line
+
+
+def _solve_line(
+    line: str,
+    engine: str,
+    population_size: int,
+    rng: np.random.Generator = None,
+    termination: Termination = None,
+) -> str:
+    """Solve a single puzzle line with the given engine, return it unchanged if unsolved."""
+    try:
+        board = parse.parse_board(line)
+    except ValueError:
+        # a malformed line must not abort the whole run
+        return line
+    sudoku = Sudoku(board)
+    if engine == "evolve":
+        # evolve silently, progress reports would interleave in the workers' output
+        result = sudoku.evolve(population_size, seed=rng, termination=termination, reporters=())
+        if result.best_fitness < 1.0:
+            return line
+    elif not sudoku.solve(method=engine):
+        return line
+    return parse.format_board(sudoku.board)
+
+
+def solve_chunk(
+    lines: List[str],
+    engine: str,
+    population_size: int,
+    seed: np.random.SeedSequence = None,
+    termination: Termination = None,
+) -> List[str]:
+    """Solve a chunk of puzzle lines in the calling process, e.g. in a worker of a pool.
+
+    Random numbers are drawn from a stream seeded per chunk. Lines are
+    returned unchanged if unsolved, like in ``solve_puzzles``.
+
+    Parameters
+    ----------
+    lines : List[str]
+        Puzzles as lines of 81 characters.
+    engine : str
+        One of "propagation", "backtracking" or "evolve".
+    population_size : int
+        Population size of the genetic algorithm for engine "evolve".
+    seed : np.random.SeedSequence, optional
+        Seed of the random number generator of the chunk.
+    termination : Termination, optional
+        Stop conditions of engine "evolve" per puzzle.
+    """
+    rng = np.random.default_rng(seed)
+    return [_solve_line(line, engine, population_size, rng, termination) for line in lines]
+
+
+def _chunks(iterable: Iterable[str], chunk_size: int) -> Iterator[List[str]]:
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def solve_puzzles(
+    puzzles: Iterable[str],
+    engine: str = "propagation",
+    workers: int = None,
+    chunk_size: int = 1000,
+    max_pending: int = None,
+    population_size: int = 1000,
+    seed: int = None,
+    termination: Termination = None,
+) -> Iterator[str]:
+    """Solve stream of puzzle lines and yield solution lines in input order.
+
+    Malformed puzzles, puzzles without a solution, or for engine "evolve"
+    without a solution found before the evolution stops, are yielded
+    unchanged.
+
+    Parameters
+    ----------
+    puzzles : Iterable[str]
+        Puzzles as lines of 81 characters.
+    engine : str, optional
+        One of "propagation", "backtracking" or "evolve". Default is
+        "propagation".
+    workers : int, optional
+        Number of worker processes. Default is the number of CPUs. A single
+        worker solves all puzzles in the calling process.
+    chunk_size : int, optional
+        Number of puzzles sent to a worker at once. Default is 1000.
+    max_pending : int, optional
+        Maximum number of chunks in flight, which bounds memory. Default is
+        twice the number of workers.
+    population_size : int, optional
+        Population size of the genetic algorithm for engine "evolve".
+        Default is 1000.
+    seed : int, optional
+        Seed from which a random number generator per chunk is spawned, so
+        that results of engine "evolve" do not depend on the workers.
+    termination : Termination, optional
+        Stop conditions of engine "evolve" per puzzle, e.g. a time budget,
+        by default it runs until a solution is found.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine: {engine}")
+    workers = workers or os.cpu_count() or 1
+    chunks = _chunks(puzzles, chunk_size)
+    seed_sequence = np.random.SeedSequence(seed)
+    if workers == 1:
+        for chunk in chunks:
+            yield from solve_chunk(chunk, engine, population_size, seed_sequence.spawn(1)[0], termination)
+        return
+
+    max_pending = max_pending or 2 * workers
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(
+                executor.submit(
+                    solve_chunk, chunk, engine, population_size, seed_sequence.spawn(1)[0], termination
+                )
+            )
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def solve_file(input_path: str, output_path: str, **kwargs) -> int:
+    """Solve all puzzles of input file and write solutions to output file.
+
+    Files ending in '.gz' are (de)compressed with gzip. Keyword arguments are
+    passed on to ``solve_puzzles``. Returns the number of puzzles processed.
+    """
+    count = 0
+    with _open(output_path, "w") as file:
+        for count, solution in enumerate(solve_puzzles(read_puzzles(input_path), **kwargs), start=1):
+            file.write(solution + "\n")
+    return count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Solve a file of sudokus, one puzzle of 81 characters per line.")
+    parser.add_argument("input", help="input file, optionally gzip-compressed ('.gz')")
+    parser.add_argument("output", help="output file, optionally gzip-compressed ('.gz')")
+    parser.add_argument("--engine", choices=ENGINES, default="propagation")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--population-size", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--max-generations", type=int, default=None, help="generation limit of engine 'evolve'")
+    parser.add_argument("--time-budget", type=float, default=None, help="seconds per puzzle of engine 'evolve'")
+    args = parser.parse_args()
+    count = solve_file(
+        args.input,
+        args.output,
+        engine=args.engine,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        population_size=args.population_size,
+        seed=args.seed,
+        termination=Termination(max_generations=args.max_generations, time_budget=args.time_budget),
+    )
+    print(f"Processed {count} sudokus.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
-# Allowed symbols in sudoku
+# Allowed symbols in 9x9 sudokus, boards of other sizes use 1 to their size
+# (see sudoku_solver.utils.units.unit_table)
 allowed_symbols = set(range(1, 10))
 # Empty symbol encoding an empty cell
 empty_cell_symbol = 0
@@ -0,0 +1,217 @@
+"""An asyncio service solving sudokus in micro-batches.
+
+Requests are queued and collected into batches of up to ``max_batch_size``
+boards, waiting at most ``max_delay`` seconds for a batch to fill up. Batches
+are solved by a pool of worker processes, like the chunks of
+``sudoku_solver.batch``, so that solving never blocks the event loop. Each
+request may have a timeout and may be cancelled: requests still queued are
+dropped from their batch, the results of requests already dispatched are
+discarded.
+
+Usage::
+
+    async with SolverService(engine="propagation", workers=4) as service:
+        solutions = await service.solve_many(boards, timeout=1.0)
+"""
+
+import asyncio
+import copy
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Iterable, List, Optional, Set
+
+import numpy as np
+
+from genetic_algorithm_starter_kit.termination import Termination
+
+from . import batch
+from .etc import config
+from .sudoku import Sudoku
+from .utils import parse
+
+Board = List[List[int]]
+
+
+class SolverService:
+    """Solve sudokus concurrently submitted from coroutines in micro-batches.
+
+    Parameters
+    ----------
+    engine : str, optional
+        One of "propagation", "backtracking" or "evolve". Default is
+        "propagation".
+    workers : int, optional
+        Number of worker processes. Default is the number of CPUs.
+    max_batch_size : int, optional
+        Maximum number of boards solved by a worker at once. Default is 32.
+    max_delay : float, optional
+        Maximum seconds the first request of a batch waits for further
+        requests. Default is 0.002.
+    max_pending : int, optional
+        Maximum number of batches in flight. Default is twice the number of
+        workers.
+    population_size : int, optional
+        Population size of the genetic algorithm for engine "evolve".
+        Default is 1000.
+    seed : int, optional
+        Seed from which a random number generator per batch is spawned.
+    termination : Termination, optional
+        Stop conditions of engine "evolve" per board. A time budget bounds
+        the work of requests which time out after being dispatched.
+    executor : Executor, optional
+        Executor solving the batches instead of a process pool owned by the
+        service, e.g. a ``ThreadPoolExecutor`` for an in-process client.
+    """
+
+    def __init__(
+        self,
+        engine: str = "propagation",
+        workers: int = None,
+        max_batch_size: int = 32,
+        max_delay: float = 0.002,
+        max_pending: int = None,
+        population_size: int = 1000,
+        seed: int = None,
+        termination: Termination = None,
+        executor: Executor = None,
+    ) -> None:
+        if engine not in batch.ENGINES:
+            raise ValueError(f"Unknown engine: {engine}")
+        if max_batch_size < 1:
+            raise ValueError("Batches need to hold at least one board.")
+        self.engine = engine
+        self.workers = workers or os.cpu_count() or 1
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.max_pending = max_pending or 2 * self.workers
+        self.population_size = population_size
+        self.termination = termination
+        self._seed_sequence = np.random.SeedSequence(seed)
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._queue: Optional[asyncio.Queue] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._batches: Set[asyncio.Task] = set()
+
+    @property
+    def running(self) -> bool:
+        return self._dispatcher is not None
+
+    async def start(self) -> None:
+        """Start dispatching batches to the workers."""
+        if self.running:
+            return
+        if self._owns_executor:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        self._queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self.max_pending)
+        self._dispatcher = asyncio.create_task(self._dispatch())
+
+    async def close(self) -> None:
+        """Stop the service, finishing the batches in flight and cancelling queued requests."""
+        if not self.running:
+            return
+        self._dispatcher.cancel()
+        await asyncio.gather(self._dispatcher, *self._batches, return_exceptions=True)
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            future.cancel()
+        if self._owns_executor:
+            await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
+            self._executor = None
+        self._dispatcher = None
+
+    async def __aenter__(self) -> "SolverService":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def solve(self, board: Board, timeout: float = None) -> Optional[Board]:
+        """Solve board, returning the solution or None if there is none.
+
+        Raises ``asyncio.TimeoutError`` if no solution arrived within
+        ``timeout`` seconds and ValueError for malformed boards. For engine
+        "evolve", None is also returned if the evolution stopped before
+        finding a solution.
+        """
+        if not self.running:
+            raise RuntimeError("Service is not running.")
+        line = parse.format_board(board)
+        # reject malformed boards here, they would fail the whole batch in the worker
+        parse.parse_board(line)
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((line, future))
+        return await asyncio.wait_for(future, timeout)
+
+    async def solve_many(self, boards: Iterable[Board], timeout: float = None) -> List[Optional[Board]]:
+        """Solve boards concurrently, returning solutions in input order.
+
+        The timeout applies to each board and raises like ``solve``.
+        """
+        return await asyncio.gather(*(self.solve(board, timeout) for board in boards))
+
+    async def _dispatch(self) -> None:
+        """Collect queued requests into batches and hand them to the workers."""
+        loop = asyncio.get_running_loop()
+        while True:
+            requests = []
+            try:
+                requests.append(await self._queue.get())
+                deadline = loop.time() + self.max_delay
+                while len(requests) < self.max_batch_size:
+                    if not self._queue.empty():
+                        requests.append(self._queue.get_nowait())
+                        continue
+                    if (timeout := deadline - loop.time()) <= 0:
+                        break
+                    try:
+                        requests.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                await self._slots.acquire()
+            except asyncio.CancelledError:
+                for _, future in requests:
+                    future.cancel()
+                raise
+            # drop requests which timed out or were cancelled while queued
+            requests = [(line, future) for line, future in requests if not future.done()]
+            if not requests:
+                self._slots.release()
+                continue
+            task = asyncio.create_task(self._solve_batch(requests))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _solve_batch(self, requests: list) -> None:
+        try:
+            solutions = await asyncio.get_running_loop().run_in_executor(
+                self._executor,
+                batch.solve_chunk,
+                [line for line, _ in requests],
+                self.engine,
+                self.population_size,
+                self._seed_sequence.spawn(1)[0],
+                # batches may run concurrently in threads, each needs its own timer and counters
+                copy.deepcopy(self.termination),
+            )
+        except Exception as error:
+            for _, future in requests:
+                if not future.done():
+                    future.set_exception(error)
+        else:
+            for (_, future), solution in zip(requests, solutions):
+                if not future.done():
+                    future.set_result(_solution(solution))
+        finally:
+            self._slots.release()
+
+
+def _solution(line: str) -> Optional[Board]:
+    """Board of a solution line, None if the puzzle was left unsolved."""
+    if str(config.empty_cell_symbol) in line:
+        return None
+    board = parse.parse_board(line)
+    return board if Sudoku(board).is_valid() else None
@@ -3,20 +3,33 @@
 from __future__ import annotations
 
 import copy
-import random
-from functools import cache
-from itertools import product
-from typing import List
+import os
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+from genetic_algorithm_starter_kit import checkpoint
+from genetic_algorithm_starter_kit.cache import FitnessCache
+from genetic_algorithm_starter_kit.parallel import SharedMemoryFitness
+from genetic_algorithm_starter_kit.profiling import NULL_PROFILER, NullProfiler
+from genetic_algorithm_starter_kit.reporting import Reporter
+from genetic_algorithm_starter_kit.termination import (TARGET_FITNESS,
+                                                       EvolutionResult,
+                                                       Termination)
 
 from .etc import config
-from .utils import evolve, score_fitness, solve, validate
+from .utils import (evolve, hybrid, islands, propagate, score_fitness, solve,
+                    units, validate)
+from .utils.solution_cache import SolutionCache
 
 
 class Sudoku:
     """A class for solving sudokus.
 
-    This class implements two algorithms to solve a sudoku:
-        * backtracking algorithm
+    This class implements three algorithms to solve a sudoku:
+        * backtracking algorithm with constraint propagation
+        * naive backtracking algorithm (reference)
         * genetic algorithm
 
     A sudoku is a 9x9 grid which has to be filled entirely according to the
@@ -26,11 +39,29 @@ class Sudoku:
     2. Each column must contain the digits 1-9 without repetition.
     3. Each of the nine distinct non-overlapping 3x3 sub-boxes of the grid
     must contain the digits 1-9 without repetition.
+
+    Larger and smaller sudokus of size n² x n², e.g. 4x4 or 16x16 with n x n
+    sub-boxes and the digits 1 to n², follow the same rules.
     """
 
+    __slots__ = ("_board",)
+
     def __init__(self, board: List[List[int]]) -> None:
         self.board = copy.deepcopy(board)
 
+    @property
+    def board(self) -> List[List[int]]:
+        return self._board
+
+    @board.setter
+    def board(self, board: List[List[int]]) -> None:
+        self._board = board
+
+    @property
+    def size(self) -> int:
+        """Number of rows, columns and boxes, e.g. 9."""
+        return len(self.board)
+
     @property
     def fitness_score(self) -> float:
         """Compute mean of all fitness scores for sudoku configuration."""
@@ -56,9 +87,30 @@ class Sudoku:
         """Compute fitness score for rows."""
         return score_fitness.score_rows(self.board, normalize=True)
 
-    def evolve(self, population_size: int, lift_factor: float = 0.1, verbose: bool = True) -> None:
+    def evolve(
+        self,
+        population_size: int,
+        lift_factor: float = 0.1,
+        verbose: bool = True,
+        encoding: str = "uniform",
+        selection_strategy: str = "truncation",
+        cache: FitnessCache = None,
+        checkpoint_path: str = None,
+        checkpoint_interval: int = 100,
+        seed: int = None,
+        termination: Termination = None,
+        hybrid_threshold: float = None,
+        reporters: Sequence[Reporter] = None,
+        solution_cache: SolutionCache = None,
+        workers: int = None,
+        profiler: NullProfiler = None,
+        steady_state: int = None,
+    ) -> EvolutionResult:
         """Solve sudoku with a genetic algorithm.
 
+        The board is replaced by the solution if one is found before the
+        evolution stops.
+
         Parameters
         ----------
         population_size : int
@@ -66,13 +118,228 @@ class Sudoku:
         cutoff_factor : float, optional
             Factor of population containing the fittest sudokus that gets lifted,
             i.e. copied, to the new generation. Default is 0.1.
+        encoding : str, optional
+            Either "uniform" to fill each empty cell independently or
+            "permutation" to keep each row a permutation of the digits (see
+            ``PermutationSudoku``). Default is "uniform".
+        selection_strategy : str, optional
+            Name of the strategy selecting parents, i.e. "truncation",
+            "tournament" or "roulette". Default is "truncation".
+        cache : FitnessCache, optional
+            Cache of fitness scores of the population, whose hit and miss
+            counters can be inspected after the run.
+        checkpoint_path : str, optional
+            File to save the state of the evolution to every
+            ``checkpoint_interval`` generations, see ``resume_evolve``.
+        checkpoint_interval : int, optional
+            Number of generations between checkpoints. Default is 100.
+        seed : int, np.random.SeedSequence or np.random.Generator, optional
+            Seed of the random number generator of the run, which makes it
+            reproducible.
+        termination : Termination, optional
+            Stop conditions, e.g. a time budget, and restart policy of the
+            evolution, by default it runs until a solution is found.
+        hybrid_threshold : float, optional
+            Fitness score from which the fittest sudoku is finished by the
+            exact solver, see ``sudoku_solver.utils.hybrid``. If given, the
+            population is also seeded from the candidates of each cell. By
+            default the genetic algorithm runs on its own.
+        reporters : Sequence[Reporter], optional
+            Observers of the progress of the evolution, e.g. a
+            ``HistoryCollector``, see ``genetic_algorithm_starter_kit.reporting``.
+            By default progress is printed; no reporters evolve silently.
+        solution_cache : SolutionCache, optional
+            Cache of solutions looked up before evolving, and which solutions
+            found are added to. A cached solution is returned as solved in
+            generation 0.
+        workers : int, optional
+            Number of worker processes scoring each generation on shared
+            memory, see ``genetic_algorithm_starter_kit.parallel``. Results do
+            not depend on the number of workers. By default the population is
+            scored in-process.
+        profiler : NullProfiler, optional
+            Records the cost of creating the population and of the phases of
+            each generation, e.g. a ``Profiler``, see
+            ``genetic_algorithm_starter_kit.profiling``.
+        steady_state : int, optional
+            Number of children per generation which overwrite the least fit
+            sudokus of the population in place, which keeps the population in
+            a fixed set of sudokus. By default each generation replaces all
+            but the lifted sudokus.
+
+        Returns
+        -------
+        EvolutionResult
+            Fittest board, its fitness score, generation count and stop reason.
         """
+        if solution_cache is not None and (solution := solution_cache.get(self.board)) is not None:
+            self.board = solution
+            return EvolutionResult(solution, 1.0, 0, TARGET_FITNESS, 0.0)
+        rng = np.random.default_rng(seed)
+        hybrid_mode = hybrid_threshold is not None
+        if profiler is None:
+            profiler = NULL_PROFILER
+        with profiler.phase("init"):
+            population = _random_sudoku_class(encoding).create_population(
+                self.board, population_size, rng, hybrid_mode
+            )
+        clues = population[0].template.clues
+        with SharedMemoryFitness(population[0].batch_fitness, workers or 1, score_shape=(3,)) as fitness:
+            result = evolve.evolve(
+                population,
+                lift_factor,
+                verbose,
+                selection_strategy,
+                cache,
+                checkpoint_path,
+                checkpoint_interval,
+                rng,
+                termination=termination,
+                finish=(lambda board: hybrid.finish(board, clues)) if hybrid_mode else None,
+                finish_threshold=hybrid_threshold,
+                candidates=hybrid_mode,
+                reporters=reporters,
+                fitness=fitness,
+                profiler=profiler,
+                steady_state=steady_state,
+            )
+        if result.best_fitness >= 1.0:
+            if solution_cache is not None:
+                solution_cache.put(self.board, result.best)
+            self.board = result.best
+        return result
+
+    def resume_evolve(
+        self,
+        checkpoint_path: str,
+        verbose: bool = True,
+        cache: FitnessCache = None,
+        checkpoint_interval: int = 100,
+        termination: Termination = None,
+        reporters: Sequence[Reporter] = None,
+        workers: int = None,
+        profiler: NullProfiler = None,
+    ) -> EvolutionResult:
+        """Resume solving sudoku with a genetic algorithm from a checkpoint.
+
+        The evolution continues exactly as the run which saved the checkpoint
+        would have, with the same settings, including finishing near-solutions
+        with the exact solver, and keeps saving checkpoints to the same file.
+        Returns the result like ``evolve``.
+
+        Parameters
+        ----------
+        checkpoint_path : str
+            Checkpoint file saved by ``evolve`` for this sudoku.
+        cache : FitnessCache, optional
+            Cache of fitness scores of the population.
+        checkpoint_interval : int, optional
+            Number of generations between checkpoints. Default is 100.
+        termination : Termination, optional
+            Stop conditions and restart policy of the resumed evolution, which
+            continues from the saved restarts, stagnation and elapsed time.
+        reporters : Sequence[Reporter], optional
+            Observers of the progress of the resumed evolution.
+        workers : int, optional
+            Number of worker processes scoring each generation, see ``evolve``.
+        profiler : NullProfiler, optional
+            Records the cost of the phases of each generation, see ``evolve``.
+        """
+        state, arrays = checkpoint.load(checkpoint_path)
+        template = ClueTemplate(self.board)
+        if template.clues != tuple(arrays["clues"].tolist()):
+            raise ValueError("Checkpoint is of a different sudoku.")
+        sudoku_class = _random_sudoku_class(state["encoding"])
         population = []
-        for _ in range(population_size):
-            sudoku = RandomSudoku(self.board)
-            sudoku.fill_empty_cells()
+        for genes, fitness_scores in zip(arrays["genes"], arrays["fitness_scores"].tolist()):
+            sudoku = sudoku_class._from_genes(template, bytearray(genes))
+            sudoku.fitness_scores = tuple(fitness_scores)
             population.append(sudoku)
-        self.board = evolve.evolve(population, lift_factor, verbose)
+        # checkpoints of older versions have no hybrid mode
+        hybrid_threshold = state.get("hybrid_threshold")
+        hybrid_mode = hybrid_threshold is not None
+        with SharedMemoryFitness(sudoku_class.batch_fitness, workers or 1, score_shape=(3,)) as fitness:
+            result = evolve.evolve(
+                population,
+                state["lift_factor"],
+                verbose,
+                state["selection_strategy"],
+                cache,
+                checkpoint_path,
+                checkpoint_interval,
+                rng=checkpoint.restore_random_state(state["random_state"]),
+                generation_count=state["generation"],
+                termination=termination,
+                finish=(lambda board: hybrid.finish(board, template.clues)) if hybrid_mode else None,
+                finish_threshold=hybrid_threshold if hybrid_mode else 1.0,
+                candidates=state.get("candidates", False),
+                reporters=reporters,
+                fitness=fitness,
+                profiler=profiler,
+                # checkpoints of older versions have no steady-state mode
+                steady_state=state.get("steady_state"),
+                prob_cutoffs=state.get("prob_cutoffs"),
+                termination_state=state.get("termination"),
+            )
+        if result.best_fitness >= 1.0:
+            self.board = result.best
+        return result
+
+    def evolve_islands(
+        self,
+        population_size: int,
+        n_islands: int = None,
+        migration_size: int = 5,
+        migration_interval: int = 10,
+        topology: str = "ring",
+        lift_factor: float = 0.1,
+        verbose: bool = True,
+        seed: int = None,
+        encoding: str = "uniform",
+        selection_strategy: str = "truncation",
+    ) -> None:
+        """Solve sudoku with an island model of the genetic algorithm.
+
+        Parameters
+        ----------
+        population_size : int
+            Size of the population of each island.
+        n_islands : int, optional
+            Number of islands, each evolving in a separate process. Default is
+            the number of CPUs.
+        migration_size : int, optional
+            Number of fittest sudokus migrating from each island. Default is 5.
+        migration_interval : int, optional
+            Number of generations between migrations. Default is 10.
+        topology : str, optional
+            Either "ring" or "random" migration topology. Default is "ring".
+        lift_factor : float, optional
+            Factor of population containing the fittest sudokus that gets lifted,
+            i.e. copied, to the new generation. Default is 0.1.
+        seed : int, optional
+            Seed from which independent random number generators of the
+            islands are spawned.
+        encoding : str, optional
+            Either "uniform" or "permutation" encoding of the sudokus, see
+            ``Sudoku.evolve``. Default is "uniform".
+        selection_strategy : str, optional
+            Name of the strategy selecting parents, see ``Sudoku.evolve``.
+            Default is "truncation".
+        """
+        island, generation_count, self.board = islands.evolve_islands(
+            _random_sudoku_class(encoding)(self.board),
+            n_islands=n_islands or max(os.cpu_count() or 1, 2),
+            population_size=population_size,
+            lift_factor=lift_factor,
+            migration_size=migration_size,
+            migration_interval=migration_interval,
+            topology=topology,
+            selection_strategy=selection_strategy,
+            seed=seed,
+        )
+        if verbose:
+            print(f"Island {island} found a solution in generation {generation_count}:")
+            print(*self.board, sep="\n")
 
     def is_valid(self) -> bool:
         """Check if sudoku board is valid."""
@@ -83,19 +350,51 @@ class Sudoku:
         ]
         return all([func(self.board) for func in validation_funcs])
 
-    def solve(self) -> None:
-        """Solve sudoku with backtracking algorithm."""
-        row, col = solve.get_empty_cell_coordinates(self.board)
+    def solve(self, method: str = "propagation", cache: SolutionCache = None) -> bool:
+        """Solve sudoku with a backtracking algorithm.
+
+        Parameters
+        ----------
+        method : str, optional
+            Either "propagation" for backtracking on the cell with the fewest
+            candidates with constraint propagation, or "backtracking" for the
+            naive reference implementation. Default is "propagation".
+        cache : SolutionCache, optional
+            Cache of solutions looked up before solving, and which solutions
+            are added to. Equivalent puzzles share their cached solution.
+        """
+        if method not in ("propagation", "backtracking"):
+            raise ValueError(f"Unknown solve method: {method}")
+        if cache is not None:
+            if (solution := cache.get(self.board)) is not None:
+                self.board = solution
+                return True
+            puzzle = copy.deepcopy(self.board)
+        # solve a board assigned back afterwards, boards of subclasses may be materialized copies
+        board = self.board
+        if method == "propagation":
+            solved = propagate.solve(board)
+        else:
+            solved = self._solve_backtracking(board)
+        self.board = board
+        if solved and cache is not None:
+            cache.put(puzzle, self.board)
+        return solved
+
+    @staticmethod
+    def _solve_backtracking(board: List[List[int]]) -> bool:
+        """Solve board in place with naive backtracking algorithm."""
+        row, col = solve.get_empty_cell_coordinates(board)
         # No empty cell left, sudoku is solved
-        if row not in range(9) and col not in range(9):
+        if row is None:
             return True
-        for digit in config.allowed_symbols:
-            if solve.is_valid_update(self.board, row=row, col=col, digit=digit):
-                self.board[row][col] = digit
-                if self.solve():
+        for digit in units.unit_table(len(board)).symbols:
+            if solve.is_valid_update(board, row=row, col=col, digit=digit):
+                board[row][col] = digit
+                if Sudoku._solve_backtracking(board):
                     return True
                 # Backtrack in case of inconsistency
-                self.board[row][col] = config.empty_cell_symbol
+                board[row][col] = config.empty_cell_symbol
         return False
 
     # TODO
@@ -103,6 +402,30 @@ class Sudoku:
     #     return self.board
 
 
+class ClueTemplate:
+    """Immutable clues of a sudoku shared by all sudokus of a population.
+
+    The board is stored flattened in row-major order, i.e. cell ``(row, col)``
+    has index ``size * row + col``.
+    """
+
+    __slots__ = ("size", "symbols", "clues", "empty_cells", "row_genes")
+
+    def __init__(self, board: List[List[int]]) -> None:
+        self.size = len(board)
+        # digits of the genes, raises for boards of unsupported size
+        self.symbols = np.array(units.unit_table(self.size).symbols, dtype=np.uint8)
+        self.clues = tuple(digit for row in board for digit in row)
+        if len(self.clues) != self.size * self.size:
+            raise ValueError(f"Expected a {self.size}x{self.size} board.")
+        self.empty_cells = tuple(
+            cell for cell, digit in enumerate(self.clues) if digit == config.empty_cell_symbol
+        )
+        # genes of each row as (start, stop) indices, rows are contiguous in row-major order
+        rows = [cell // self.size for cell in self.empty_cells]
+        self.row_genes = tuple((bisect_left(rows, row), bisect_right(rows, row)) for row in range(self.size))
+
+
 class RandomSudoku(Sudoku):
     """Helper class for solving sudokus with a genetic algorithm.
 
@@ -110,47 +433,368 @@ class RandomSudoku(Sudoku):
     positions that where found empty at instantiation. Furthermore, any
     instance of this class can reproduce, i.e. "mate" with another instance,
     and spawn an offspring (another instance of this class).
+
+    To keep populations small in memory, a sudoku only stores the digits of
+    its empty cells (genes) in a compact byte array and references a clue
+    template shared with its offspring. The board is materialized on access.
     """
 
+    __slots__ = ("template", "genes", "_fitness_scores", "_unit_counts")
+
+    encoding = "uniform"
+
+    # scores a batch of boards, see ``score_fitness.score_components``
+    batch_fitness = staticmethod(score_fitness.score_components)
+
     prob_cutoffs = {
         "self": 0.45,
         "mate": 0.45 * 2,
     }
 
-    def __init__(self, board: List[List[int]], empty_cell_coordinates: List[List[int]] = None) -> None:
-        super().__init__(board)
-        if empty_cell_coordinates is None:
-            self._empty_cell_coordinates = self._get_all_empty_cell_coordinates()
-        else:
-            self._empty_cell_coordinates = empty_cell_coordinates
-
-    @cache
-    def _get_all_empty_cell_coordinates(self) -> List[int]:
-        """Return coordinates of all empty cells."""
-        coords = []
-        for row, col in product(range(9), repeat=2):
-            if self.board[row][col] == config.empty_cell_symbol:
-                coords.append((row, col))
-        return coords
-
-    def fill_empty_cells(self) -> None:
+    def __init__(self, board: List[List[int]]) -> None:
+        self.template = ClueTemplate(board)
+        self.genes = bytearray(len(self.template.empty_cells))
+        self._fitness_scores = None
+        self._unit_counts = None
+
+    @classmethod
+    def _from_genes(cls, template: ClueTemplate, genes: bytearray) -> RandomSudoku:
+        """Create sudoku from a clue template and genes without copying the template."""
+        sudoku = cls.__new__(cls)
+        sudoku.template = template
+        sudoku.genes = genes
+        sudoku._fitness_scores = None
+        sudoku._unit_counts = None
+        return sudoku
+
+    @classmethod
+    def _from_gene_array(cls, template: ClueTemplate, genes: np.ndarray) -> List[RandomSudoku]:
+        """Create sudokus from a clue template and an (N, n_genes) array of genes."""
+        data = genes.tobytes()
+        n_genes = genes.shape[1]
+        # boards without empty cells have no genes
+        return [
+            cls._from_genes(template, bytearray(data[n_genes * idx:n_genes * (idx + 1)])) for idx in range(len(genes))
+        ]
+
+    @staticmethod
+    def _gene_array(sudokus: List[RandomSudoku]) -> np.ndarray:
+        """Stack genes of sudokus sharing the same clues into an (N, n_genes) array."""
+        genes = np.frombuffer(b"".join(sudoku.genes for sudoku in sudokus), dtype=np.uint8)
+        return genes.reshape(len(sudokus), len(sudokus[0].template.empty_cells))
+
+    @classmethod
+    def create_population(
+        cls, board: List[List[int]], size: int, rng: np.random.Generator = None, candidates: bool = False
+    ) -> List[RandomSudoku]:
+        """Create population of randomly filled sudokus sharing the clues of board.
+
+        Random digits of the whole population are drawn from the generator at
+        once, only from the candidates of each cell given the clues (see
+        ``sudoku_solver.utils.hybrid``) if ``candidates`` is set.
+        """
+        template = ClueTemplate(board)
+        genes = cls._random_genes(template, size, np.random.default_rng(rng), candidates)
+        return cls._from_gene_array(template, genes)
+
+    def random_population(
+        self, size: int, rng: np.random.Generator = None, candidates: bool = False
+    ) -> List[RandomSudoku]:
+        """Create randomly filled sudokus sharing the clue template of this sudoku."""
+        genes = self._random_genes(self.template, size, np.random.default_rng(rng), candidates)
+        return self._from_gene_array(self.template, genes)
+
+    @staticmethod
+    def _random_genes(
+        template: ClueTemplate, size: int, rng: np.random.Generator, candidates: bool = False
+    ) -> np.ndarray:
+        """Random digits of the empty cells of size sudokus as (size, n_genes) array."""
+        n_genes, symbols = len(template.empty_cells), template.symbols
+        if not candidates:
+            return symbols[rng.integers(0, len(symbols), (size, n_genes))]
+        # table of candidates per gene, cells without candidates draw from all digits
+        options = [digits or list(symbols) for digits in hybrid.candidates(template.clues, template.empty_cells)]
+        table = np.zeros((n_genes, len(symbols)), dtype=np.uint8)
+        for gene, digits in enumerate(options):
+            table[gene, :len(digits)] = digits
+        counts = np.array([len(digits) for digits in options])
+        return table[np.arange(n_genes), (rng.random((size, n_genes)) * counts).astype(np.intp)]
+
+    @property
+    def board(self) -> List[List[int]]:
+        """Board materialized from clues and genes.
+
+        The board is a copy, i.e. changes to it do not change the sudoku
+        unless it is assigned back, which sets the genes.
+        """
+        cells, size = self._cells(), self.template.size
+        return [cells[size * row:size * (row + 1)] for row in range(size)]
+
+    @board.setter
+    def board(self, board: List[List[int]]) -> None:
+        cells = [digit for row in board for digit in row]
+        if len(cells) != len(self.template.clues) or any(
+            cells[cell] != clue for cell, clue in enumerate(self.template.clues) if clue != config.empty_cell_symbol
+        ):
+            raise ValueError("Board does not keep the clues of the sudoku.")
+        self.genes = bytearray(cells[cell] for cell in self.template.empty_cells)
+        self.invalidate_fitness()
+
+    @property
+    def size(self) -> int:
+        """Number of rows, columns and boxes, e.g. 9."""
+        return self.template.size
+
+    def _cells(self) -> List[int]:
+        """Digits of all cells of the flattened board."""
+        cells = list(self.template.clues)
+        for cell, digit in zip(self.template.empty_cells, self.genes):
+            cells[cell] = digit
+        return cells
+
+    @property
+    def fitness_scores(self) -> Tuple[float, float, float]:
+        """Fitness scores for boxes, cols and rows, computed once per genome."""
+        if self._fitness_scores is None:
+            board = self.board
+            self._fitness_scores = (
+                score_fitness.score_boxes(board, normalize=True),
+                score_fitness.score_cols(board, normalize=True),
+                score_fitness.score_rows(board, normalize=True),
+            )
+        return self._fitness_scores
+
+    @fitness_scores.setter
+    def fitness_scores(self, scores: Tuple[float, float, float]) -> None:
+        self._fitness_scores = scores
+
+    @property
+    def is_scored(self) -> bool:
+        """Whether fitness scores of the current genome are cached."""
+        return self._fitness_scores is not None
+
+    def invalidate_fitness(self) -> None:
+        """Discard cached fitness scores, e.g. after changing the genes."""
+        self._fitness_scores = None
+        self._unit_counts = None
+
+    def update_genes(self, changes: Iterable[Tuple[int, int]]) -> None:
+        """Change genes given as (gene, digit) pairs and update fitness scores incrementally.
+
+        Digit counts per unit are built on the first update of a sudoku, after
+        which each changed gene only costs an update of its row, column and box.
+        """
+        if self._unit_counts is None:
+            self._unit_counts = score_fitness.UnitCounts(self.board)
+        changes = list(changes)
+        for gene, digit in changes:
+            self.genes[gene] = digit
+        self._unit_counts.update((self.template.empty_cells[gene], digit) for gene, digit in changes)
+        self._fitness_scores = self._unit_counts.fitness_scores()
+
+    def mutate(self, changes: Iterable[Tuple[int, int]]) -> RandomSudoku:
+        """Produce offspring which differs in given (gene, digit) pairs.
+
+        If the fitness of this sudoku is tracked incrementally, scoring the
+        offspring only costs an update of the changed genes' units.
+        """
+        child_sudoku = self._from_genes(self.template, bytearray(self.genes))
+        if self._unit_counts is not None:
+            child_sudoku._unit_counts = self._unit_counts.copy()
+        child_sudoku.update_genes(changes)
+        return child_sudoku
+
+    @property
+    def fitness_score_boxes(self) -> float:
+        """Compute fitness score for boxes."""
+        return self.fitness_scores[0]
+
+    @property
+    def fitness_score_cols(self) -> float:
+        """Compute fitness score for cols."""
+        return self.fitness_scores[1]
+
+    @property
+    def fitness_score_rows(self) -> float:
+        """Compute fitness score for rows."""
+        return self.fitness_scores[2]
+
+    def fill_empty_cells(self, rng: np.random.Generator = None) -> None:
         """Fill all empty cells with random digits."""
-        for row, col in self._empty_cell_coordinates:
-            self.board[row][col] = random.choice(list(config.allowed_symbols))
+        self.genes[:] = self._random_genes(self.template, 1, np.random.default_rng(rng)).tobytes()
+        self.invalidate_fitness()
 
-    def reproduce(self, sudoku: RandomSudoku) -> RandomSudoku:
+    def reproduce(
+        self, sudoku: RandomSudoku, rng: np.random.Generator = None, prob_cutoffs: Dict[str, float] = None
+    ) -> RandomSudoku:
         """Perform reproduction and produce new offspring."""
-        child_sudoku = RandomSudoku(self.board, self._empty_cell_coordinates)
-        for row, col in self._empty_cell_coordinates:
-            prob = random.random()
-            if prob < self.prob_cutoffs["self"]:
-                # get digit from self
-                digit = self.board[row][col]
-            elif prob < self.prob_cutoffs["mate"]:
-                # get digit from other sudoku
-                digit = sudoku.board[row][col]
-            else:
-                # random mutation
-                digit = random.choice(list(config.allowed_symbols))
-            child_sudoku.board[row][col] = digit
-        return child_sudoku
+        return self.reproduce_many([self], [sudoku], rng, prob_cutoffs)[0]
+
+    @classmethod
+    def reproduce_many(
+        cls,
+        parents: List[RandomSudoku],
+        mates: List[RandomSudoku],
+        rng: np.random.Generator = None,
+        prob_cutoffs: Dict[str, float] = None,
+    ) -> List[RandomSudoku]:
+        """Produce one offspring of each pair of parent and mate sharing the same clues.
+
+        Random numbers of all offspring are drawn from the generator at once.
+        Probability cutoffs other than ``prob_cutoffs`` of the class change
+        the mutation rate.
+        """
+        return cls._from_gene_array(parents[0].template, cls.reproduce_genes(parents, mates, rng, prob_cutoffs))
+
+    @classmethod
+    def reproduce_genes(
+        cls,
+        parents: List[RandomSudoku],
+        mates: List[RandomSudoku],
+        rng: np.random.Generator = None,
+        prob_cutoffs: Dict[str, float] = None,
+    ) -> np.ndarray:
+        """Genes of the offspring of ``reproduce_many`` as (N, n_genes) array."""
+        rng = np.random.default_rng(rng)
+        prob_cutoffs = prob_cutoffs or cls.prob_cutoffs
+        genes_self, genes_mate = cls._gene_array(parents), cls._gene_array(mates)
+        prob = rng.random(genes_self.shape)
+        # get digit from self or from other sudoku
+        genes = np.where(prob < prob_cutoffs["self"], genes_self, genes_mate)
+        # random mutation
+        mutated = prob >= prob_cutoffs["mate"]
+        symbols = parents[0].template.symbols
+        genes[mutated] = symbols[rng.integers(0, len(symbols), np.count_nonzero(mutated))]
+        return genes
+
+    def overwrite_genes(self, genes: np.ndarray) -> None:
+        """Replace the genes in place, e.g. by those of offspring, and discard cached fitness scores."""
+        memoryview(self.genes)[:] = np.ascontiguousarray(genes, dtype=np.uint8)
+        self.invalidate_fitness()
+
+
+class PermutationSudoku(RandomSudoku):
+    """Helper class for solving sudokus with a permutation-preserving genetic algorithm.
+
+    Each row of these sudokus is always a permutation of all digits which is
+    consistent with the clues, hence rows are always valid and only columns
+    and boxes need to be scored. Offspring inherits entire rows from either
+    parent and mutates by swapping two empty cells within a row.
+
+    Swaps update the fitness scores incrementally (see ``update_genes``).
+    """
+
+    __slots__ = ()
+
+    encoding = "permutation"
+
+    batch_fitness = staticmethod(score_fitness.score_permutation_components)
+
+    @property
+    def fitness_scores(self) -> Tuple[float, float, float]:
+        """Fitness scores for boxes, cols and rows, computed once per genome."""
+        if self._fitness_scores is None:
+            board = self.board
+            self._fitness_scores = (
+                score_fitness.score_boxes(board, normalize=True),
+                score_fitness.score_cols(board, normalize=True),
+                1.0,
+            )
+        return self._fitness_scores
+
+    @fitness_scores.setter
+    def fitness_scores(self, scores: Tuple[float, float, float]) -> None:
+        self._fitness_scores = scores
+
+    @staticmethod
+    def _random_genes(
+        template: ClueTemplate, size: int, rng: np.random.Generator, candidates: bool = False
+    ) -> np.ndarray:
+        """Random permutations of the missing digits of each row of size sudokus as (size, n_genes) array.
+
+        With ``candidates`` set, the digits of a row are assigned greedily,
+        most constrained cells first, to a random candidate of each cell which
+        is still missing in the row if there is one.
+        """
+        genes = np.empty((size, len(template.empty_cells)), dtype=np.uint8)
+        if candidates:
+            options = hybrid.candidates(template.clues, template.empty_cells)
+        for row, (start, stop) in enumerate(template.row_genes):
+            clues = template.clues[template.size * row:template.size * (row + 1)]
+            digits = sorted(set(template.symbols.tolist()).difference(clues))
+            if len(digits) != stop - start:
+                raise ValueError(f"Clues of row {row} contain duplicates or invalid digits.")
+            if not candidates:
+                genes[:, start:stop] = rng.permuted(np.tile(np.array(digits, dtype=np.uint8), (size, 1)), axis=1)
+                continue
+            row_options = options[start:stop]
+            # random tie-breaks among cells with the same number of candidates
+            n_options = [len(cell_options) for cell_options in row_options]
+            orders = np.argsort(n_options + rng.random((size, stop - start)), axis=1)
+            picks = rng.random((size, stop - start)).tolist()
+            for sudoku, order in enumerate(orders.tolist()):
+                missing = list(digits)
+                for gene in order:
+                    choices = [digit for digit in row_options[gene] if digit in missing] or missing
+                    digit = choices[int(picks[sudoku][gene] * len(choices))]
+                    missing.remove(digit)
+                    genes[sudoku, start + gene] = digit
+        return genes
+
+    @classmethod
+    def reproduce_many(
+        cls,
+        parents: List[PermutationSudoku],
+        mates: List[PermutationSudoku],
+        rng: np.random.Generator = None,
+        prob_cutoffs: Dict[str, float] = None,
+    ) -> List[PermutationSudoku]:
+        """Produce one offspring of each pair of parent and mate sharing the same clues.
+
+        Offspring inherits each row from either parent or swaps two of its
+        empty cells. Random numbers of all offspring are drawn at once.
+        """
+        return cls._from_gene_array(parents[0].template, cls.reproduce_genes(parents, mates, rng, prob_cutoffs))
+
+    @classmethod
+    def reproduce_genes(
+        cls,
+        parents: List[PermutationSudoku],
+        mates: List[PermutationSudoku],
+        rng: np.random.Generator = None,
+        prob_cutoffs: Dict[str, float] = None,
+    ) -> np.ndarray:
+        """Genes of the offspring of ``reproduce_many`` as (N, n_genes) array."""
+        rng = np.random.default_rng(rng)
+        prob_cutoffs = prob_cutoffs or cls.prob_cutoffs
+        template = parents[0].template
+        starts, stops = np.array(template.row_genes).T
+        genes_self, genes_mate = cls._gene_array(parents), cls._gene_array(mates)
+        prob = rng.random((len(parents), template.size))
+        # get row from other sudoku, else keep row from self
+        from_mate = (prob >= prob_cutoffs["self"]) & (prob < prob_cutoffs["mate"])
+        genes = np.where(from_mate[:, np.repeat(np.arange(template.size), stops - starts)], genes_mate, genes_self)
+        # random mutation swaps two distinct empty cells of a row
+        children, rows = np.nonzero((prob >= prob_cutoffs["mate"]) & (stops - starts > 1))
+        n_cells = (stops - starts)[rows]
+        gene0 = rng.integers(0, n_cells)
+        gene1 = rng.integers(0, n_cells - 1)
+        gene1 += gene1 >= gene0
+        gene0, gene1 = starts[rows] + gene0, starts[rows] + gene1
+        genes[children, gene0], genes[children, gene1] = genes[children, gene1], genes[children, gene0]
+        return genes
+
+    def swap(self, gene0: int, gene1: int) -> None:
+        """Swap digits of two empty cells in the same row and update fitness scores incrementally."""
+        size = self.template.size
+        if self.template.empty_cells[gene0] // size != self.template.empty_cells[gene1] // size:
+            raise ValueError("Only cells within the same row can be swapped.")
+        self.update_genes([(gene0, self.genes[gene1]), (gene1, self.genes[gene0])])
+
+
+def _random_sudoku_class(encoding: str) -> type:
+    """Class of sudokus of the genetic algorithm for given encoding."""
+    for sudoku_class in (RandomSudoku, PermutationSudoku):
+        if sudoku_class.encoding == encoding:
+            return sudoku_class
+    raise ValueError(f"Unknown encoding: {encoding}")
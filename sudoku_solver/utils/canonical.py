@@ -0,0 +1,137 @@
+"""Canonical forms of sudokus under the symmetries of the grid.
+
+Two puzzles are equivalent if one is obtained from the other by relabeling
+digits, permuting bands (and stacks), permuting rows within bands (and
+columns within stacks) and transposing. Equivalent puzzles have the same
+solutions up to the same transform.
+
+The canonical form of a board is the lexicographically smallest equivalent
+board among those whose rows and columns are sorted by signatures which do
+not change under the symmetries, i.e. built from the numbers of clues and
+digit frequencies of rows, columns and boxes. Since the signatures fix most
+of the order, only the transforms permuting rows or columns with equal
+signatures need to be compared. Digits are relabeled in order of first
+appearance, which is the smallest relabeling of a board.
+"""
+
+from itertools import permutations, product
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from sudoku_solver.etc import config
+
+# All 1296 permutations of rows permuting bands and rows within bands
+_LINE_PERMUTATIONS = np.array([
+    [3 * band + row for band, rows in zip(bands, within) for row in rows]
+    for bands in permutations(range(3))
+    for within in product(permutations(range(3)), repeat=3)
+])
+# Bands of the lines of every permutation
+_BAND_PERMUTATIONS = _LINE_PERMUTATIONS[:, ::3] // 3
+# Boxes of the cells of a board
+_BOXES = np.arange(9)[:, None] // 3 * 3 + np.arange(9)[None, :] // 3
+# Maximum number of transforms compared, bounds time and memory for very symmetric boards
+MAX_CANDIDATES = 20_000
+
+
+class Transform(NamedTuple):
+    """Symmetry mapping a board to its canonical form.
+
+    The canonical board is the board, transposed if ``transpose``, with rows
+    and columns taken in the order of ``rows`` and ``cols``, and digit ``d``
+    relabeled as ``labels[d]``.
+    """
+
+    transpose: bool
+    rows: Tuple[int, ...]
+    cols: Tuple[int, ...]
+    labels: Tuple[int, ...]
+
+    def apply(self, board: Sequence[Sequence[int]]) -> np.ndarray:
+        """Transform board, e.g. a puzzle or its solution, to canonical space."""
+        board = np.asarray(board)
+        if self.transpose:
+            board = board.T
+        return np.asarray(self.labels)[board[np.ix_(self.rows, self.cols)]]
+
+    def invert(self, board: Sequence[Sequence[int]]) -> np.ndarray:
+        """Transform board from canonical space back, e.g. a canonical solution."""
+        inverse_labels = np.empty(len(self.labels), dtype=np.intp)
+        inverse_labels[list(self.labels)] = np.arange(len(self.labels))
+        original = np.empty((9, 9), dtype=np.intp)
+        original[np.ix_(self.rows, self.cols)] = inverse_labels[np.asarray(board)]
+        return original.T if self.transpose else original
+
+
+def _ranks(keys: List) -> np.ndarray:
+    """Rank of each key among the distinct keys."""
+    distinct = sorted(set(keys))
+    return np.array([distinct.index(key) for key in keys])
+
+
+def _line_ranks(board: np.ndarray, rounds: int = 2) -> Tuple[np.ndarray, np.ndarray]:
+    """Invariant ranks of the rows and columns of a board.
+
+    Cells are colored by the frequency of their digit and the number of clues
+    of their box. Rows and columns are colored by the colors of their cells
+    together with the colors of the crossing lines, refined over rounds.
+    """
+    counts = np.bincount(board.ravel(), minlength=10)
+    counts[config.empty_cell_symbol] = 0
+    box_counts = np.bincount(_BOXES.ravel(), weights=(board != config.empty_cell_symbol).ravel(), minlength=9)
+    cells = (10 * counts[board] + box_counts[_BOXES]).astype(int).tolist()
+    row_ranks, col_ranks = np.zeros(9, dtype=int), np.zeros(9, dtype=int)
+    for _ in range(rounds):
+        row_ranks = _ranks([
+            (row_ranks[row], tuple(sorted(zip(col_ranks.tolist(), cells[row])))) for row in range(9)
+        ])
+        col_ranks = _ranks([
+            (col_ranks[col], tuple(sorted(zip(row_ranks.tolist(), [cells[row][col] for row in range(9)]))))
+            for col in range(9)
+        ])
+    return row_ranks, col_ranks
+
+
+def _sorted_permutations(line_ranks: np.ndarray) -> np.ndarray:
+    """Permutations of lines ordering bands and lines within bands by rank."""
+    band_ranks = _ranks([tuple(sorted(line_ranks[3 * band:3 * band + 3].tolist())) for band in range(3)])
+    ranks = line_ranks[_LINE_PERMUTATIONS].reshape(-1, 3, 3)
+    bands = band_ranks[_BAND_PERMUTATIONS]
+    is_sorted = np.all(np.diff(bands, axis=1) >= 0, axis=1) & np.all(np.diff(ranks, axis=2) >= 0, axis=(1, 2))
+    return _LINE_PERMUTATIONS[is_sorted]
+
+
+def _relabel(boards: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Relabel digits of each board in order of first appearance, return boards and labels."""
+    digits = np.arange(1, 10)
+    is_digit = boards[:, :, None] == digits
+    first = np.where(is_digit.any(axis=1), is_digit.argmax(axis=1), boards.shape[1])
+    # absent digits keep their order after the present ones
+    order = np.argsort(first, axis=1, kind="stable")
+    labels = np.zeros((len(boards), 10), dtype=np.intp)
+    np.put_along_axis(labels, order + 1, digits, axis=1)
+    return np.take_along_axis(labels, boards, axis=1), labels
+
+
+def canonicalize(board: Sequence[Sequence[int]]) -> Optional[Tuple[np.ndarray, Transform]]:
+    """Canonical form of board and the transform mapping board to it.
+
+    Returns None if the board is so symmetric that more than
+    ``MAX_CANDIDATES`` transforms would need to be compared.
+    """
+    board = np.asarray(board, dtype=np.intp)
+    candidates, transforms = [], []
+    for transpose in (False, True):
+        oriented = board.T if transpose else board
+        row_ranks, col_ranks = _line_ranks(oriented)
+        rows, cols = _sorted_permutations(row_ranks), _sorted_permutations(col_ranks)
+        if len(transforms) + len(rows) * len(cols) > MAX_CANDIDATES:
+            return None
+        candidates.append(oriented[rows[:, None, :, None], cols[None, :, None, :]].reshape(-1, 9 * 9))
+        transforms.extend((transpose, row_order, col_order) for row_order, col_order in product(rows, cols))
+    relabeled, labels = _relabel(np.concatenate(candidates))
+    best = np.lexsort(relabeled.T[::-1])[0]
+    transpose, rows, cols = transforms[best]
+    transform = Transform(transpose, tuple(rows.tolist()), tuple(cols.tolist()), tuple(labels[best].tolist()))
+    return relabeled[best].reshape(9, 9), transform
@@ -1,13 +1,216 @@
 """Implementation of a genetic algorithm for solving sudokus."""
 
-import random
-from typing import List
+from functools import partial
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 
-def evolve(population: List, lift_factor: float, verbose: bool) -> None:
+from genetic_algorithm_starter_kit import checkpoint, selection
+from genetic_algorithm_starter_kit.cache import FitnessCache
+from genetic_algorithm_starter_kit.fitness import BatchFitness
+from genetic_algorithm_starter_kit.profiling import NULL_PROFILER, NullProfiler
+from genetic_algorithm_starter_kit.reporting import (GenerationEvent, Reporter,
+                                                     default_reporters)
+from genetic_algorithm_starter_kit.termination import (RESTART, TARGET_FITNESS,
+                                                       EvolutionResult,
+                                                       Termination)
+from sudoku_solver.utils import score_fitness
+
+
+def stack_boards(population: List) -> np.ndarray:
+    """Stack boards of a population of sudokus sharing the same clues into an (N, size, size) array."""
+    template = population[0].template
+    boards = np.tile(np.array(template.clues, dtype=np.uint8), (len(population), 1))
+    genes = np.frombuffer(b"".join(sudoku.genes for sudoku in population), dtype=np.uint8)
+    boards[:, template.empty_cells] = genes.reshape(len(population), len(template.empty_cells))
+    return boards.reshape(-1, template.size, template.size)
+
+
+def score_population(
+    population: List, cache: FitnessCache = None, fitness: BatchFitness = None
+) -> score_fitness.Scores:
+    """Score population of sudokus, scoring only those not cached yet at once.
+
+    Scores are looked up in and added to the cache if one is given, keyed on
+    the genes of the sudokus, which must therefore share the same clues.
+    Boards are scored by ``fitness`` if given, which maps boards to their box,
+    column and row scores like ``score_fitness.score_components``, e.g. in
+    worker processes (see ``genetic_algorithm_starter_kit.parallel``), else by
+    the ``batch_fitness`` of the class of the sudokus.
+    """
+    unscored = [sudoku for sudoku in population if not sudoku.is_scored]
+    if cache is not None:
+        misses = []
+        for sudoku in unscored:
+            if (fitness_scores := cache.get(bytes(sudoku.genes))) is None:
+                misses.append(sudoku)
+            else:
+                sudoku.fitness_scores = fitness_scores
+        unscored = misses
+    if unscored:
+        scores = (fitness or unscored[0].batch_fitness)(stack_boards(unscored))
+        for sudoku, fitness_scores in zip(unscored, scores.tolist()):
+            sudoku.fitness_scores = tuple(fitness_scores)
+            if cache is not None:
+                cache.put(bytes(sudoku.genes), sudoku.fitness_scores)
+    boxes, cols, rows = np.array([sudoku.fitness_scores for sudoku in population]).reshape(-1, 3).T
+    return score_fitness.Scores(rows=rows, cols=cols, boxes=boxes, total=(boxes + cols + rows) / 3)
+
+
+def breed(
+    population: List,
+    scores: score_fitness.Scores,
+    lift_factor: float,
+    select_parents: Callable = selection.truncation,
+    rng: np.random.Generator = None,
+    cache: FitnessCache = None,
+    prob_cutoffs: Dict[str, float] = None,
+    fitness: BatchFitness = None,
+    profiler: NullProfiler = NULL_PROFILER,
+) -> Tuple[List, score_fitness.Scores]:
+    """Breed new generation from population.
+
+    All offspring is produced at once from random numbers drawn from the
+    generator, with the sudokus' reproduction probability cutoffs unless
+    others are given. Returns the new generation and its scores, which are
+    looked up in the fitness cache if one is given (see ``score_population``).
+    Selection, reproduction and scoring are timed by the profiler.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+
+    with profiler.phase("select"):
+        # fittest individuals go to next generation
+        n_fittest_sudokus = int(lift_factor * len(population))
+        elites = selection.elite_indices(scores.total, n_fittest_sudokus)
+        new_generation = [population[idx] for idx in elites]
+        n_children = len(population) - n_fittest_sudokus
+        parents = select_parents(scores.total, 2 * n_children, rng).reshape(2, n_children)
+
+    # selected parents mate to produce offspring
+    with profiler.phase("reproduce"):
+        new_generation.extend(type(population[0]).reproduce_many(
+            [population[idx] for idx in parents[0]], [population[idx] for idx in parents[1]], rng, prob_cutoffs
+        ))
+
+    # scores of lifted sudokus are kept, only offspring needs scoring
+    with profiler.phase("score"):
+        scores = score_fitness.Scores.concatenate(
+            scores.take(elites),
+            score_population(new_generation[n_fittest_sudokus:], cache, fitness),
+        )
+    return new_generation, scores
+
+
+def replace_worst(
+    population: List,
+    scores: score_fitness.Scores,
+    n_children: int,
+    select_parents: Callable = selection.truncation,
+    rng: np.random.Generator = None,
+    cache: FitnessCache = None,
+    prob_cutoffs: Dict[str, float] = None,
+    fitness: BatchFitness = None,
+    profiler: NullProfiler = NULL_PROFILER,
+) -> None:
+    """Breed children which overwrite the least fit sudokus of population in place.
+
+    The genes of the replaced sudokus are overwritten, so neither sudokus nor
+    lists of the population are created, and only the children are scored.
+    Their scores overwrite those of the replaced sudokus in ``scores``.
+    Random numbers and scores are drawn and looked up like in ``breed``.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+
+    with profiler.phase("select"):
+        parents = select_parents(scores.total, 2 * n_children, rng).reshape(2, n_children)
+        slots = selection.worst_indices(scores.total, n_children)
+
+    # genes of all children are bred before any parent is overwritten
+    with profiler.phase("reproduce"):
+        genes = type(population[0]).reproduce_genes(
+            [population[idx] for idx in parents[0]], [population[idx] for idx in parents[1]], rng, prob_cutoffs
+        )
+        children = [population[slot] for slot in slots]
+        for child, child_genes in zip(children, genes):
+            child.overwrite_genes(child_genes)
+
+    with profiler.phase("score"):
+        for field, child_scores in zip(scores, score_population(children, cache, fitness)):
+            field[slots] = child_scores
+
+
+def save_checkpoint(
+    path: str,
+    population: List,
+    scores: score_fitness.Scores,
+    generation_count: int,
+    rng: np.random.Generator,
+    lift_factor: float,
+    selection_strategy: str,
+    steady_state: int = None,
+    termination: Termination = None,
+    prob_cutoffs: Dict[str, float] = None,
+    finish_threshold: float = None,
+    candidates: bool = False,
+) -> None:
+    """Write population, its scores, settings, random and termination states to a checkpoint file.
+
+    The population is stored as its clues and an (N, n_genes) array of genes.
+    Probability cutoffs escalated by restarts are saved too, None stands for
+    the defaults of the sudokus. A finish threshold of None stands for runs
+    without an exact solver finishing near-solutions.
+    """
+    template = population[0].template
+    genes = np.frombuffer(b"".join(sudoku.genes for sudoku in population), dtype=np.uint8)
+    state = {
+        "generation": generation_count,
+        "encoding": population[0].encoding,
+        "lift_factor": lift_factor,
+        "selection_strategy": selection_strategy,
+        "steady_state": steady_state,
+        "random_state": checkpoint.random_state(rng),
+        "termination": None if termination is None else termination.state(),
+        "prob_cutoffs": prob_cutoffs,
+        "hybrid_threshold": finish_threshold,
+        "candidates": candidates,
+    }
+    checkpoint.save(
+        path,
+        state,
+        clues=np.array(template.clues, dtype=np.uint8),
+        genes=genes.reshape(len(population), len(template.empty_cells)),
+        fitness_scores=np.stack([scores.boxes, scores.cols, scores.rows], axis=1),
+    )
+
+
+def evolve(
+    population: List,
+    lift_factor: float,
+    verbose: bool,
+    selection_strategy: str = "truncation",
+    cache: FitnessCache = None,
+    checkpoint_path: str = None,
+    checkpoint_interval: int = 100,
+    rng: np.random.Generator = None,
+    generation_count: int = 1,
+    termination: Termination = None,
+    finish: Callable[[List[List[int]]], Optional[List[List[int]]]] = None,
+    finish_threshold: float = 1.0,
+    candidates: bool = False,
+    reporters: Sequence[Reporter] = None,
+    fitness: BatchFitness = None,
+    profiler: NullProfiler = None,
+    steady_state: int = None,
+    prob_cutoffs: Dict[str, float] = None,
+    termination_state: Dict = None,
+) -> EvolutionResult:
     """Evolve a population of sudokus towards a valid solution.
 
-    TODO Refactor.
+    The evolution stops on any criterion of ``termination``, by default once
+    a valid solution is found. A stagnating population may be restarted by
+    reseeding its least fit sudokus and escalating the mutation rate.
 
     Parameters
     ----------
@@ -16,54 +219,152 @@ def evolve(population: List, lift_factor: float, verbose: bool) -> None:
     lift_factor : float, optional
         Factor of population containing the fittest sudokus that gets lifted,
         i.e. copied, to the new generation.
+    selection_strategy : str, optional
+        Name of the strategy selecting parents, see
+        ``genetic_algorithm_starter_kit.selection``. Default is "truncation".
+    cache : FitnessCache, optional
+        Cache of fitness scores keyed on the genes of the sudokus.
+    checkpoint_path : str, optional
+        File to save a checkpoint (see ``save_checkpoint``) to every
+        ``checkpoint_interval`` generations.
+    rng : np.random.Generator, optional
+        Random number generator for selecting parents and producing
+        offspring, e.g. restored from a checkpoint.
+    generation_count : int, optional
+        Generation of the population, e.g. restored from a checkpoint.
+    termination : Termination, optional
+        Stop conditions and restart policy, see
+        ``genetic_algorithm_starter_kit.termination``.
+    finish : Callable, optional
+        Exact solver returning the solution of a near-solution board or None,
+        e.g. ``sudoku_solver.utils.hybrid.finish``. It is called whenever the
+        fittest sudoku improves on ``finish_threshold`` and the previous
+        attempt.
+    finish_threshold : float, optional
+        Fitness score from which the fittest sudoku is finished. Default is 1.
+    candidates : bool, optional
+        Whether sudokus reseeded on restart are filled from the candidates of
+        their cells, see ``RandomSudoku.random_population``.
+    reporters : Sequence[Reporter], optional
+        Observers of the progress, see
+        ``genetic_algorithm_starter_kit.reporting``. By default lines are
+        printed at most every 0.1 seconds, on new lines if ``verbose``. No
+        reporters evolve silently.
+    fitness : BatchFitness, optional
+        Scores boards instead of the ``batch_fitness`` of the sudokus, e.g. a
+        ``genetic_algorithm_starter_kit.parallel.SharedMemoryFitness``.
+    profiler : NullProfiler, optional
+        Records the cost of the phases of each generation, including
+        finishing near-solutions ("finish"), see
+        ``genetic_algorithm_starter_kit.profiling``.
+    steady_state : int, optional
+        Number of children per generation which overwrite the least fit
+        sudokus in place (see ``replace_worst``), instead of breeding a new
+        generation of all but the lifted sudokus. The sudokus of the
+        population are modified.
+    prob_cutoffs : Dict[str, float], optional
+        Reproduction probability cutoffs, by default those of the sudokus,
+        e.g. escalated by restarts and restored from a checkpoint.
+    termination_state : Dict, optional
+        Progress of the termination, e.g. restarts and elapsed time, restored
+        from a checkpoint (see ``Termination.state``).
+
+    Returns
+    -------
+    EvolutionResult
+        Board of the fittest sudoku, its total fitness score, the generation
+        count and the stop reason.
     """
-    def print_out(generation_count: int, fittest_sudoku):
-        """Print out during evolution."""
-        print(
+    def format_line(generation_count: int, scores: score_fitness.Scores, idx: int) -> str:
+        """Progress line of a generation."""
+        return (
             f"GENERATION: {str(generation_count).zfill(7)} "
-            f"FITNESS SCORES - total: {str(round(fittest_sudoku.fitness_score, 5)).zfill(7)} | "
-            f"boxes: {str(round(fittest_sudoku.fitness_score_boxes, 5)).zfill(7)} | "
-            f"cols: {str(round(fittest_sudoku.fitness_score_cols, 5)).zfill(7)} | "
-            f"rows: {str(round(fittest_sudoku.fitness_score_rows, 5)).zfill(7)}",
-            end="\n" if verbose else "\r",
+            f"FITNESS SCORES - total: {str(round(scores.total[idx], 5)).zfill(7)} | "
+            f"boxes: {str(round(scores.boxes[idx], 5)).zfill(7)} | "
+            f"cols: {str(round(scores.cols[idx], 5)).zfill(7)} | "
+            f"rows: {str(round(scores.rows[idx], 5)).zfill(7)}"
         )
 
-    generation_count = 1
-    target_found = False
-    while not target_found:
+    if reporters is None:
+        reporters = default_reporters(verbose, format_best=lambda board: "\n".join(map(str, board)))
+    select_parents = selection.get_strategy(selection_strategy)
+    termination = termination or Termination()
+    termination.start()
+    if termination_state is not None:
+        termination.restore(termination_state)
+    if rng is None:
+        rng = np.random.default_rng()
+    if profiler is None:
+        profiler = NULL_PROFILER
+    selection.check_steady_state(steady_state, len(population))
+    with profiler.phase("score"):
+        scores = score_population(population, cache, fitness)
+    finished_fitness = float("-inf")
+    while True:
 
-        # sort population by decreasing order of fitness score
-        population = sorted(
-            population,
-            key=lambda x: x.fitness_score,
-            reverse=True,
-        )
-        fittest_sudoku = population[0]
-        # if fittest individual has fitness score of 1 we are done
-        if fittest_sudoku.fitness_score >= 1.0:
-            target_found = True
-
-        print_out(generation_count, fittest_sudoku)
+        profiler.mark_generation(generation_count)
+        fittest = np.argmax(scores.total)
+        best, best_fitness = population[fittest].board, float(scores.total[fittest])
+        if reporters:
+            with profiler.phase("report"):
+                event = GenerationEvent(
+                    generation_count, scores.total, fittest, partial(format_line, generation_count, scores, fittest)
+                )
+                for reporter in reporters:
+                    reporter.on_generation(event)
 
-        # generate new offsprings for new generation
-        new_generation = []
+        # hand near-solutions over to the exact solver
+        if finish is not None and finish_threshold <= best_fitness < 1 and best_fitness > finished_fitness:
+            finished_fitness = best_fitness
+            with profiler.phase("finish"):
+                solution = finish(best)
+            if solution is not None:
+                best, best_fitness, stop_reason = solution, 1.0, TARGET_FITNESS
+                break
 
-        # fittest individuals go to next generation
-        n_fittest_sudokus = int(lift_factor * len(population))
-        new_generation.extend(population[:n_fittest_sudokus])
+        # stop e.g. if fittest individual has fitness score of 1
+        stop_reason = termination.check(generation_count, best_fitness)
+        if stop_reason == RESTART:
+            restart = termination.restart
+            reseeded = selection.worst_indices(scores.total, restart.n_reseeded(len(population)))
+            with profiler.phase("init"):
+                population = population.copy()
+                for idx, sudoku in zip(reseeded, population[0].random_population(len(reseeded), rng, candidates)):
+                    population[idx] = sudoku
+            with profiler.phase("score"):
+                scores = score_population(population, cache, fitness)
+            prob_cutoffs = restart.escalate(prob_cutoffs or population[0].prob_cutoffs)
+        elif stop_reason:
+            break
 
-        # 50% of fittest individuals mate to produce offspring
-        idx = len(population) - n_fittest_sudokus
-        for _ in range(idx):
-            parent0 = random.choice(population[:len(population)//2])
-            parent1 = random.choice(population[:len(population)//2])
-            child = parent0.reproduce(parent1)
-            new_generation.append(child)
+        if checkpoint_path and generation_count % checkpoint_interval == 0:
+            with profiler.phase("checkpoint"):
+                save_checkpoint(
+                    checkpoint_path,
+                    population,
+                    scores,
+                    generation_count,
+                    rng,
+                    lift_factor,
+                    selection_strategy,
+                    steady_state,
+                    termination,
+                    prob_cutoffs,
+                    None if finish is None else finish_threshold,
+                    candidates,
+                )
 
-        population = new_generation
+        if steady_state:
+            replace_worst(population, scores, steady_state, select_parents, rng, cache, prob_cutoffs, fitness, profiler)
+        else:
+            population, scores = breed(
+                population, scores, lift_factor, select_parents, rng, cache, prob_cutoffs, fitness, profiler
+            )
         generation_count += 1
 
-    print("\n\nFittest Individual:")
-    print(*fittest_sudoku.board, sep="\n")
-    print("\nDone.")
-    return fittest_sudoku.board
+    profiler.finish()
+    result = termination.result(best, best_fitness, generation_count, stop_reason)
+    with profiler.phase("report"):
+        for reporter in reporters:
+            reporter.on_finish(result)
+    return result
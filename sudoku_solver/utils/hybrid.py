@@ -0,0 +1,72 @@
+"""Hybrid of the genetic algorithm and the exact solver for sudokus.
+
+Populations are seeded with digits which are candidates of their cells given
+the clues, i.e. digits not already placed in the cell's row, column or box.
+Near-solutions found by the genetic algorithm are finished exactly: the
+digits of all cells without conflicts are frozen and the remaining cells are
+solved by constraint propagation (see ``sudoku_solver.utils.propagate``).
+"""
+
+from functools import cache
+from math import isqrt
+from typing import List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from sudoku_solver.etc import config
+from sudoku_solver.utils import propagate, units
+
+
+class _Units(NamedTuple):
+    symbols: Set[int]
+    # cells of every unit and units of every cell of the flattened board
+    units: List[List[int]]
+    cell_units: List[Tuple[int, int, int]]
+
+
+@cache
+def _units(n_cells: int) -> _Units:
+    """Units of boards with given number of cells, e.g. 81."""
+    table = units.unit_table(isqrt(n_cells))
+    cell_units = [(row, table.size + col, 2 * table.size + box) for row, col, box in table.cell_units]
+    return _Units(set(table.symbols), table.units.tolist(), cell_units)
+
+
+def candidates(clues: Sequence[int], cells: Sequence[int]) -> List[List[int]]:
+    """Digits of each of the cells which are not excluded by the clues of their units."""
+    tables = _units(len(clues))
+    used = [{clues[cell] for cell in unit} for unit in tables.units]
+    return [
+        sorted(tables.symbols.difference(*(used[unit] for unit in tables.cell_units[cell])))
+        for cell in cells
+    ]
+
+
+def conflicting_cells(cells: Sequence[int], fixed: Sequence[int]) -> Set[int]:
+    """Cells, apart from fixed ones, whose digit occurs more than once in one of their units."""
+    conflicts = set()
+    for unit in _units(len(cells)).units:
+        digits = [cells[cell] for cell in unit]
+        conflicts.update(cell for cell, digit in zip(unit, digits) if digits.count(digit) > 1)
+    return conflicts.difference(fixed)
+
+
+def finish(board: List[List[int]], clues: Sequence[int]) -> Optional[List[List[int]]]:
+    """Solve the remainder of a near-solution exactly.
+
+    The clues and the digits of all cells without conflicts are kept and the
+    other cells are solved. If that fails, all cells sharing a unit with a
+    conflict are solved instead. Returns the solution or None.
+    """
+    size = len(board)
+    tables = _units(size * size)
+    cells = [digit for row in board for digit in row]
+    fixed = [cell for cell, clue in enumerate(clues) if clue != config.empty_cell_symbol]
+    conflicts = conflicting_cells(cells, fixed)
+    units_with_conflicts = {
+        cell for conflict in conflicts for unit in tables.cell_units[conflict] for cell in tables.units[unit]
+    }
+    for freed in (conflicts, units_with_conflicts.difference(fixed)):
+        partial = [config.empty_cell_symbol if cell in freed else digit for cell, digit in enumerate(cells)]
+        solution = [partial[size * row:size * (row + 1)] for row in range(size)]
+        if propagate.solve(solution):
+            return solution
+    return None
@@ -0,0 +1,175 @@
+"""Island model of the genetic algorithm for solving sudokus.
+
+Several sub-populations (islands) evolve independently in separate worker
+processes. Every few generations the fittest sudokus of each island migrate
+to another island, either along a ring or to a randomly chosen island. All
+islands stop as soon as any island finds a valid solution.
+"""
+
+import multiprocessing
+import queue
+from typing import List, Tuple
+
+import numpy as np
+
+from genetic_algorithm_starter_kit import selection
+from sudoku_solver.utils import evolve
+
+TOPOLOGIES = ("ring", "random")
+
+
+def _migrate(
+    population: List,
+    scores,
+    island: int,
+    inboxes: List[multiprocessing.Queue],
+    migration_size: int,
+    topology: str,
+    rng: np.random.Generator,
+):
+    """Send fittest sudokus to another island and let immigrants replace the least fit."""
+    n_islands = len(inboxes)
+    if topology == "ring":
+        target = (island + 1) % n_islands
+    else:
+        target = (island + int(rng.integers(1, n_islands))) % n_islands
+    inboxes[target].put([population[idx] for idx in selection.elite_indices(scores.total, migration_size)])
+
+    immigrants = []
+    while True:
+        try:
+            immigrants.extend(inboxes[island].get_nowait())
+        except queue.Empty:
+            break
+    immigrants = immigrants[:len(population) - migration_size]
+    if not immigrants:
+        return population, scores
+    population = population.copy()
+    for idx, immigrant in zip(selection.worst_indices(scores.total, len(immigrants)), immigrants):
+        population[idx] = immigrant
+    # immigrants arrive with their cached fitness scores
+    return population, evolve.score_population(population)
+
+
+def _run_island(
+    island: int,
+    template,
+    population_size: int,
+    lift_factor: float,
+    migration_size: int,
+    migration_interval: int,
+    topology: str,
+    selection_strategy: str,
+    inboxes: List[multiprocessing.Queue],
+    stop_event,
+    results: multiprocessing.Queue,
+    seed: np.random.SeedSequence,
+) -> None:
+    """Evolve a single island until any island finds a solution."""
+    # each island draws from its own stream spawned from the run's seed
+    rng = np.random.default_rng(seed)
+    select_parents = selection.get_strategy(selection_strategy)
+    population = type(template).create_population(template.board, population_size, rng)
+
+    generation_count = 1
+    scores = evolve.score_population(population)
+    while not stop_event.is_set():
+        if scores.total[fittest := np.argmax(scores.total)] >= 1.0:
+            stop_event.set()
+            results.put((island, generation_count, population[fittest].board))
+            break
+        if generation_count % migration_interval == 0:
+            population, scores = _migrate(
+                population, scores, island, inboxes, migration_size, topology, rng
+            )
+        population, scores = evolve.breed(population, scores, lift_factor, select_parents, rng)
+        generation_count += 1
+
+    # do not block process exit on migrants no island will receive anymore
+    for inbox in inboxes:
+        inbox.cancel_join_thread()
+
+
+def evolve_islands(
+    template,
+    n_islands: int,
+    population_size: int,
+    lift_factor: float,
+    migration_size: int,
+    migration_interval: int,
+    topology: str = "ring",
+    selection_strategy: str = "truncation",
+    seed: int = None,
+) -> Tuple[int, int, List[List[int]]]:
+    """Evolve islands of sudokus in separate processes towards a valid solution.
+
+    Parameters
+    ----------
+    template : RandomSudoku
+        Sudoku with empty cells from which the population of each island is
+        created.
+    n_islands : int
+        Number of islands, i.e. worker processes.
+    population_size : int
+        Size of the population of each island.
+    lift_factor : float
+        Factor of population containing the fittest sudokus that gets lifted,
+        i.e. copied, to the new generation.
+    migration_size : int
+        Number of fittest sudokus migrating from each island.
+    migration_interval : int
+        Number of generations between migrations.
+    topology : str, optional
+        Either "ring" to migrate to the next island or "random" to migrate to
+        a randomly chosen island. Default is "ring".
+    selection_strategy : str, optional
+        Name of the strategy selecting parents, see
+        ``genetic_algorithm_starter_kit.selection``. Default is "truncation".
+    seed : int, optional
+        Seed from which independent random number generators of the islands
+        are spawned.
+
+    Returns
+    -------
+    Tuple[int, int, List[List[int]]]
+        Island which found the solution, its generation count and the solution.
+    """
+    if topology not in TOPOLOGIES:
+        raise ValueError(f"Unknown topology: {topology}")
+    if n_islands < 2:
+        raise ValueError("Island model requires at least two islands.")
+    selection.get_strategy(selection_strategy)
+
+    seeds = np.random.SeedSequence(seed).spawn(n_islands)
+    context = multiprocessing.get_context()
+    inboxes = [context.Queue() for _ in range(n_islands)]
+    results = context.Queue()
+    stop_event = context.Event()
+    processes = [
+        context.Process(
+            target=_run_island,
+            args=(
+                island, template, population_size, lift_factor, migration_size,
+                migration_interval, topology, selection_strategy, inboxes, stop_event, results, seeds[island],
+            ),
+            daemon=True,
+        )
+        for island in range(n_islands)
+    ]
+    for process in processes:
+        process.start()
+    try:
+        while True:
+            try:
+                result = results.get(timeout=1)
+                break
+            except queue.Empty:
+                if not any(process.is_alive() for process in processes):
+                    raise RuntimeError("All islands terminated without finding a solution.")
+    finally:
+        stop_event.set()
+        for process in processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+    return result
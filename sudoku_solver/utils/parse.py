@@ -0,0 +1,32 @@
+"""Conversion of sudoku boards from and to single-line text format.
+
+A board is written as one line of 81 characters in row-major order where
+empty cells are written as 0 or '.'.
+"""
+
+from typing import List
+
+from sudoku_solver.etc import config
+
+_EMPTY_CHARS = {"0", "."}
+
+
+def parse_board(line: str) -> List[List[int]]:
+    """Parse board from line of 81 characters."""
+    line = line.strip()
+    if len(line) != 9 * 9:
+        raise ValueError(f"Expected 81 characters per sudoku, got {len(line)}: {line!r}")
+    digits = []
+    for char in line:
+        if char in _EMPTY_CHARS:
+            digits.append(config.empty_cell_symbol)
+        elif char.isdigit():
+            digits.append(int(char))
+        else:
+            raise ValueError(f"Invalid character {char!r} in sudoku: {line!r}")
+    return [digits[9 * row:9 * (row + 1)] for row in range(9)]
+
+
+def format_board(board: List[List[int]]) -> str:
+    """Format board as line of 81 characters."""
+    return "".join(str(digit) for row in board for digit in row)
@@ -0,0 +1,172 @@
+"""Exact sudoku solver based on constraint propagation.
+
+Digits used per row, column and box are kept as bitmasks which are updated
+incrementally with every assignment, so candidates of a cell are a couple of
+bit operations away. Naked and hidden singles are propagated, the search
+branches on the cell with the fewest candidates (minimum remaining values)
+and assignments are undone with a trail instead of rescanning the board.
+Bitmasks are Python integers, hence boards of any size are supported.
+"""
+
+from functools import cache
+from typing import Dict, List, NamedTuple, Tuple
+
+from sudoku_solver.etc import config
+from sudoku_solver.utils import units
+
+
+class _Tables(NamedTuple):
+    # bitmask of all digits
+    all_digits: int
+    # digit of every single-bit mask
+    digits: Dict[int, int]
+    # row, column and box of every cell of the flattened board
+    cell_units: Tuple[Tuple[int, int, int], ...]
+    units: List[List[int]]
+
+
+@cache
+def _tables(size: int) -> _Tables:
+    table = units.unit_table(size)
+    return _Tables(
+        sum(1 << digit for digit in table.symbols),
+        {1 << digit: digit for digit in table.symbols},
+        table.cell_units,
+        table.units.tolist(),
+    )
+
+
+class _Grid:
+    """Flattened sudoku board with incrementally updated digit bitmasks."""
+
+    __slots__ = ("size", "tables", "values", "rows", "cols", "boxes", "trail")
+
+    def __init__(self, size: int = 9) -> None:
+        self.size = size
+        self.tables = _tables(size)
+        self.values = [config.empty_cell_symbol] * (size * size)
+        self.rows = [0] * size
+        self.cols = [0] * size
+        self.boxes = [0] * size
+        self.trail = []
+
+    def candidates(self, cell: int) -> int:
+        """Bitmask of digits that can be placed in cell."""
+        row, col, box = self.tables.cell_units[cell]
+        return self.tables.all_digits & ~(self.rows[row] | self.cols[col] | self.boxes[box])
+
+    def assign(self, cell: int, digit: int) -> bool:
+        """Place digit in cell unless it conflicts with its row, column or box."""
+        row, col, box = self.tables.cell_units[cell]
+        bit = 1 << digit
+        if not bit & self.tables.all_digits or bit & (self.rows[row] | self.cols[col] | self.boxes[box]):
+            return False
+        self.values[cell] = digit
+        self.rows[row] |= bit
+        self.cols[col] |= bit
+        self.boxes[box] |= bit
+        self.trail.append(cell)
+        return True
+
+    def undo(self, mark: int) -> None:
+        """Undo all assignments made since trail had length mark."""
+        trail, values, cell_units = self.trail, self.values, self.tables.cell_units
+        while len(trail) > mark:
+            cell = trail.pop()
+            row, col, box = cell_units[cell]
+            bit = ~(1 << values[cell])
+            self.rows[row] &= bit
+            self.cols[col] &= bit
+            self.boxes[box] &= bit
+            values[cell] = config.empty_cell_symbol
+
+    def propagate(self) -> bool:
+        """Assign naked and hidden singles until none are left.
+
+        Returns False if a contradiction was found.
+        """
+        values, empty = self.values, config.empty_cell_symbol
+        rows, cols, boxes = self.rows, self.cols, self.boxes
+        all_digits, digit_of_bit = self.tables.all_digits, self.tables.digits
+        changed = True
+        while changed:
+            changed = False
+            # naked singles: cells with a single candidate
+            for cell, (row, col, box) in enumerate(self.tables.cell_units):
+                if values[cell] != empty:
+                    continue
+                candidates = all_digits & ~(rows[row] | cols[col] | boxes[box])
+                if not candidates:
+                    return False
+                if not candidates & (candidates - 1):
+                    self.assign(cell, digit_of_bit[candidates])
+                    changed = True
+            if changed:
+                continue
+            # hidden singles: digits with a single possible cell in a unit
+            for unit in self.tables.units:
+                used = once = twice = 0
+                for cell in unit:
+                    if values[cell] != empty:
+                        used |= 1 << values[cell]
+                    else:
+                        candidates = self.candidates(cell)
+                        twice |= once & candidates
+                        once |= candidates
+                if (used | once) & all_digits != all_digits:
+                    return False
+                singles = once & ~twice & ~used
+                if not singles:
+                    continue
+                for cell in unit:
+                    if values[cell] != empty or not (digits := self.candidates(cell) & singles):
+                        continue
+                    if digits & (digits - 1) or not self.assign(cell, digit_of_bit[digits]):
+                        return False
+                changed = True
+        return True
+
+    def search(self) -> bool:
+        """Search for a solution depth-first on the cell with fewest candidates."""
+        if not self.propagate():
+            return False
+        values, empty = self.values, config.empty_cell_symbol
+        best_cell, best_candidates, best_count = None, 0, self.size + 1
+        for cell in range(len(values)):
+            if values[cell] == empty:
+                candidates = self.candidates(cell)
+                if (count := candidates.bit_count()) < best_count:
+                    best_cell, best_candidates, best_count = cell, candidates, count
+                    if count == 2:
+                        break
+        # No empty cell left, sudoku is solved
+        if best_cell is None:
+            return True
+        mark = len(self.trail)
+        while best_candidates:
+            bit = best_candidates & -best_candidates
+            best_candidates ^= bit
+            self.assign(best_cell, self.tables.digits[bit])
+            if self.search():
+                return True
+            # Backtrack in case of inconsistency
+            self.undo(mark)
+        return False
+
+
+def solve(board: List[List[int]]) -> bool:
+    """Solve sudoku board in place with constraint propagation.
+
+    Boards of any size n² x n² are supported. Returns False and leaves the
+    board unchanged if the given clues conflict or the sudoku has no solution.
+    """
+    size = len(board)
+    grid = _Grid(size)
+    for cell, digit in enumerate(digit for row in board for digit in row):
+        if digit != config.empty_cell_symbol and not grid.assign(cell, digit):
+            return False
+    if not grid.search():
+        return False
+    for row in range(size):
+        board[row][:] = grid.values[size * row:size * (row + 1)]
+    return True
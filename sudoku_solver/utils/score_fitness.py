@@ -1,51 +1,209 @@
 """Fitness scoring functions of sudokus for solving via a genetic algorithm."""
 
+from __future__ import annotations
+
 from collections import Counter
-from typing import List
+from functools import cache
+from typing import Iterable, List, NamedTuple, Set, Tuple
+
+import numpy as np
 
 from sudoku_solver.etc import config
+from sudoku_solver.utils import units
+
+
+class Scores(NamedTuple):
+    """Fitness scores of a batch of sudoku boards."""
+
+    rows: np.ndarray
+    cols: np.ndarray
+    boxes: np.ndarray
+    total: np.ndarray
+
+    def take(self, indices) -> Scores:
+        """Select scores of boards at given indices."""
+        return Scores(*(scores[indices] for scores in self))
+
+    @staticmethod
+    def concatenate(*batches: Scores) -> Scores:
+        """Join scores of several batches of boards."""
+        return Scores(*(np.concatenate(scores) for scores in zip(*batches)))
+
+
+class UnitCounts:
+    """Digit counts of all rows, columns and boxes of a single sudoku board.
+
+    Fitness scores are kept up to date from a list of changed cells, where
+    each change only touches the three units of the cell. Cells are indexed
+    in row-major order, i.e. cell ``(row, col)`` has index ``size * row + col``.
+    """
+
+    __slots__ = ("size", "cells", "counts", "n_distinct", "_cell_units")
+
+    def __init__(self, board: List[List[int]]) -> None:
+        self.size = len(board)
+        self._cell_units = _cell_units(self.size)
+        self.cells = [digit for row in board for digit in row]
+        self.counts = bytearray(3 * self.size * (self.size + 1))
+        # number of distinct valid digits of all rows, columns and boxes
+        self.n_distinct = [0, 0, 0]
+        for cell, digit in enumerate(self.cells):
+            self._add(cell, digit)
+
+    def copy(self) -> UnitCounts:
+        """Copy counts, e.g. for offspring which differs in a few cells."""
+        unit_counts = UnitCounts.__new__(UnitCounts)
+        unit_counts.size = self.size
+        unit_counts._cell_units = self._cell_units
+        unit_counts.cells = self.cells.copy()
+        unit_counts.counts = self.counts.copy()
+        unit_counts.n_distinct = self.n_distinct.copy()
+        return unit_counts
+
+    def _add(self, cell: int, digit: int) -> None:
+        if not 0 < digit <= self.size:
+            return
+        for kind, offset in enumerate(self._cell_units[cell]):
+            if not self.counts[offset + digit]:
+                self.n_distinct[kind] += 1
+            self.counts[offset + digit] += 1
+
+    def _remove(self, cell: int, digit: int) -> None:
+        if not 0 < digit <= self.size:
+            return
+        for kind, offset in enumerate(self._cell_units[cell]):
+            self.counts[offset + digit] -= 1
+            if not self.counts[offset + digit]:
+                self.n_distinct[kind] -= 1
+
+    def update(self, changes: Iterable[Tuple[int, int]]) -> None:
+        """Update counts from changed cells given as (cell, new digit) pairs."""
+        for cell, digit in changes:
+            self._remove(cell, self.cells[cell])
+            self._add(cell, digit)
+            self.cells[cell] = digit
 
+    def fitness_scores(self, normalize: bool = True) -> Tuple[float, float, float]:
+        """Fitness scores for boxes, cols and rows."""
+        rows, cols, boxes = self.n_distinct
+        if normalize:
+            n_cells = self.size * self.size
+            return boxes / n_cells, cols / n_cells, rows / n_cells
+        return boxes, cols, rows
 
-def _score_list(list_: List[int]) -> int:
+
+@cache
+def _cell_units(size: int) -> Tuple[Tuple[int, int, int], ...]:
+    """Offsets of the digit counts of the units (row, column, box) of every cell."""
+    return tuple(
+        tuple((kind * size + unit) * (size + 1) for kind, unit in enumerate(cell_units))
+        for cell_units in units.unit_table(size).cell_units
+    )
+
+
+def _score_list(list_: List[int], symbols: Set[int] = config.allowed_symbols) -> int:
     """Count number of unique and valid elements in list."""
     counter = Counter(list_)
-    [counter.pop(x, None) for x in list_ if x not in config.allowed_symbols]
+    [counter.pop(x, None) for x in list_ if x not in symbols]
     return len(counter.keys())
 
 
 def score_boxes(board: List[List[int]], normalize: bool) -> int:
     """Compute fitness score of all boxes in sudoku board.
 
-    Maximum score is number of cells (81) and minimum score is 0.
+    Maximum score is number of cells (e.g. 81) and minimum score is 0.
     """
+    table = units.unit_table(len(board))
+    symbols, box_size = set(table.symbols), table.box_size
     scores = []
-    for box_num in range(9):
-        row, col = 3 * (box_num // 3), 3 * (box_num % 3)
-        box = [board[row + j][col:col + 3] for j in range(3)]
+    for box_num in range(table.size):
+        row, col = box_size * (box_num // box_size), box_size * (box_num % box_size)
+        box = [board[row + j][col:col + box_size] for j in range(box_size)]
         box_flattened = [item for row in box for item in row]
-        scores.append(_score_list(box_flattened))
+        scores.append(_score_list(box_flattened, symbols))
     if normalize:
-        return sum(scores) / (9 * 9)
+        return sum(scores) / (table.size * table.size)
     return sum(scores)
 
 
 def score_cols(board: List[List[int]], normalize: bool) -> int:
     """Compute fitness score of all columns in sudoku board.
 
-    Maximum score is number of cells (81) and minimum score is 0.
+    Maximum score is number of cells (e.g. 81) and minimum score is 0.
     """
-    score = sum([_score_list([row[i] for row in board]) for i in range(9)])
+    size = len(board)
+    symbols = set(units.unit_table(size).symbols)
+    score = sum([_score_list([row[i] for row in board], symbols) for i in range(size)])
     if normalize:
-        return score / (9 * 9)
+        return score / (size * size)
     return score
 
 
 def score_rows(board: List[List[int]], normalize: bool) -> int:
     """Compute fitness score of all rows in sudoku board.
 
-    Maximum score is number of cells (81) and minimum score is 0.
+    Maximum score is number of cells (e.g. 81) and minimum score is 0.
     """
-    score = sum([_score_list(row) for row in board])
+    size = len(board)
+    symbols = set(units.unit_table(size).symbols)
+    score = sum([_score_list(row, symbols) for row in board])
     if normalize:
-        return score / (9 * 9)
+        return score / (size * size)
     return score
+
+
+def score_many(boards: np.ndarray, normalize: bool = True, score_rows: bool = True) -> Scores:
+    """Compute fitness scores of a batch of sudoku boards at once.
+
+    Parameters
+    ----------
+    boards : np.ndarray
+        Integer array of shape (N, size, size) holding N sudoku boards, e.g.
+        (N, 9, 9).
+    normalize : bool, optional
+        Normalize scores by number of cells, e.g. 81. Default is True.
+    score_rows : bool, optional
+        Score rows, otherwise rows get the maximum score without being
+        looked at, e.g. rows of the permutation encoding. Default is True.
+
+    Returns
+    -------
+    Scores
+        Row, column and box scores per board as well as their mean (total),
+        each an array of shape (N,).
+    """
+    boards = np.asarray(boards, dtype=np.int64)
+    size = boards.shape[1]
+    table = units.unit_table(size)
+    first_kind = 0 if score_rows else 1
+    cells = boards.reshape(len(boards), size * size)[:, table.units[first_kind * size:]]
+    # set one bit per valid digit and count distinct digits per unit
+    valid = (cells > 0) & (cells <= size)
+    bits = table.symbol_bits[np.where(valid, cells, 0)]
+    counts = units.popcount(np.bitwise_or.reduce(bits, axis=2))
+    unit_scores = [counts[:, kind * size:(kind + 1) * size].sum(axis=1) for kind in range(3 - first_kind)]
+    if not score_rows:
+        unit_scores.insert(0, np.full(len(boards), size * size))
+    rows, cols, boxes = unit_scores
+    if normalize:
+        rows, cols, boxes = rows / (size * size), cols / (size * size), boxes / (size * size)
+    return Scores(rows=rows, cols=cols, boxes=boxes, total=(boxes + cols + rows) / 3)
+
+
+def score_components(boards: np.ndarray) -> np.ndarray:
+    """Box, column and row scores of a batch of sudoku boards as (N, 3) array.
+
+    A batch fitness function (see ``genetic_algorithm_starter_kit.fitness``)
+    of boards, e.g. for scoring in worker processes.
+    """
+    scores = score_many(boards)
+    return np.stack([scores.boxes, scores.cols, scores.rows], axis=1)
+
+
+def score_permutation_components(boards: np.ndarray) -> np.ndarray:
+    """Like ``score_components``, but for boards whose rows are permutations of all digits.
+
+    Only columns and boxes are scored, rows get the maximum score.
+    """
+    scores = score_many(boards, score_rows=False)
+    return np.stack([scores.boxes, scores.cols, scores.rows], axis=1)
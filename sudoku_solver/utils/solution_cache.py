@@ -0,0 +1,141 @@
+"""Cache of sudoku solutions shared by equivalent puzzles.
+
+Solutions are cached under the canonical form of their puzzle (see
+``sudoku_solver.utils.canonical``), so that a puzzle equivalent to one solved
+before is answered by mapping the cached canonical solution back with the
+inverse transform. Exact repeats are looked up without canonicalizing.
+
+The in-memory cache evicts the least recently used solutions. The optional
+on-disk cache is a fixed-size file of slots, each holding a canonical puzzle
+and its solution as 81 bytes each, which is memory-mapped and shared by
+subsequent runs. A puzzle's slot is given by a hash of its canonical form, a
+newer solution overwrites the one in its slot.
+"""
+
+import os
+import struct
+import zlib
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from genetic_algorithm_starter_kit.cache import CacheInfo, FitnessCache
+from sudoku_solver.utils import canonical, validate
+
+MAGIC = b"SDKSOL01"
+_HEADER_SIZE = 64
+_RECORD = np.dtype([("puzzle", np.uint8, 81), ("solution", np.uint8, 81)])
+
+
+def _key(board: Sequence[Sequence[int]]) -> bytes:
+    board = np.asarray(board, dtype=np.uint8)
+    if board.shape != (9, 9):
+        raise ValueError(f"Only 9x9 sudokus are cached, got a board of shape {board.shape}.")
+    return board.tobytes()
+
+
+def _board(key: bytes) -> List[List[int]]:
+    return np.frombuffer(key, dtype=np.uint8).reshape(9, 9).tolist()
+
+
+class _SlotFile:
+    """Memory-mapped file of a fixed number of (puzzle, solution) slots."""
+
+    def __init__(self, path: str, n_slots: int) -> None:
+        if not os.path.exists(path):
+            with open(path, "wb") as file:
+                header = MAGIC + struct.pack("<Q", n_slots)
+                file.write(header + b"\0" * (_HEADER_SIZE - len(header)))
+                file.truncate(_HEADER_SIZE + n_slots * _RECORD.itemsize)
+        with open(path, "rb") as file:
+            if file.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} is not a solution cache file.")
+            n_slots, = struct.unpack("<Q", file.read(8))
+        self.records = np.memmap(path, dtype=_RECORD, mode="r+", offset=_HEADER_SIZE, shape=(n_slots,))
+
+    def _slot(self, key: bytes) -> int:
+        return zlib.crc32(key) % len(self.records)
+
+    def get(self, key: bytes) -> Optional[bytes]:
+        record = self.records[self._slot(key)]
+        if record["puzzle"].tobytes() != key:
+            return None
+        return record["solution"].tobytes()
+
+    def put(self, key: bytes, solution: bytes) -> None:
+        self.records[self._slot(key)] = np.frombuffer(key + solution, dtype=_RECORD)[0]
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.records["puzzle"].any(axis=1)))
+
+
+class SolutionCache:
+    """Bounded cache of solutions keyed on canonical forms of puzzles.
+
+    Parameters
+    ----------
+    path : str, optional
+        File of the on-disk cache, created if it does not exist. By default
+        solutions are only cached in memory.
+    maxsize : int, optional
+        Maximum number of solutions in memory. Default is 10000.
+    disk_slots : int, optional
+        Number of slots of a newly created on-disk cache. Default is 2**20,
+        i.e. 162 MiB, allocated sparsely.
+    """
+
+    def __init__(self, path: str = None, maxsize: int = 10_000, disk_slots: int = 1 << 20) -> None:
+        if disk_slots < 1:
+            raise ValueError("On-disk cache needs at least one slot.")
+        # keyed on both puzzles and canonical puzzles
+        self._memory = FitnessCache(maxsize)
+        self._disk = None if path is None else _SlotFile(path, disk_slots)
+        self.hits = 0
+        self.misses = 0
+
+    def _canonical_solution(self, key: bytes) -> Optional[bytes]:
+        solution = self._memory.get(key)
+        if solution is None and self._disk is not None:
+            solution = self._disk.get(key)
+            if solution is not None:
+                self._memory.put(key, solution)
+        return solution
+
+    def get(self, board: Sequence[Sequence[int]]) -> Optional[List[List[int]]]:
+        """Cached solution of the puzzle or an equivalent one, None if there is none."""
+        # invalid puzzles, e.g. with symbols out of range, have no solution
+        if not validate.validate_many([board])[0]:
+            self.misses += 1
+            return None
+        key = _key(board)
+        solution = self._memory.get(key)
+        if solution is None and (form := canonical.canonicalize(board)) is not None:
+            canonical_board, transform = form
+            canonical_solution = self._canonical_solution(_key(canonical_board))
+            if canonical_solution is not None:
+                solution = _key(transform.invert(_board(canonical_solution)))
+                self._memory.put(key, solution)
+        if solution is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return _board(solution)
+
+    def put(self, board: Sequence[Sequence[int]], solution: Sequence[Sequence[int]]) -> None:
+        """Cache solution of the puzzle, which also solves all equivalent puzzles."""
+        self._memory.put(_key(board), _key(solution))
+        if (form := canonical.canonicalize(board)) is not None:
+            canonical_board, transform = form
+            key, canonical_solution = _key(canonical_board), _key(transform.apply(solution))
+            self._memory.put(key, canonical_solution)
+            if self._disk is not None:
+                self._disk.put(key, canonical_solution)
+
+    def flush(self) -> None:
+        """Write the on-disk cache to its file."""
+        if self._disk is not None:
+            self._disk.records.flush()
+
+    def info(self) -> CacheInfo:
+        """Hit and miss counters and number of entries in memory."""
+        return CacheInfo(self.hits, self.misses, self._memory.maxsize, len(self._memory))
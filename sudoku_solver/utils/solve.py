@@ -1,4 +1,5 @@
 from itertools import product
+from math import isqrt
 from typing import List
 
 from sudoku_solver.etc import config
@@ -6,23 +7,24 @@ from sudoku_solver.etc import config
 
 def _is_valid_row_update(board: List[List[int]], row: int, digit: int) -> bool:
     """Check for duplicate entry in row."""
-    return not any([board[row][i] == digit for i in range(9)])
+    return digit not in board[row]
 
 
 def _is_valid_col_update(board: List[List[int]], col: int, digit: int) -> bool:
     """Check for duplicate entry in column."""
-    return not any([board[i][col] == digit for i in range(9)])
+    return not any([board[i][col] == digit for i in range(len(board))])
 
 
 def _is_valid_box_update(board: List[List[int]], row: int, col: int, digit: int) -> bool:
     """Check for duplicate entry in box."""
-    row, col = 3 * (row // 3), 3 * (col // 3)
-    return not any([board[row + i][col + j] == digit for i, j in product(range(3), repeat=2)])
+    box_size = isqrt(len(board))
+    row, col = box_size * (row // box_size), box_size * (col // box_size)
+    return not any([digit in board[row + i][col:col + box_size] for i in range(box_size)])
 
 
 def get_empty_cell_coordinates(board: List[List[int]]) -> List[int]:
     """Return coordinates of empty cell."""
-    for row, col in product(range(9), repeat=2):
+    for row, col in product(range(len(board)), repeat=2):
         if board[row][col] == config.empty_cell_symbol:
             return row, col
     return None, None
@@ -0,0 +1,71 @@
+"""Precomputed index tables of the units (rows, columns, boxes) of a sudoku grid.
+
+Indices refer to cells of a board flattened in row-major order, i.e. cell
+``(row, col)`` has index ``size * row + col``. Boards of size n² x n², e.g.
+4x4, 9x9, 16x16 or 25x25, consist of n x n boxes and use the symbols 1 to n².
+The tables of a size are computed once (see ``unit_table``); the module
+constants are those of 9x9 boards.
+"""
+
+from functools import cache
+from math import isqrt
+from typing import NamedTuple, Tuple
+
+import numpy as np
+
+
+class UnitTable(NamedTuple):
+    """Units and symbols of boards of one size."""
+
+    size: int
+    box_size: int
+    # symbols 1 to size in ascending order
+    symbols: Tuple[int, ...]
+    rows: np.ndarray
+    cols: np.ndarray
+    boxes: np.ndarray
+    # all units stacked in the order rows, columns, boxes
+    units: np.ndarray
+    # row, column and box of every cell
+    cell_units: Tuple[Tuple[int, int, int], ...]
+    # bit of every symbol as 64-bit bitset, no bit for the empty cell symbol 0
+    symbol_bits: np.ndarray
+
+
+@cache
+def unit_table(size: int) -> UnitTable:
+    """Unit index tables of boards of given size, which must be a square number."""
+    box_size = isqrt(size)
+    if size < 1 or box_size * box_size != size:
+        raise ValueError(f"Sudokus of size {size} are not supported, size must be a square number.")
+    rows = np.arange(size * size).reshape(size, size)
+    rows.flags.writeable = False
+    cols = rows.T.copy()
+    boxes = rows.reshape(box_size, box_size, box_size, box_size).transpose(0, 2, 1, 3).reshape(size, size)
+    units = np.concatenate([rows, cols, boxes])
+    for table in (cols, boxes, units):
+        table.flags.writeable = False
+    cell_units = tuple(
+        (cell // size, cell % size, box_size * (cell // (size * box_size)) + (cell % size) // box_size)
+        for cell in range(size * size)
+    )
+    if size >= 64:
+        raise ValueError(f"Sudokus of size {size} are not supported, symbols must fit into 64-bit bitsets.")
+    symbol_bits = np.left_shift(np.uint64(1), np.arange(size + 1, dtype=np.uint64))
+    symbol_bits[0] = 0
+    symbol_bits.flags.writeable = False
+    return UnitTable(size, box_size, tuple(range(1, size + 1)), rows, cols, boxes, units, cell_units, symbol_bits)
+
+
+# Number of set bits of every byte
+_POPCOUNT = np.array([bin(byte).count("1") for byte in range(256)], dtype=np.uint8)
+
+
+def popcount(bitsets: np.ndarray) -> np.ndarray:
+    """Number of set bits of each 64-bit bitset."""
+    bitsets = np.ascontiguousarray(bitsets, dtype=np.uint64)
+    return _POPCOUNT[bitsets.view(np.uint8)].reshape(*bitsets.shape, 8).sum(axis=-1, dtype=np.int64)
+
+
+_TABLE = unit_table(9)
+ROWS, COLS, BOXES, UNITS = _TABLE.rows, _TABLE.cols, _TABLE.boxes, _TABLE.units
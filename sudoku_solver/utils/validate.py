@@ -1,10 +1,13 @@
 from collections import Counter
-from typing import List
+from typing import List, Set, Tuple, Union
+
+import numpy as np
 
 from sudoku_solver.etc import config
+from sudoku_solver.utils import units
 
 
-def _is_valid_list(list_: List[str or int]) -> bool:
+def _is_valid_list(list_: List[str or int], symbols: Set[int] = config.allowed_symbols) -> bool:
     """Check if list contains duplicates or invalid digits.
 
     Parameters
@@ -12,34 +15,95 @@ def _is_valid_list(list_: List[str or int]) -> bool:
     list_ :
         List to be checked for validity (no duplicates and only valid Sudoku
         entries).
-    empty_symbol :
-        Symbol specifying an empty cell in a Sudoku grid.
+    symbols :
+        Allowed symbols, by default those of 9x9 sudokus.
 
     """
     counter = Counter(list_)
     counter.pop(config.empty_cell_symbol, None)
     if set(counter.values()) not in [set(), {1}]:
         return False
-    return set([int(key) for key in counter.keys()]).issubset(config.allowed_symbols)
+    return set([int(key) for key in counter.keys()]).issubset(symbols)
+
+
+def _symbols(board: List[List[int]]) -> Set[int]:
+    """Allowed symbols of board, i.e. 1 to its size."""
+    return set(units.unit_table(len(board)).symbols)
 
 
 def are_valid_rows(board: List[List[int]]) -> bool:
     """Check sudoku's rows for validity according to rules."""
-    return all([_is_valid_list(row) for row in board])
+    symbols = _symbols(board)
+    return all([_is_valid_list(row, symbols) for row in board])
 
 
 def are_valid_cols(board: List[List[int]]) -> bool:
     """Check sudoku's columns for validity according to rules."""
-    return all([_is_valid_list([row[i] for row in board])
-                for i in range(9)])
+    symbols = _symbols(board)
+    return all([_is_valid_list([row[i] for row in board], symbols)
+                for i in range(len(board))])
 
 
 def are_valid_boxes(board: List[List[int]]) -> bool:
-    """Check sudoku's 3x3 sub-boxes for validity according to rules."""
+    """Check sudoku's sub-boxes, e.g. 3x3 of a 9x9 sudoku, for validity according to rules."""
+    symbols = _symbols(board)
+    box_size = units.unit_table(len(board)).box_size
     flags = []
-    for box_num in range(9):
-        row, col = 3 * (box_num // 3), 3 * (box_num % 3)
-        box = [board[row + j][col:col + 3] for j in range(3)]
+    for box_num in range(len(board)):
+        row, col = box_size * (box_num // box_size), box_size * (box_num % box_size)
+        box = [board[row + j][col:col + box_size] for j in range(box_size)]
         box_flattened = [item for row in box for item in row]
-        flags.append(_is_valid_list(box_flattened))
+        flags.append(_is_valid_list(box_flattened, symbols))
     return all(flags)
+
+
+def validate_many(
+    boards: np.ndarray, return_conflicts: bool = False
+) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+    """Check a batch of sudoku boards for validity according to rules.
+
+    A board is valid if and only if its rows, columns and boxes are valid,
+    i.e. the results agree with ``are_valid_rows``, ``are_valid_cols`` and
+    ``are_valid_boxes``. Units are checked at once: a unit has no duplicates
+    if the bitmask of its symbols has as many set bits as it has filled
+    cells.
+
+    Parameters
+    ----------
+    boards : np.ndarray
+        Integer array of shape (N, size, size), e.g. (N, 9, 9).
+    return_conflicts : bool, optional
+        Whether to return which units are invalid as well.
+
+    Returns
+    -------
+    np.ndarray or Tuple[np.ndarray, np.ndarray]
+        Boolean array of shape (N,) whether each board is valid, and if
+        ``return_conflicts`` a boolean array of shape (N, 3 * size) whether
+        each unit is invalid, in the order of ``units.unit_table`` (rows,
+        columns, boxes). Without conflicts, boards with invalid symbols are not
+        checked for duplicates.
+    """
+    boards = np.asarray(boards)
+    if boards.ndim != 3 or boards.shape[1] != boards.shape[2]:
+        raise ValueError(f"Expected boards of shape (N, size, size), got {boards.shape}.")
+    if boards.size and not np.issubdtype(boards.dtype, np.integer):
+        raise ValueError(f"Expected integer boards, got {boards.dtype}.")
+    table = units.unit_table(boards.shape[1])
+    cells = boards.reshape(len(boards), table.size * table.size)
+
+    # invalid symbols are cheap to find and already decide the boards they occur in
+    symbols = cells.astype(np.intp, copy=False)
+    in_range = (symbols >= 0) & (symbols < len(table.symbol_bits))
+    bits = table.symbol_bits[np.where(in_range, symbols, 0)]
+    invalid_symbols = ~in_range | ((bits == 0) & (symbols != config.empty_cell_symbol))
+    conflicts = invalid_symbols[:, table.units].any(axis=2)
+    checked = slice(None) if return_conflicts else ~conflicts.any(axis=1)
+
+    # a unit has duplicates if its bitmask has fewer set bits than filled cells
+    unit_bits = bits[checked][:, table.units]
+    masks = np.bitwise_or.reduce(unit_bits, axis=2)
+    conflicts[checked] |= units.popcount(masks) != np.count_nonzero(unit_bits, axis=2)
+
+    valid = ~conflicts.any(axis=1)
+    return (valid, conflicts) if return_conflicts else valid
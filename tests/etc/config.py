@@ -21,3 +21,55 @@ solved_board = [
     [2, 8, 7, 4, 1, 9, 6, 3, 5],
     [3, 4, 5, 2, 8, 6, 1, 7, 9]
 ]
+
+# Solved board with both diagonals blanked, which the genetic algorithm solves quickly
+almost_solved_board = [
+    [0, 3, 4, 6, 7, 8, 9, 1, 0],
+    [6, 0, 2, 1, 9, 5, 3, 0, 8],
+    [1, 9, 0, 3, 4, 2, 0, 6, 7],
+    [8, 5, 9, 0, 6, 0, 4, 2, 3],
+    [4, 2, 6, 8, 0, 3, 7, 9, 1],
+    [7, 1, 3, 0, 2, 0, 8, 5, 6],
+    [9, 6, 0, 5, 3, 7, 0, 8, 4],
+    [2, 0, 7, 4, 1, 9, 6, 0, 5],
+    [0, 4, 5, 2, 8, 6, 1, 7, 0]
+]
+
+# Minimal puzzle with 17 clues and its solution
+hard_starting_position = [
+    [0, 0, 0, 0, 0, 0, 0, 1, 0],
+    [4, 0, 0, 0, 0, 0, 0, 0, 0],
+    [0, 2, 0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 0, 5, 0, 4, 0, 7],
+    [0, 0, 8, 0, 0, 0, 3, 0, 0],
+    [0, 0, 1, 0, 9, 0, 0, 0, 0],
+    [3, 0, 0, 4, 0, 0, 2, 0, 0],
+    [0, 5, 0, 1, 0, 0, 0, 0, 0],
+    [0, 0, 0, 8, 0, 6, 0, 0, 0]
+]
+
+hard_solved_board = [
+    [6, 9, 3, 7, 8, 4, 5, 1, 2],
+    [4, 8, 7, 5, 1, 2, 9, 3, 6],
+    [1, 2, 5, 9, 6, 3, 8, 7, 4],
+    [9, 3, 2, 6, 5, 1, 4, 8, 7],
+    [5, 6, 8, 2, 4, 7, 3, 9, 1],
+    [7, 4, 1, 3, 9, 8, 6, 2, 5],
+    [3, 1, 9, 4, 7, 5, 2, 6, 8],
+    [8, 5, 6, 1, 2, 9, 7, 4, 3],
+    [2, 7, 4, 8, 3, 6, 1, 5, 9]
+]
+
+small_starting_position = [
+    [1, 0, 0, 4],
+    [0, 4, 1, 0],
+    [2, 0, 4, 0],
+    [0, 3, 0, 1]
+]
+
+small_solved_board = [
+    [1, 2, 3, 4],
+    [3, 4, 1, 2],
+    [2, 1, 4, 3],
+    [4, 3, 2, 1]
+]
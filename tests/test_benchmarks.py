@@ -0,0 +1,32 @@
+import unittest
+
+from benchmarks import bench
+
+
+class TestBenchmarks(unittest.TestCase):
+
+    baseline = {
+        "solve": bench._metric(1.0, "s"),
+        "generations_per_second": bench._metric(100.0, "1/s", higher_is_better=True),
+    }
+
+    def test_no_regression(self):
+        results = {
+            "solve": bench._metric(1.2, "s"),
+            "generations_per_second": bench._metric(80.0, "1/s", higher_is_better=True),
+            "new_benchmark": bench._metric(5.0, "s"),
+        }
+        self.assertEqual(bench.compare(results, self.baseline, tolerance=0.5), [])
+
+    def test_regression(self):
+        results = {
+            "solve": bench._metric(2.0, "s"),
+            "generations_per_second": bench._metric(40.0, "1/s", higher_is_better=True),
+        }
+        regressions = bench.compare(results, self.baseline, tolerance=0.5)
+        self.assertEqual(len(regressions), 2)
+        self.assertTrue(regressions[0].startswith("solve"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import contextlib
+import io
+import unittest
+
+import numpy as np
+
+from genetic_algorithm_starter_kit.cache import CachedFitness, FitnessCache
+from genetic_algorithm_starter_kit.core import (Organism, Population,
+                                                VectorizedPopulation)
+from sudoku_solver.sudoku import RandomSudoku, Sudoku
+from sudoku_solver.utils import evolve
+from tests.etc import config
+
+
+class TestFitnessCache(unittest.TestCase):
+
+    def test_lru_eviction(self):
+        cache = FitnessCache(maxsize=2)
+        cache.put(b"a", 0.1)
+        cache.put(b"b", 0.2)
+        self.assertEqual(cache.get(b"a"), 0.1)
+        cache.put(b"c", 0.3)
+        self.assertIn(b"a", cache)
+        self.assertNotIn(b"b", cache)
+        self.assertIsNone(cache.get(b"b"))
+        self.assertEqual(cache.info(), (1, 1, 2, 2))
+        cache.clear()
+        self.assertEqual(cache.info(), (0, 0, 2, 0))
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            FitnessCache(maxsize=0)
+
+    def test_cached_fitness(self):
+        calls = []
+
+        def fitness(genomes):
+            calls.append(len(genomes))
+            return genomes.sum(axis=1) / 10
+
+        cached = CachedFitness(fitness, FitnessCache())
+        genomes = np.array([[1, 2], [3, 4], [1, 2]], dtype=np.uint8)
+        np.testing.assert_array_equal(cached(genomes), [0.3, 0.7, 0.3])
+        np.testing.assert_array_equal(cached(genomes[::-1]), [0.3, 0.7, 0.3])
+        self.assertEqual(calls, [2])
+        self.assertEqual(cached.cache.hits, 3)
+
+
+class TestPopulationCache(unittest.TestCase):
+
+    target_chromosome = "Hello, cache!"
+
+    def test_population(self):
+        population = Population(100, self.target_chromosome, cache=FitnessCache())
+        with contextlib.redirect_stdout(io.StringIO()):
+            population.evolve(verbose=False)
+        self.assertGreater(population.cache.misses, 0)
+        individual = population.individuals[0]
+        self.assertEqual(population.cache.get(Organism.encode(individual.chromosome).tobytes()),
+                         population.fitness_score(individual))
+
+    def test_vectorized_population(self):
+        cached = VectorizedPopulation(200, self.target_chromosome, seed=0, cache=FitnessCache(maxsize=10))
+        reference = VectorizedPopulation(200, self.target_chromosome, seed=0)
+        np.testing.assert_array_equal(cached.fitness_scores(), reference.fitness_scores())
+        self.assertEqual(len(cached.cache), 10)
+
+
+class TestSudokuCache(unittest.TestCase):
+
+    def test_score_population(self):
+        population = [RandomSudoku(config.valid_starting_position) for _ in range(5)]
+        for sudoku in population:
+            sudoku.fill_empty_cells()
+        population.append(population[0].mutate([]))
+        cache = FitnessCache()
+        scores = evolve.score_population(population, cache)
+        self.assertEqual(len(cache), len({bytes(sudoku.genes) for sudoku in population}))
+        for sudoku in population:
+            sudoku.invalidate_fitness()
+        np.testing.assert_array_equal(evolve.score_population(population, cache).total, scores.total)
+        self.assertEqual(cache.hits, len(population))
+
+    def test_evolve(self):
+        sudoku = Sudoku(config.almost_solved_board)
+        cache = FitnessCache()
+        with contextlib.redirect_stdout(io.StringIO()):
+            sudoku.evolve(100, verbose=False, encoding="permutation", cache=cache)
+        self.assertEqual(sudoku.board, config.solved_board)
+        self.assertGreater(cache.misses, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
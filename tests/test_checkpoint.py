@@ -0,0 +1,159 @@
+import contextlib
+import io
+import os
+import random
+import tempfile
+import unittest
+
+import numpy as np
+
+from genetic_algorithm_starter_kit import checkpoint
+from genetic_algorithm_starter_kit.core import Population, VectorizedPopulation
+from genetic_algorithm_starter_kit.reporting import PrintReporter
+from genetic_algorithm_starter_kit.termination import Restart, Termination
+from sudoku_solver.sudoku import Sudoku
+from tests.etc import config
+
+
+class TestCheckpointFile(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "population.ckpt")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_save_load(self):
+        genomes = np.arange(30, dtype=np.uint8).reshape(3, 10)
+        scores = np.array([0.1, 0.2, 0.3])
+        checkpoint.save(self.path, {"generation": 7}, genomes=genomes, scores=scores, empty=np.empty((0, 4)))
+        state, arrays = checkpoint.load(self.path)
+        self.assertEqual(state, {"generation": 7})
+        np.testing.assert_array_equal(arrays["genomes"], genomes)
+        np.testing.assert_array_equal(arrays["scores"], scores)
+        self.assertEqual(arrays["empty"].shape, (0, 4))
+        self.assertFalse(os.path.exists(f"{self.path}.tmp"))
+
+    def test_invalid_file(self):
+        with open(self.path, "wb") as file:
+            file.write(b"not a checkpoint")
+        with self.assertRaises(ValueError):
+            checkpoint.load(self.path)
+
+    def test_random_state(self):
+        rng = np.random.default_rng(0)
+        state = checkpoint.random_state(rng)
+        expected = rng.random(5)
+        checkpoint.save(self.path, state)
+        random.seed(0)
+        global_state = random.getstate()
+        restored = checkpoint.restore_random_state(checkpoint.load(self.path)[0])
+        self.assertEqual(list(restored.random(5)), list(expected))
+        # the random module is not part of a checkpoint
+        self.assertEqual(random.getstate(), global_state)
+
+
+class TestResume(unittest.TestCase):
+
+    target_chromosome = "Resume, deterministically!"
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "population.ckpt")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    @staticmethod
+    def _evolve(population, **kwargs):
+        """Evolve population and return its printed generations."""
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            population.evolve(reporters=[PrintReporter()], **kwargs)
+        return output.getvalue().splitlines()
+
+    def test_vectorized_population(self):
+        population = VectorizedPopulation(300, self.target_chromosome, seed=0)
+        generations = self._evolve(population, checkpoint_path=self.path, checkpoint_interval=5)
+        resumed = VectorizedPopulation.resume(self.path)
+        resumed_generations = self._evolve(resumed)
+        self.assertEqual(resumed_generations, generations[-len(resumed_generations):])
+        np.testing.assert_array_equal(resumed.genomes, population.genomes)
+
+    def test_population(self):
+        population = Population(100, self.target_chromosome)
+        generations = self._evolve(population, checkpoint_path=self.path, checkpoint_interval=5)
+        resumed_generations = self._evolve(Population.resume(self.path))
+        self.assertEqual(resumed_generations, generations[-len(resumed_generations):])
+
+    def test_sudoku(self):
+        generations = self._evolve(Sudoku(config.almost_solved_board), population_size=100, checkpoint_path=self.path,
+                                   checkpoint_interval=1)
+        sudoku = Sudoku(config.almost_solved_board)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            sudoku.resume_evolve(self.path, reporters=[PrintReporter()])
+        resumed_generations = output.getvalue().splitlines()
+        self.assertEqual(resumed_generations, generations[-len(resumed_generations):])
+        self.assertEqual(sudoku.board, config.solved_board)
+
+    def test_sudoku_steady_state(self):
+        generations = self._evolve(Sudoku(config.almost_solved_board), population_size=100, checkpoint_path=self.path,
+                                   checkpoint_interval=1, steady_state=20, seed=0)
+        sudoku = Sudoku(config.almost_solved_board)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            sudoku.resume_evolve(self.path, reporters=[PrintReporter()])
+        resumed_generations = output.getvalue().splitlines()
+        self.assertGreater(len(resumed_generations), 3)
+        self.assertEqual(resumed_generations, generations[-len(resumed_generations):])
+        self.assertEqual(sudoku.board, config.solved_board)
+
+    def test_resume_across_restart(self):
+        """ Resumed runs continue with the restarts and escalated mutation rate of the saved run. """
+        def termination():
+            return Termination(max_generations=60, stagnation_window=3, restart=Restart())
+
+        runs = [
+            (lambda **kwargs: Population(50, self.target_chromosome, seed=1).evolve(**kwargs), Population.resume),
+            (lambda **kwargs: VectorizedPopulation(50, self.target_chromosome, seed=1).evolve(**kwargs),
+             VectorizedPopulation.resume),
+            (lambda **kwargs: Sudoku(config.hard_starting_position).evolve(50, seed=1, **kwargs),
+             lambda path: Sudoku(config.hard_starting_position)),
+        ]
+        for evolve, resume in runs:
+            with contextlib.redirect_stdout(io.StringIO()):
+                result = evolve(verbose=False, termination=termination(), checkpoint_path=self.path,
+                                checkpoint_interval=25)
+                resumed = resume(self.path)
+                if isinstance(resumed, Sudoku):
+                    resumed_result = resumed.resume_evolve(self.path, verbose=False, termination=termination())
+                else:
+                    resumed_result = resumed.evolve(verbose=False, termination=termination())
+            self.assertGreater(result.restarts, 0)
+            self.assertEqual(resumed_result._replace(elapsed=0), result._replace(elapsed=0))
+
+    def test_sudoku_hybrid(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = Sudoku(config.hard_starting_position).evolve(
+                100, seed=0, hybrid_threshold=0.8, checkpoint_path=self.path, checkpoint_interval=1, verbose=False
+            )
+        state, _ = checkpoint.load(self.path)
+        self.assertEqual((state["hybrid_threshold"], state["candidates"]), (0.8, True))
+        sudoku = Sudoku(config.hard_starting_position)
+        with contextlib.redirect_stdout(io.StringIO()):
+            resumed_result = sudoku.resume_evolve(self.path, verbose=False, workers=2)
+        # the resumed run finishes the near-solution with the exact solver, too
+        self.assertEqual(resumed_result._replace(elapsed=0), result._replace(elapsed=0))
+        self.assertTrue(resumed_result.solved)
+
+    def test_resume_different_sudoku(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            Sudoku(config.almost_solved_board).evolve(100, checkpoint_path=self.path, checkpoint_interval=1)
+        with self.assertRaises(ValueError):
+            Sudoku(config.valid_starting_position).resume_evolve(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
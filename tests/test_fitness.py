@@ -0,0 +1,94 @@
+import contextlib
+import io
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from genetic_algorithm_starter_kit import fitness
+from genetic_algorithm_starter_kit.core import (Individual, Organism,
+                                                Population,
+                                                VectorizedPopulation)
+
+
+def count_a(chromosome):
+    return chromosome.count("a") / len(chromosome)
+
+
+def batch_count_a(genomes):
+    return (genomes == Organism.encode("a")[0]).mean(axis=1)
+
+
+class AIndividual(Individual):
+
+    batch_fitness = staticmethod(batch_count_a)
+
+
+class TestFitnessFunctions(unittest.TestCase):
+
+    genomes = np.random.default_rng(0).integers(0, len(Organism.GENES), (20, 8), dtype=np.uint8)
+
+    def test_target_match(self):
+        target = Organism.encode("abcdefgh")
+        genomes = np.stack([target, Organism.encode("abcdxxxx")])
+        np.testing.assert_array_equal(fitness.TargetMatch(target)(genomes), [1.0, 0.5])
+
+    def test_per_individual(self):
+        expected = batch_count_a(self.genomes)
+        np.testing.assert_array_equal(fitness.PerIndividual(count_a, Organism.decode)(self.genomes), expected)
+        with ThreadPoolExecutor(2) as executor:
+            per_individual = fitness.PerIndividual(count_a, Organism.decode, executor)
+            np.testing.assert_array_equal(per_individual(self.genomes), expected)
+
+    def test_chunked(self):
+        with ThreadPoolExecutor(2) as executor:
+            chunked = fitness.Chunked(batch_count_a, executor, n_chunks=3)
+            np.testing.assert_array_equal(chunked(self.genomes), batch_count_a(self.genomes))
+            self.assertEqual(len(chunked(self.genomes[:0])), 0)
+
+    def test_invalid_chunks(self):
+        with self.assertRaises(ValueError):
+            fitness.Chunked(batch_count_a, None, n_chunks=0)
+        with self.assertRaises(ValueError):
+            fitness.PerIndividual(count_a, Organism.decode, chunksize=0)
+
+
+class TestPopulationFitness(unittest.TestCase):
+
+    def test_batch_fitness_scores(self):
+        population = Population(20, fitness=batch_count_a, chromosome_length=6)
+        scores = population._fitness_scores(population.individuals)
+        self.assertEqual(scores, [count_a(individual.chromosome) for individual in population.individuals])
+        individual = population.individuals[0]
+        self.assertEqual(population.fitness_score(individual), count_a(individual.chromosome))
+
+    def test_mutate_rescores_custom_fitness(self):
+        population = Population(1, fitness=batch_count_a, chromosome_length=4)
+        individual = Individual("abcd")
+        population._fitness_scores([individual])
+        child = population.mutate(individual, {1: "a"})
+        self.assertIsNone(child.fitness)
+        self.assertEqual(population._fitness_scores([child]), [0.5])
+
+    def test_organism_batch_fitness(self):
+        population = Population(100, organism=AIndividual, chromosome_length=5)
+        with contextlib.redirect_stdout(io.StringIO()):
+            population.evolve(verbose=False)
+        self.assertTrue(all(isinstance(individual, AIndividual) for individual in population.individuals))
+
+    def test_evolve_without_fitness(self):
+        with self.assertRaises(ValueError):
+            Population(10).evolve()
+
+    def test_vectorized_fitness(self):
+        with ThreadPoolExecutor(2) as executor:
+            per_individual = fitness.PerIndividual(count_a, Organism.decode, executor)
+            population = VectorizedPopulation(500, seed=0, fitness=per_individual, chromosome_length=10)
+            self.assertEqual(population.genomes.shape, (500, 10))
+            with contextlib.redirect_stdout(io.StringIO()):
+                population.evolve(verbose=False)
+        self.assertEqual(population.individuals[0].chromosome, "a" * 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
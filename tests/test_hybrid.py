@@ -0,0 +1,74 @@
+import contextlib
+import copy
+import io
+import unittest
+
+import numpy as np
+
+from sudoku_solver.sudoku import PermutationSudoku, RandomSudoku, Sudoku
+from sudoku_solver.utils import hybrid
+from tests.etc import config
+
+
+def flatten(board):
+    return [digit for row in board for digit in row]
+
+
+class TestHybrid(unittest.TestCase):
+
+    def setUp(self):
+        self.clues = flatten(config.hard_starting_position)
+        self.solution = flatten(config.hard_solved_board)
+        self.empty_cells = [cell for cell, clue in enumerate(self.clues) if clue == 0]
+
+    def test_candidates(self):
+        for cell, digits in zip(self.empty_cells, hybrid.candidates(self.clues, self.empty_cells)):
+            self.assertIn(self.solution[cell], digits)
+            row, col = divmod(cell, 9)
+            self.assertFalse(set(digits) & set(config.hard_starting_position[row]))
+            self.assertFalse(set(digits) & {config.hard_starting_position[r][col] for r in range(9)})
+
+    def test_conflicting_cells(self):
+        cells = list(self.solution)
+        self.assertEqual(hybrid.conflicting_cells(cells, []), set())
+        cells[self.empty_cells[0]] = cells[self.empty_cells[1]]
+        conflicts = hybrid.conflicting_cells(cells, [])
+        self.assertIn(self.empty_cells[0], conflicts)
+        self.assertNotIn(self.empty_cells[0], hybrid.conflicting_cells(cells, [self.empty_cells[0]]))
+
+    def test_finish(self):
+        board = copy.deepcopy(config.hard_solved_board)
+        # swap digits of two empty cells of the first row
+        (row, col_a), (_, col_b) = [divmod(cell, 9) for cell in self.empty_cells[:2]]
+        board[row][col_a], board[row][col_b] = board[row][col_b], board[row][col_a]
+        self.assertEqual(hybrid.finish(board, self.clues), config.hard_solved_board)
+
+    def test_finish_unsolvable(self):
+        clues = list(self.clues)
+        clues[self.empty_cells[0]] = clues[self.empty_cells[1]] = 9
+        board = [clues[9 * row:9 * (row + 1)] for row in range(9)]
+        self.assertIsNone(hybrid.finish(board, clues))
+
+    def test_candidate_population(self):
+        candidates = hybrid.candidates(self.clues, self.empty_cells)
+        for cls in [RandomSudoku, PermutationSudoku]:
+            population = cls.create_population(config.hard_starting_position, 20, np.random.default_rng(0), True)
+            for sudoku in population:
+                cells = flatten(sudoku.board)
+                if cls is RandomSudoku:
+                    self.assertTrue(all(cells[cell] in digits for cell, digits in zip(self.empty_cells, candidates)))
+                else:
+                    self.assertTrue(all(sorted(row) == list(range(1, 10)) for row in sudoku.board))
+                self.assertTrue(all(cells[cell] == self.clues[cell] for cell in range(81) if self.clues[cell]))
+
+    def test_hybrid_evolve(self):
+        for encoding in ["uniform", "permutation"]:
+            sudoku = Sudoku(copy.deepcopy(config.hard_starting_position))
+            with contextlib.redirect_stdout(io.StringIO()):
+                result = sudoku.evolve(200, encoding=encoding, seed=0, hybrid_threshold=0.8)
+            self.assertTrue(result.solved)
+            self.assertEqual(sudoku.board, config.hard_solved_board)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import copy
+import unittest
+
+import numpy as np
+
+from genetic_algorithm_starter_kit.core import Organism, VectorizedPopulation
+from genetic_algorithm_starter_kit.fitness import TargetMatch
+from genetic_algorithm_starter_kit.parallel import SharedMemoryFitness
+from sudoku_solver.sudoku import RandomSudoku, Sudoku
+from sudoku_solver.utils import evolve, score_fitness
+from tests.etc import config
+
+
+def failing_fitness(genomes):
+    raise RuntimeError("Scoring failed.")
+
+
+class TestSharedMemoryFitness(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.fitness = TargetMatch(rng.integers(0, len(Organism.GENES), 16))
+        self.genomes = rng.integers(0, len(Organism.GENES), (500, 16), dtype=np.uint8)
+
+    def test_scores_match(self):
+        with SharedMemoryFitness(self.fitness, workers=2, min_batch_size=8) as fitness:
+            for genomes in (self.genomes, self.genomes[:9], np.tile(self.genomes, (3, 1)), self.genomes[:3]):
+                np.testing.assert_array_equal(fitness(genomes), self.fitness(genomes))
+
+    def test_score_shape(self):
+        board = copy.deepcopy(config.valid_starting_position)
+        boards = np.stack([evolve.stack_boards(RandomSudoku.create_population(board, 20, seed))
+                           for seed in range(2)]).reshape(-1, 9, 9)
+        with SharedMemoryFitness(score_fitness.score_components, workers=2, min_batch_size=1,
+                                 score_shape=(3,)) as fitness:
+            np.testing.assert_array_equal(fitness(boards), score_fitness.score_components(boards))
+
+    def test_single_process_fallback(self):
+        with SharedMemoryFitness(self.fitness, workers=1, min_batch_size=1) as fitness:
+            np.testing.assert_array_equal(fitness(self.genomes), self.fitness(self.genomes))
+            self.assertFalse(fitness.parallel)
+            self.assertIsNone(fitness._executor)
+
+    def test_worker_errors(self):
+        with SharedMemoryFitness(failing_fitness, workers=2, min_batch_size=1) as fitness:
+            with self.assertRaises(RuntimeError):
+                fitness(self.genomes)
+
+    def test_invalid_workers(self):
+        with self.assertRaises(ValueError):
+            SharedMemoryFitness(self.fitness, workers=0)
+
+    def test_vectorized_population(self):
+        target = "Hello World!"
+        results = []
+        for workers in (1, 2):
+            with SharedMemoryFitness(TargetMatch(Organism.encode(target)), workers, min_batch_size=8) as fitness:
+                results.append(VectorizedPopulation(100, target, seed=0, fitness=fitness).evolve(reporters=()))
+        self.assertEqual(results[0][:4], results[1][:4])
+
+    def test_sudoku_evolve(self):
+        results = [
+            Sudoku(config.almost_solved_board).evolve(300, seed=0, reporters=(), workers=workers)
+            for workers in (None, 2)
+        ]
+        self.assertEqual(results[0][:4], results[1][:4])
+        self.assertEqual(results[1].best, config.solved_board)
+
+
+if __name__ == '__main__':
+    unittest.main()
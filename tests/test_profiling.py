@@ -0,0 +1,70 @@
+import json
+import os
+import pstats
+import tempfile
+import tracemalloc
+import unittest
+
+from genetic_algorithm_starter_kit.core import Population, VectorizedPopulation
+from genetic_algorithm_starter_kit.profiling import NULL_PROFILER, Profiler
+from sudoku_solver.sudoku import Sudoku
+from tests.etc import config
+
+
+class TestProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_phases(self):
+        for population_class in (Population, VectorizedPopulation):
+            profiler = Profiler()
+            result = population_class(50, "Hello", seed=0).evolve(reporters=(), profiler=profiler)
+            report = profiler.report()
+            phases = dict(zip(report.phases["phase"], report.phases["calls"]))
+            self.assertLessEqual({"score", "select", "reproduce"}, set(phases))
+            self.assertEqual(phases["reproduce"], result.generations - 1)
+            self.assertEqual(report.generations["generation"].tolist(), list(range(1, result.generations + 1)))
+            self.assertTrue((report.generations["seconds"] > 0).all())
+            self.assertIn("reproduce", report.format())
+
+    def test_sudoku_phases(self):
+        profiler = Profiler()
+        Sudoku(config.almost_solved_board).evolve(100, seed=0, reporters=(), profiler=profiler)
+        self.assertIn("init", profiler.report().phases["phase"])
+
+    def test_allocations(self):
+        with Profiler(trace_allocations=True) as profiler:
+            Population(50, "Hello", seed=0).evolve(reporters=(), profiler=profiler)
+        self.assertFalse(tracemalloc.is_tracing())
+        generations = profiler.report().generations
+        self.assertTrue((generations["peak"] > 0).any())
+
+    def test_dump(self):
+        stats_path = os.path.join(self.tmp_dir.name, "evolve.pstats")
+        trace_path = os.path.join(self.tmp_dir.name, "evolve.json")
+        with Profiler(cprofile=True, trace_events=True) as profiler:
+            Population(50, "Hello", seed=0).evolve(reporters=(), profiler=profiler)
+        profiler.dump_stats(stats_path)
+        self.assertGreater(pstats.Stats(stats_path).total_calls, 0)
+        profiler.dump_trace(trace_path)
+        with open(trace_path) as file:
+            events = json.load(file)["traceEvents"]
+        self.assertIn("score", {event["name"] for event in events})
+        self.assertTrue(all(event["ph"] == "X" and event["dur"] >= 0 for event in events))
+
+    def test_disabled(self):
+        with self.assertRaises(ValueError):
+            Profiler().dump_stats(os.path.join(self.tmp_dir.name, "evolve.pstats"))
+        with self.assertRaises(ValueError):
+            Profiler().dump_trace(os.path.join(self.tmp_dir.name, "evolve.json"))
+        with NULL_PROFILER.phase("score"):
+            NULL_PROFILER.mark_generation(1)
+        NULL_PROFILER.finish()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+import contextlib
+import copy
+import io
+import pickle
+import random
+import unittest
+
+import numpy as np
+
+from genetic_algorithm_starter_kit.reporting import HistoryCollector
+from sudoku_solver.sudoku import PermutationSudoku, RandomSudoku, Sudoku
+from sudoku_solver.utils import validate
+from tests.etc import config
+
+
+class TestRandomSudoku(unittest.TestCase):
+
+    def test_board(self):
+        sudoku = RandomSudoku(config.valid_starting_position)
+        self.assertEqual(sudoku.board, config.valid_starting_position)
+        self.assertEqual(len(sudoku.genes), sum(row.count(0) for row in config.valid_starting_position))
+
+    def test_fill_empty_cells_keeps_clues(self):
+        sudoku = RandomSudoku(config.valid_starting_position)
+        sudoku.fill_empty_cells()
+        for row, clues in zip(sudoku.board, config.valid_starting_position):
+            for digit, clue in zip(row, clues):
+                self.assertIn(digit, [clue] if clue else range(1, 10))
+
+    def test_offspring_shares_template(self):
+        parent0, parent1 = RandomSudoku(config.valid_starting_position), RandomSudoku(config.valid_starting_position)
+        parent0.fill_empty_cells()
+        parent1.fill_empty_cells()
+        child = parent0.reproduce(parent1)
+        self.assertIs(child.template, parent0.template)
+        self.assertFalse(hasattr(child, "__dict__"))
+
+    def test_pickle(self):
+        sudoku = RandomSudoku(config.valid_starting_position)
+        sudoku.fill_empty_cells()
+        sudoku.fitness_score
+        clone = pickle.loads(pickle.dumps(sudoku))
+        self.assertEqual(clone.board, sudoku.board)
+        self.assertTrue(clone.is_scored)
+
+    def test_solve(self):
+        for method in ("propagation", "backtracking"):
+            sudoku = RandomSudoku(config.valid_starting_position)
+            self.assertTrue(sudoku.solve(method=method))
+            self.assertEqual(sudoku.board, config.solved_board)
+            self.assertEqual(sudoku.fitness_score, 1.0)
+
+    def test_board_setter_keeps_clues(self):
+        sudoku = RandomSudoku(config.valid_starting_position)
+        board = copy.deepcopy(config.solved_board)
+        # (0, 0) holds a clue
+        board[0][0] = board[0][0] % 9 + 1
+        with self.assertRaises(ValueError):
+            sudoku.board = board
+
+
+class TestPermutationSudoku(unittest.TestCase):
+
+    def _random_sudoku(self):
+        sudoku = PermutationSudoku(config.hard_starting_position)
+        sudoku.fill_empty_cells()
+        return sudoku
+
+    def test_rows_are_permutations(self):
+        child = self._random_sudoku().reproduce(self._random_sudoku())
+        for sudoku in [self._random_sudoku(), child]:
+            self.assertTrue(validate.are_valid_rows(sudoku.board))
+            self.assertEqual(sudoku.fitness_score_rows, 1.0)
+            self.assertEqual(sudoku.board[1][0], config.hard_starting_position[1][0])
+
+    def test_swap_updates_fitness_incrementally(self):
+        sudoku = self._random_sudoku()
+        rng = random.Random(0)
+        for _ in range(200):
+            start, stop = sudoku.template.row_genes[rng.randrange(9)]
+            sudoku.swap(*rng.sample(range(start, stop), 2))
+            reference = Sudoku(sudoku.board)
+            self.assertEqual(sudoku.fitness_score_boxes, reference.fitness_score_boxes)
+            self.assertEqual(sudoku.fitness_score_cols, reference.fitness_score_cols)
+            self.assertTrue(validate.are_valid_rows(sudoku.board))
+
+    def test_swap_across_rows(self):
+        sudoku = self._random_sudoku()
+        with self.assertRaises(ValueError):
+            sudoku.swap(sudoku.template.row_genes[0][0], sudoku.template.row_genes[1][0])
+
+    def test_evolve(self):
+        sudoku = Sudoku(config.almost_solved_board)
+        with contextlib.redirect_stdout(io.StringIO()):
+            sudoku.evolve(100, verbose=False, encoding="permutation")
+        self.assertEqual(sudoku.board, config.solved_board)
+
+
+class TestSeeding(unittest.TestCase):
+
+    def test_evolve_complete_board(self):
+        for sudoku_class in (RandomSudoku, PermutationSudoku):
+            population = sudoku_class.create_population(config.solved_board, 10, np.random.default_rng(0))
+            self.assertEqual([len(sudoku.genes) for sudoku in population], [0] * 10)
+            result = Sudoku(config.solved_board).evolve(10, encoding=sudoku_class.encoding, reporters=())
+            self.assertTrue(result.solved)
+            self.assertEqual(result.best, config.solved_board)
+
+    def test_create_population(self):
+        for sudoku_class in (RandomSudoku, PermutationSudoku):
+            populations = [
+                sudoku_class.create_population(config.hard_starting_position, 20, np.random.default_rng(0))
+                for _ in range(2)
+            ]
+            self.assertEqual(*[[sudoku.genes for sudoku in population] for population in populations])
+            self.assertIs(populations[0][0].template, populations[0][1].template)
+
+    def test_reproduce_many(self):
+        population = PermutationSudoku.create_population(config.hard_starting_position, 200, np.random.default_rng(0))
+        children = PermutationSudoku.reproduce_many(population[:100], population[100:], np.random.default_rng(1))
+        self.assertEqual(len(children), 100)
+        for child in children:
+            self.assertTrue(validate.are_valid_rows(child.board))
+            self.assertFalse(child.is_scored)
+        # offspring differs from a parent by swaps of two cells within a row
+        self.assertTrue(any(child.genes != parent.genes for child, parent in zip(children, population)))
+
+    def test_evolve(self):
+        runs = []
+        for _ in range(2):
+            collector = HistoryCollector()
+            result = Sudoku(config.almost_solved_board).evolve(100, seed=0, reporters=[collector])
+            runs.append((result._replace(elapsed=0), collector.history.tolist()))
+        self.assertEqual(*runs)
+
+
+if __name__ == '__main__':
+    unittest.main()
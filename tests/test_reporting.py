@@ -0,0 +1,97 @@
+import contextlib
+import io
+import unittest
+
+import numpy as np
+
+from genetic_algorithm_starter_kit.core import Population, VectorizedPopulation
+from genetic_algorithm_starter_kit.reporting import (GenerationEvent,
+                                                     HistoryCollector,
+                                                     PrintReporter)
+from genetic_algorithm_starter_kit.termination import Termination
+from sudoku_solver.sudoku import Sudoku
+from tests.etc import config
+
+
+def event(generation, scores=(0.25, 0.75)):
+    return GenerationEvent(generation, np.array(scores), 1, lambda: f"generation {generation}")
+
+
+class TestReporters(unittest.TestCase):
+
+    def test_event_statistics(self):
+        generation = event(3)
+        self.assertEqual((generation.best, generation.mean, generation.diversity), (0.75, 0.5, 0.25))
+
+    def test_print_interval(self):
+        output = io.StringIO()
+        reporter = PrintReporter(interval=3, stream=output)
+        for generation in range(1, 9):
+            reporter.on_generation(event(generation))
+        reporter.on_finish(None)
+        self.assertEqual(output.getvalue().splitlines(),
+                         ["generation 1", "generation 4", "generation 7", "generation 8", "", "Done."])
+
+    def test_print_min_seconds(self):
+        output = io.StringIO()
+        reporter = PrintReporter(min_seconds=60, stream=output)
+        for generation in range(1, 5):
+            reporter.on_generation(event(generation))
+        reporter.on_finish(None)
+        self.assertEqual(output.getvalue().splitlines()[:2], ["generation 1", "generation 4"])
+
+    def test_invalid_interval(self):
+        with self.assertRaises(ValueError):
+            PrintReporter(interval=0)
+        with self.assertRaises(ValueError):
+            HistoryCollector(capacity=0)
+
+    def test_history(self):
+        collector = HistoryCollector(interval=2, capacity=1)
+        for generation in range(1, 8):
+            collector.on_generation(event(generation))
+        self.assertEqual(len(collector), 3)
+        self.assertEqual(collector.history["generation"].tolist(), [2, 4, 6])
+        np.testing.assert_allclose(collector.history["best"], 0.75)
+
+
+class TestEvolveReporting(unittest.TestCase):
+
+    def test_silent(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            Population(100, "silent", seed=0).evolve(reporters=())
+            VectorizedPopulation(300, "silent", seed=0).evolve(reporters=())
+        self.assertEqual(output.getvalue(), "")
+
+    def test_default_reporter(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            result = VectorizedPopulation(300, "default", seed=0).evolve()
+        lines = output.getvalue().splitlines()
+        self.assertLess(len(lines) - 2, result.generations)
+        self.assertTrue(lines[-3].endswith("FITTEST INDIVIDUAL: default"))
+        self.assertEqual(lines[-1], "Done.")
+
+    def test_history(self):
+        collector = HistoryCollector()
+        result = Population(100, "history", seed=0).evolve(reporters=[collector])
+        self.assertIs(collector.result, result)
+        self.assertEqual(collector.history["generation"].tolist(), list(range(1, result.generations + 1)))
+        self.assertEqual(collector.history["best"][-1], 1.0)
+        self.assertTrue(np.all(collector.history["mean"] <= collector.history["best"]))
+
+    def test_sudoku(self):
+        collector = HistoryCollector()
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            result = Sudoku(config.almost_solved_board).evolve(
+                100, seed=0, reporters=[collector, PrintReporter(interval=1000)],
+                termination=Termination(max_generations=10)
+            )
+        self.assertEqual(len(collector), result.generations)
+        self.assertEqual(output.getvalue().count("GENERATION"), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
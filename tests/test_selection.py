@@ -0,0 +1,53 @@
+import contextlib
+import io
+import unittest
+
+import numpy as np
+
+from genetic_algorithm_starter_kit import selection
+from genetic_algorithm_starter_kit.core import Population, VectorizedPopulation
+
+
+class TestSelection(unittest.TestCase):
+
+    scores = np.random.default_rng(0).random(1000)
+
+    def test_elite_indices(self):
+        np.testing.assert_array_equal(selection.elite_indices(self.scores, 10), np.argsort(-self.scores)[:10])
+        self.assertEqual(len(selection.elite_indices(self.scores, 0)), 0)
+        self.assertEqual(len(selection.elite_indices(self.scores, 2000)), 1000)
+
+    def test_worst_indices(self):
+        self.assertEqual(set(selection.worst_indices(self.scores, 10)), set(np.argsort(self.scores)[:10]))
+
+    def test_strategies(self):
+        for name in selection.STRATEGIES:
+            parents = selection.get_strategy(name)(self.scores, 500, np.random.default_rng(0))
+            self.assertEqual(parents.shape, (500,))
+            self.assertTrue(((parents >= 0) & (parents < len(self.scores))).all())
+            # selection pressure towards fitter individuals
+            self.assertGreater(self.scores[parents].mean(), self.scores.mean())
+
+    def test_truncation(self):
+        parents = selection.truncation(self.scores, 500, np.random.default_rng(0))
+        self.assertGreaterEqual(self.scores[parents].min(), np.median(self.scores))
+
+    def test_roulette_without_fitness(self):
+        parents = selection.roulette(np.zeros(10), 20, np.random.default_rng(0))
+        self.assertEqual(len(parents), 20)
+
+    def test_unknown_strategy(self):
+        with self.assertRaises(ValueError):
+            selection.get_strategy("lottery")
+
+    def test_evolve(self):
+        for name in selection.STRATEGIES:
+            with contextlib.redirect_stdout(io.StringIO()):
+                Population(200, "selection").evolve(verbose=False, selection_strategy=name)
+                population = VectorizedPopulation(500, "selection", seed=0)
+                population.evolve(verbose=False, selection_strategy=name)
+            self.assertEqual(population.individuals[0].chromosome, "selection")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from genetic_algorithm_starter_kit.core import Population, VectorizedPopulation
+from genetic_algorithm_starter_kit.termination import Restart, Termination
+from sudoku_solver.sudoku import PermutationSudoku, RandomSudoku, Sudoku
+from sudoku_solver.utils import evolve
+from tests.etc import config
+
+
+class TestSteadyState(unittest.TestCase):
+
+    target_chromosome = "Steady state"
+
+    def test_populations(self):
+        for population_class in (Population, VectorizedPopulation):
+            population = population_class(100, self.target_chromosome, seed=0)
+            result = population.evolve(reporters=(), steady_state=20)
+            self.assertEqual(result.best, self.target_chromosome)
+            # the final population is kept, fittest first
+            self.assertEqual(len(population.individuals), 100)
+            self.assertEqual(population.individuals[0].chromosome, self.target_chromosome)
+
+    def test_invalid_steady_state_keeps_resumed_state(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "population.ckpt")
+            stop = Termination(max_generations=20, stagnation_window=1, restart=Restart())
+            VectorizedPopulation(100, self.target_chromosome, seed=0).evolve(
+                reporters=(), termination=stop, checkpoint_path=path, checkpoint_interval=1
+            )
+            population = VectorizedPopulation.resume(path)
+        with self.assertRaises(ValueError):
+            population.evolve(reporters=(), steady_state=100)
+        result = population.evolve(reporters=(), termination=Termination(max_generations=20))
+        self.assertGreater(stop.restarts, 0)
+        self.assertEqual(result.restarts, stop.restarts)
+
+    def test_invalid_steady_state(self):
+        for steady_state in (0, 100):
+            with self.assertRaises(ValueError):
+                Population(100, self.target_chromosome, seed=0).evolve(reporters=(), steady_state=steady_state)
+            with self.assertRaises(ValueError):
+                VectorizedPopulation(100, self.target_chromosome, seed=0).evolve(
+                    reporters=(), steady_state=steady_state
+                )
+            with self.assertRaises(ValueError):
+                Sudoku(config.valid_starting_position).evolve(100, reporters=(), steady_state=steady_state)
+
+    def test_replace_worst(self):
+        rng = np.random.default_rng(0)
+        for sudoku_class in (RandomSudoku, PermutationSudoku):
+            population = sudoku_class.create_population(config.valid_starting_position, 50, rng)
+            sudokus = list(population)
+            scores = evolve.score_population(population)
+            best = scores.total.max()
+            evolve.replace_worst(population, scores, 10, rng=rng)
+            # sudokus are overwritten in place and keep being scored correctly
+            self.assertTrue(all(sudoku is original for sudoku, original in zip(population, sudokus)))
+            for sudoku in population:
+                sudoku.invalidate_fitness()
+            np.testing.assert_allclose(evolve.score_population(population).total, scores.total)
+            # only the least fit sudokus are replaced
+            self.assertGreaterEqual(scores.total.max(), best)
+
+    def test_sudoku(self):
+        for encoding in ("uniform", "permutation"):
+            sudoku = Sudoku(config.almost_solved_board)
+            result = sudoku.evolve(200, encoding=encoding, seed=0, reporters=(), steady_state=50)
+            self.assertEqual(result.best_fitness, 1.0)
+            self.assertEqual(sudoku.board, config.solved_board)
+
+
+if __name__ == '__main__':
+    unittest.main()
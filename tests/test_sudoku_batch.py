@@ -0,0 +1,62 @@
+import gzip
+import os
+import tempfile
+import unittest
+
+from sudoku_solver import batch
+from sudoku_solver.utils import parse
+from tests.etc import config
+
+
+class TestSudokuBatch(unittest.TestCase):
+
+    puzzles = [
+        parse.format_board(config.valid_starting_position).replace("0", "."),
+        parse.format_board(config.hard_starting_position),
+    ]
+    solutions = [
+        parse.format_board(config.solved_board),
+        parse.format_board(config.hard_solved_board),
+    ]
+
+    def test_parse_board(self):
+        self.assertEqual(parse.parse_board(self.puzzles[0]), config.valid_starting_position)
+        with self.assertRaises(ValueError):
+            parse.parse_board(self.puzzles[0][:-1])
+        with self.assertRaises(ValueError):
+            parse.parse_board("x" + self.puzzles[0][1:])
+
+    def test_solve_puzzles_in_order(self):
+        puzzles = self.puzzles * 5
+        for workers in [1, 2]:
+            solutions = list(batch.solve_puzzles(puzzles, workers=workers, chunk_size=3, max_pending=2))
+            self.assertEqual(solutions, self.solutions * 5)
+
+    def test_unsolvable_puzzle(self):
+        puzzle = "55" + self.puzzles[1][2:]
+        self.assertEqual(list(batch.solve_puzzles([puzzle], workers=1)), [puzzle])
+
+    def test_malformed_puzzle(self):
+        puzzles = [self.puzzles[0], self.puzzles[1][:-1], "x" + self.puzzles[1][1:], self.puzzles[1]]
+        for workers in [1, 2]:
+            solutions = list(batch.solve_puzzles(puzzles, workers=workers, chunk_size=1))
+            self.assertEqual(solutions, [self.solutions[0], puzzles[1], puzzles[2], self.solutions[1]])
+
+    def test_evolve_complete_puzzle(self):
+        puzzles = [parse.format_board(config.solved_board)] * 2
+        solutions = batch.solve_puzzles(puzzles, engine="evolve", workers=1, population_size=10)
+        self.assertEqual(list(solutions), puzzles)
+
+    def test_solve_gzip_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            input_path = os.path.join(tmp_dir, "puzzles.txt.gz")
+            output_path = os.path.join(tmp_dir, "solutions.txt")
+            with gzip.open(input_path, "wt") as file:
+                file.write("# comment\n" + "\n".join(self.puzzles) + "\n\n")
+            self.assertEqual(batch.solve_file(input_path, output_path, workers=1), 2)
+            with open(output_path) as file:
+                self.assertEqual(file.read().splitlines(), self.solutions)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import copy
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from sudoku_solver.sudoku import Sudoku
+from sudoku_solver.utils import canonical
+from sudoku_solver.utils.solution_cache import SolutionCache
+from tests.etc import config
+
+
+def random_symmetry(board, rng):
+    """Apply random transposition, band, row, stack and column permutations and relabeling."""
+    board = np.array(board)
+    if rng.random() < 0.5:
+        board = board.T
+    rows, cols = canonical._LINE_PERMUTATIONS[rng.integers(1296, size=2)]
+    labels = np.concatenate([[0], rng.permutation(9) + 1])
+    return labels[board[np.ix_(rows, cols)]].tolist()
+
+
+class TestCanonical(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+
+    def test_equivalent_puzzles(self):
+        for puzzle in [config.valid_starting_position, config.hard_starting_position]:
+            form, _ = canonical.canonicalize(puzzle)
+            for _ in range(50):
+                equivalent, _ = canonical.canonicalize(random_symmetry(puzzle, self.rng))
+                np.testing.assert_array_equal(equivalent, form)
+
+    def test_different_puzzles(self):
+        puzzle = copy.deepcopy(config.hard_starting_position)
+        form, _ = canonical.canonicalize(puzzle)
+        puzzle[0][1] = 1
+        self.assertFalse(np.array_equal(canonical.canonicalize(puzzle)[0], form))
+
+    def test_transform(self):
+        form, transform = canonical.canonicalize(config.hard_starting_position)
+        np.testing.assert_array_equal(transform.apply(config.hard_starting_position), form)
+        np.testing.assert_array_equal(transform.invert(form), config.hard_starting_position)
+        solution = transform.apply(config.hard_solved_board)
+        np.testing.assert_array_equal(transform.invert(solution), config.hard_solved_board)
+
+    def test_symmetric_board(self):
+        self.assertIsNone(canonical.canonicalize(np.zeros((9, 9), dtype=int)))
+
+
+class TestSolutionCache(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "solutions.bin")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_equivalent_puzzle(self):
+        cache = SolutionCache()
+        self.assertTrue(Sudoku(config.hard_starting_position).solve(cache=cache))
+        puzzle = random_symmetry(config.hard_starting_position, self.rng)
+        solution = cache.get(puzzle)
+        sudoku = Sudoku(solution)
+        self.assertTrue(sudoku.is_valid())
+        self.assertTrue(all(solution[row][col] == digit for row, line in enumerate(puzzle)
+                            for col, digit in enumerate(line) if digit))
+        self.assertEqual(cache.info().hits, 1)
+
+    def test_miss(self):
+        cache = SolutionCache()
+        self.assertIsNone(cache.get(config.hard_starting_position))
+        self.assertEqual(cache.info().misses, 1)
+        board = copy.deepcopy(config.hard_starting_position)
+        board[0][0] = 10
+        self.assertFalse(Sudoku(board).solve(cache=cache))
+
+    def test_disk(self):
+        cache = SolutionCache(self.path, disk_slots=100)
+        cache.put(config.hard_starting_position, config.hard_solved_board)
+        cache.flush()
+        self.assertEqual(os.path.getsize(self.path), 64 + 100 * 162)
+        puzzle = random_symmetry(config.hard_starting_position, self.rng)
+        solution = SolutionCache(self.path).get(puzzle)
+        self.assertTrue(Sudoku(solution).is_valid())
+        with open(self.path, "r+b") as file:
+            file.write(b"garbage!")
+        with self.assertRaises(ValueError):
+            SolutionCache(self.path)
+
+    def test_evolve(self):
+        cache = SolutionCache()
+        cache.put(config.valid_starting_position, config.solved_board)
+        sudoku = Sudoku(random_symmetry(config.valid_starting_position, self.rng))
+        result = sudoku.evolve(100, solution_cache=cache)
+        self.assertEqual((result.solved, result.generations), (True, 0))
+        self.assertTrue(sudoku.is_valid())
+
+
+if __name__ == '__main__':
+    unittest.main()
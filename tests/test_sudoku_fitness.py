@@ -0,0 +1,90 @@
+import copy
+import random
+import unittest
+
+import numpy as np
+
+from sudoku_solver.sudoku import PermutationSudoku, RandomSudoku, Sudoku
+from sudoku_solver.utils import evolve, score_fitness
+from tests.etc import config
+
+
+class TestSudokuFitness(unittest.TestCase):
+
+    @staticmethod
+    def _random_boards(n):
+        boards = []
+        for _ in range(n):
+            sudoku = RandomSudoku(config.valid_starting_position)
+            sudoku.fill_empty_cells()
+            boards.append(sudoku.board)
+        return boards
+
+    def test_solved_board(self):
+        scores = score_fitness.score_many([config.solved_board])
+        self.assertEqual(scores.total[0], 1.0)
+
+    def test_score_many(self):
+        """ Check batch scores against the per-board scoring functions. """
+        boards = self._random_boards(50) + [config.valid_starting_position]
+        # Out of range digits do not count towards the score
+        boards[0][0][0] = 10
+        scores = score_fitness.score_many(boards)
+        for idx, board in enumerate(boards):
+            sudoku = Sudoku(board)
+            self.assertEqual(scores.rows[idx], sudoku.fitness_score_rows)
+            self.assertEqual(scores.cols[idx], sudoku.fitness_score_cols)
+            self.assertEqual(scores.boxes[idx], sudoku.fitness_score_boxes)
+            self.assertEqual(scores.total[idx], sudoku.fitness_score)
+
+    def test_score_many_unnormalized(self):
+        board = copy.deepcopy(config.solved_board)
+        scores = score_fitness.score_many([board], normalize=False)
+        self.assertEqual(scores.rows[0], score_fitness.score_rows(board, normalize=False))
+        self.assertEqual(scores.boxes[0], 81)
+
+    def test_score_permutation_components(self):
+        population = PermutationSudoku.create_population(config.hard_starting_position, 20, np.random.default_rng(0))
+        boards = evolve.stack_boards(population)
+        scores = score_fitness.score_permutation_components(boards)
+        np.testing.assert_array_equal(scores, score_fitness.score_components(boards))
+        np.testing.assert_array_equal(scores, [sudoku.fitness_scores for sudoku in population])
+
+    def test_cached_scores(self):
+        sudoku = RandomSudoku(config.valid_starting_position)
+        sudoku.fill_empty_cells()
+        self.assertFalse(sudoku.is_scored)
+        self.assertEqual(sudoku.fitness_score, Sudoku(sudoku.board).fitness_score)
+        self.assertTrue(sudoku.is_scored)
+        # Changing the genome invalidates the cache
+        sudoku.fill_empty_cells()
+        self.assertFalse(sudoku.is_scored)
+        self.assertEqual(sudoku.fitness_score, Sudoku(sudoku.board).fitness_score)
+
+    def test_unit_counts_update(self):
+        board = self._random_boards(1)[0]
+        unit_counts = score_fitness.UnitCounts(board)
+        rng = random.Random(0)
+        for _ in range(100):
+            changes = [(rng.randrange(81), rng.choice([0, 10] + list(range(1, 10)))) for _ in range(3)]
+            unit_counts.update(changes)
+            for cell, digit in changes:
+                board[cell // 9][cell % 9] = digit
+            sudoku = Sudoku(board)
+            self.assertEqual(
+                unit_counts.fitness_scores(),
+                (sudoku.fitness_score_boxes, sudoku.fitness_score_cols, sudoku.fitness_score_rows),
+            )
+
+    def test_mutate(self):
+        sudoku = RandomSudoku(config.valid_starting_position)
+        sudoku.fill_empty_cells()
+        sudoku.update_genes([(0, 4)])
+        child = sudoku.mutate([(1, 2), (2, 6)])
+        self.assertEqual(list(child.genes[:3]), [4, 2, 6])
+        self.assertEqual(child.fitness_scores, RandomSudoku._from_genes(child.template, child.genes).fitness_scores)
+        self.assertNotEqual(list(sudoku.genes[:3]), [4, 2, 6])
+
+
+if __name__ == '__main__':
+    unittest.main()
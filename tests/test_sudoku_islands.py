@@ -0,0 +1,29 @@
+import unittest
+
+from sudoku_solver.sudoku import Sudoku
+from tests.etc import config
+
+
+class TestSudokuIslands(unittest.TestCase):
+
+    def test_evolve_islands(self):
+        for topology in ["ring", "random"]:
+            sudoku = Sudoku(config.almost_solved_board)
+            sudoku.evolve_islands(
+                population_size=100,
+                n_islands=3,
+                migration_size=2,
+                migration_interval=2,
+                topology=topology,
+                verbose=False,
+                seed=0,
+            )
+            self.assertEqual(sudoku.board, config.solved_board)
+
+    def test_unknown_topology(self):
+        with self.assertRaises(ValueError):
+            Sudoku(config.almost_solved_board).evolve_islands(10, n_islands=2, topology="star")
+
+
+if __name__ == '__main__':
+    unittest.main()
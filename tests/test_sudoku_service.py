@@ -0,0 +1,109 @@
+import asyncio
+import copy
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from genetic_algorithm_starter_kit.termination import Termination
+from sudoku_solver.service import SolverService
+from tests.etc import config
+
+
+class GatedExecutor(ThreadPoolExecutor):
+    """Thread pool counting submitted batches, which only run once the gate is open."""
+
+    def __init__(self):
+        super().__init__(max_workers=2)
+        self.gate = threading.Event()
+        self.gate.set()
+        self.batch_sizes = []
+        self.terminations = []
+
+    def submit(self, fn, lines, *args):
+        self.batch_sizes.append(len(lines))
+        self.terminations.append(args[-1])
+
+        def gated():
+            self.gate.wait()
+            return fn(lines, *args)
+
+        return super().submit(gated)
+
+
+class TestSolverService(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.executor = GatedExecutor()
+        self.unsolvable = copy.deepcopy(config.hard_starting_position)
+        self.unsolvable[0][:2] = [5, 5]
+
+    def tearDown(self):
+        self.executor.gate.set()
+        self.executor.shutdown()
+
+    async def test_solve_many_in_one_batch(self):
+        boards = [config.valid_starting_position, config.hard_starting_position] * 3
+        async with SolverService(executor=self.executor, max_delay=0.05) as service:
+            solutions = await service.solve_many(boards)
+        self.assertEqual(solutions, [config.solved_board, config.hard_solved_board] * 3)
+        self.assertEqual(self.executor.batch_sizes, [6])
+
+    async def test_max_batch_size(self):
+        async with SolverService(executor=self.executor, max_batch_size=4, max_delay=0.05) as service:
+            await service.solve_many([config.valid_starting_position] * 10)
+        self.assertEqual(self.executor.batch_sizes, [4, 4, 2])
+
+    async def test_unsolvable(self):
+        async with SolverService(executor=self.executor) as service:
+            self.assertIsNone(await service.solve(self.unsolvable))
+            with self.assertRaises(ValueError):
+                await service.solve([[10] * 9] * 9)
+
+    async def test_termination_per_batch(self):
+        termination = Termination(max_generations=2)
+        async with SolverService("evolve", executor=self.executor, max_batch_size=1, population_size=20,
+                                 termination=termination) as service:
+            solutions = await service.solve_many([self.unsolvable] * 2)
+        self.assertEqual(solutions, [None, None])
+        # concurrent batches must not share the timer and counters of a termination
+        self.assertEqual(len({id(batch_termination) for batch_termination in self.executor.terminations}), 2)
+        self.assertNotIn(termination, self.executor.terminations)
+        self.assertEqual(self.executor.terminations[0].max_generations, 2)
+
+    async def test_timeout(self):
+        self.executor.gate.clear()
+        async with SolverService(executor=self.executor) as service:
+            with self.assertRaises(asyncio.TimeoutError):
+                await service.solve(config.valid_starting_position, timeout=0.01)
+            self.executor.gate.set()
+            self.assertEqual(await service.solve(config.valid_starting_position, timeout=5), config.solved_board)
+
+    async def test_cancel_queued_request(self):
+        self.executor.gate.clear()
+        async with SolverService(executor=self.executor, max_pending=1) as service:
+            first = asyncio.create_task(service.solve(config.valid_starting_position))
+            await asyncio.sleep(0.05)
+            cancelled = asyncio.create_task(service.solve(config.hard_starting_position))
+            await asyncio.sleep(0.05)
+            cancelled.cancel()
+            self.executor.gate.set()
+            self.assertEqual(await first, config.solved_board)
+            with self.assertRaises(asyncio.CancelledError):
+                await cancelled
+        # the cancelled request waited for a free slot and was never dispatched
+        self.assertEqual(self.executor.batch_sizes, [1])
+
+    async def test_process_pool(self):
+        async with SolverService(workers=2, max_batch_size=2) as service:
+            solutions = await service.solve_many([config.hard_starting_position, self.unsolvable] * 2, timeout=30)
+        self.assertEqual(solutions, [config.hard_solved_board, None] * 2)
+
+    async def test_not_running(self):
+        with self.assertRaises(RuntimeError):
+            await SolverService(executor=self.executor).solve(config.valid_starting_position)
+        with self.assertRaises(ValueError):
+            SolverService(engine="guessing")
+
+
+if __name__ == '__main__':
+    unittest.main()
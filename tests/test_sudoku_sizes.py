@@ -0,0 +1,90 @@
+import copy
+import unittest
+
+import numpy as np
+
+from sudoku_solver.sudoku import RandomSudoku, Sudoku
+from sudoku_solver.utils import score_fitness, units, validate
+from sudoku_solver.utils.solution_cache import SolutionCache
+from tests.etc import config
+
+
+class TestUnitTable(unittest.TestCase):
+
+    def test_units(self):
+        table = units.unit_table(4)
+        self.assertEqual(table.box_size, 2)
+        self.assertEqual(table.symbols, (1, 2, 3, 4))
+        self.assertEqual(table.boxes[1].tolist(), [2, 3, 6, 7])
+        self.assertEqual(table.cell_units[7], (1, 3, 1))
+        self.assertIs(units.unit_table(9).units, units.UNITS)
+
+    def test_unsupported_sizes(self):
+        for size in (0, 8, 64):
+            with self.assertRaises(ValueError):
+                units.unit_table(size)
+
+    def test_popcount(self):
+        bitsets = np.array([0, 0b1011, 1 << 63, (1 << 64) - 1], dtype=np.uint64)
+        self.assertEqual(units.popcount(bitsets).tolist(), [0, 3, 1, 64])
+
+
+class TestSudokuSizes(unittest.TestCase):
+
+    def test_solve_small(self):
+        for method in ("propagation", "backtracking"):
+            sudoku = Sudoku(config.small_starting_position)
+            self.assertTrue(sudoku.solve(method))
+            self.assertEqual(sudoku.board, config.small_solved_board)
+
+    def test_solve_large(self):
+        sudoku = Sudoku([[0] * 16 for _ in range(16)])
+        self.assertTrue(sudoku.solve())
+        self.assertTrue(sudoku.is_valid())
+        # puzzle from every other cell of the solution
+        solution = sudoku.board
+        puzzle = [[digit if (row + col) % 2 else 0 for col, digit in enumerate(line)]
+                  for row, line in enumerate(solution)]
+        sudoku = Sudoku(puzzle)
+        self.assertEqual(sudoku.size, 16)
+        self.assertTrue(sudoku.solve())
+        self.assertTrue(sudoku.is_valid())
+
+    def test_validation(self):
+        invalid = copy.deepcopy(config.small_solved_board)
+        invalid[0][0] = 2
+        boards = [config.small_solved_board, config.small_starting_position, invalid]
+        self.assertEqual([Sudoku(board).is_valid() for board in boards], [True, True, False])
+        self.assertEqual(validate.validate_many(np.array(boards)).tolist(), [True, True, False])
+        out_of_range = copy.deepcopy(config.small_starting_position)
+        out_of_range[0][1] = 5
+        self.assertFalse(Sudoku(out_of_range).is_valid())
+        self.assertFalse(validate.validate_many(np.array([out_of_range]))[0])
+
+    def test_fitness(self):
+        boards = [config.small_solved_board, config.small_starting_position]
+        scores = score_fitness.score_many(np.array(boards))
+        for board, total in zip(boards, scores.total):
+            self.assertAlmostEqual(Sudoku(board).fitness_score, total)
+        self.assertEqual(scores.total[0], 1.0)
+        sudoku = RandomSudoku(config.small_starting_position)
+        sudoku.fill_empty_cells(np.random.default_rng(0))
+        expected = sudoku.fitness_scores
+        sudoku.invalidate_fitness()
+        sudoku.update_genes([(0, sudoku.genes[0])])
+        self.assertEqual(sudoku.fitness_scores, expected)
+
+    def test_evolve_small(self):
+        for encoding in ("uniform", "permutation"):
+            sudoku = Sudoku(config.small_starting_position)
+            result = sudoku.evolve(50, encoding=encoding, seed=0, reporters=())
+            self.assertEqual(result.best_fitness, 1.0)
+            self.assertEqual(sudoku.board, config.small_solved_board)
+
+    def test_solution_cache_only_9x9(self):
+        with self.assertRaises(ValueError):
+            Sudoku(config.small_starting_position).solve(cache=SolutionCache())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,4 @@
+import copy
 import unittest
 
 from sudoku_solver.sudoku import Sudoku
@@ -17,5 +18,29 @@ class TestSudokuSolver(unittest.TestCase):
         self.assertEqual(self.sudoku.board, config.solved_board)
 
 
+class TestSudokuSolverMethods(unittest.TestCase):
+
+    def test_backtracking(self):
+        sudoku = Sudoku(config.valid_starting_position)
+        self.assertTrue(sudoku.solve(method="backtracking"))
+        self.assertEqual(sudoku.board, config.solved_board)
+
+    def test_propagation_hard_board(self):
+        sudoku = Sudoku(config.hard_starting_position)
+        self.assertTrue(sudoku.solve(method="propagation"))
+        self.assertEqual(sudoku.board, config.hard_solved_board)
+
+    def test_propagation_conflicting_clues(self):
+        board = copy.deepcopy(config.valid_starting_position)
+        board[0][2] = 5
+        sudoku = Sudoku(board)
+        self.assertFalse(sudoku.solve(method="propagation"))
+        self.assertEqual(sudoku.board, board)
+
+    def test_unknown_method(self):
+        with self.assertRaises(ValueError):
+            Sudoku(config.valid_starting_position).solve(method="guessing")
+
+
 if __name__ == '__main__':
     unittest.main()
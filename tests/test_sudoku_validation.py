@@ -1,8 +1,10 @@
 import copy
 import unittest
 
+import numpy as np
+
 from sudoku_solver.sudoku import Sudoku
-from sudoku_solver.utils import validate
+from sudoku_solver.utils import units, validate
 from tests.etc import config
 
 
@@ -61,5 +63,49 @@ class TestSudokuValidation(unittest.TestCase):
         )
 
 
+class TestValidateMany(unittest.TestCase):
+
+    @staticmethod
+    def _random_boards(n_boards, seed=0):
+        """Solved boards with some cells emptied or replaced by random, possibly invalid, symbols."""
+        rng = np.random.default_rng(seed)
+        boards = np.tile(np.array(config.solved_board), (n_boards, 1, 1)).reshape(n_boards, 81)
+        for board in boards:
+            cells = rng.choice(81, size=rng.integers(0, 4), replace=False)
+            board[cells] = rng.integers(-1, 12, size=len(cells))
+            board[rng.random(81) < 0.3] = 0
+        return boards.reshape(n_boards, 9, 9)
+
+    def test_matches_is_valid(self):
+        boards = self._random_boards(500)
+        valid = validate.validate_many(boards)
+        expected = [Sudoku(board.tolist()).is_valid() for board in boards]
+        self.assertEqual(valid.tolist(), expected)
+        self.assertTrue(0 < sum(expected) < len(expected))
+
+    def test_conflicts(self):
+        boards = self._random_boards(200, seed=1)
+        valid, conflicts = validate.validate_many(boards, return_conflicts=True)
+        cells = boards.reshape(len(boards), 81)
+        expected = [[not validate._is_valid_list(board[unit].tolist()) for unit in units.UNITS] for board in cells]
+        self.assertEqual(conflicts.tolist(), expected)
+        self.assertEqual(valid.tolist(), (~conflicts.any(axis=1)).tolist())
+
+    def test_duplicate_units(self):
+        boards = np.array([config.valid_starting_position] * 2)
+        boards[1, 0, 0] = 3
+        valid, conflicts = validate.validate_many(boards, return_conflicts=True)
+        self.assertEqual(valid.tolist(), [True, False])
+        # row 0 and the upper left box contain two 3s
+        self.assertEqual(np.flatnonzero(conflicts[1]).tolist(), [0, 18])
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            validate.validate_many(np.zeros((2, 9, 8), dtype=int))
+        with self.assertRaises(ValueError):
+            validate.validate_many(np.zeros((2, 9, 9), dtype=float))
+        self.assertEqual(validate.validate_many(np.zeros((0, 9, 9), dtype=int)).shape, (0,))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,149 @@
+import contextlib
+import copy
+import io
+import json
+import unittest
+
+import numpy as np
+
+from genetic_algorithm_starter_kit import termination
+from genetic_algorithm_starter_kit.core import (Organism, Population,
+                                                VectorizedPopulation)
+from genetic_algorithm_starter_kit.termination import Restart, Termination
+from sudoku_solver import batch
+from sudoku_solver.sudoku import Sudoku
+from sudoku_solver.utils import parse
+from tests.etc import config
+
+
+def constant_fitness(genomes):
+    return np.full(len(genomes), 0.5)
+
+
+class TestTermination(unittest.TestCase):
+
+    def test_target_fitness(self):
+        self.assertEqual(Termination().check(1, 1.0), termination.TARGET_FITNESS)
+        self.assertEqual(Termination(target_fitness=0.9).check(1, 0.95), termination.TARGET_FITNESS)
+        self.assertIsNone(Termination().check(1, 0.99))
+
+    def test_max_generations(self):
+        stop = Termination(max_generations=3)
+        self.assertEqual([stop.check(generation, 0.5) for generation in [1, 2, 3]],
+                         [None, None, termination.MAX_GENERATIONS])
+
+    def test_time_budget(self):
+        self.assertEqual(Termination(time_budget=0).check(1, 0.5), termination.TIME_BUDGET)
+
+    def test_stagnation(self):
+        stop = Termination(stagnation_window=2)
+        self.assertEqual([stop.check(generation, 0.5) for generation in [1, 2]], [None, None])
+        self.assertIsNone(stop.check(3, 0.6))
+        self.assertIsNone(stop.check(4, 0.6))
+        self.assertEqual(stop.check(5, 0.6), termination.STAGNATION)
+
+    def test_restart(self):
+        stop = Termination(stagnation_window=1, restart=Restart(max_restarts=2))
+        reasons = [stop.check(generation, 0.5) for generation in range(1, 5)]
+        self.assertEqual(reasons, [None, termination.RESTART, termination.RESTART, termination.STAGNATION])
+        self.assertEqual(stop.restarts, 2)
+
+    def test_restore(self):
+        stop = Termination(stagnation_window=2, restart=Restart())
+        self.assertEqual([stop.check(generation, 0.5) for generation in [1, 2, 3]], [None, None, termination.RESTART])
+        resumed = Termination(stagnation_window=2, restart=Restart())
+        state = json.loads(json.dumps(stop.state()))
+        resumed.restore(state)
+        self.assertEqual(resumed.restarts, 1)
+        self.assertGreaterEqual(resumed.elapsed, state["elapsed"])
+        self.assertEqual([resumed.check(generation, 0.5) for generation in [4, 5]], [None, termination.RESTART])
+        self.assertEqual(resumed.restarts, 2)
+
+    def test_invalid_restart(self):
+        with self.assertRaises(ValueError):
+            Termination(restart=Restart())
+        with self.assertRaises(ValueError):
+            Restart(reseed_fraction=2)
+
+    def test_escalate(self):
+        restart = Restart(mutation_factor=3, max_mutation_rate=0.5)
+        prob_cutoffs = restart.escalate({"self": 0.45, "mate": 0.9})
+        self.assertAlmostEqual(prob_cutoffs["mate"], 0.7)
+        self.assertAlmostEqual(prob_cutoffs["self"], 0.35)
+        self.assertAlmostEqual(restart.escalate(prob_cutoffs)["mate"], 0.5)
+
+
+class TestEvolveTermination(unittest.TestCase):
+
+    def test_population(self):
+        population = Population(50, "termination", seed=0)
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = population.evolve(verbose=False, termination=Termination(max_generations=3))
+        self.assertEqual(result.stop_reason, termination.MAX_GENERATIONS)
+        self.assertEqual(result.generations, 3)
+        self.assertFalse(result.solved)
+        self.assertEqual(len(result.best), len("termination"))
+
+    def test_population_restart(self):
+        population = Population(50, fitness=constant_fitness, chromosome_length=8, seed=0)
+        stop = Termination(stagnation_window=2, restart=Restart(max_restarts=3))
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = population.evolve(verbose=False, termination=stop)
+        self.assertEqual((result.stop_reason, result.restarts), (termination.STAGNATION, 3))
+
+    def test_custom_organism_restart(self):
+        class Clone(Organism):
+            def reproduce(self, mate, rng=None, prob_cutoffs=None):
+                return Clone(self.chromosome)
+
+        population = Population(20, fitness=constant_fitness, organism=Clone, chromosome_length=8, seed=0)
+        stop = Termination(stagnation_window=2, restart=Restart(max_restarts=2))
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = population.evolve(verbose=False, termination=stop)
+        self.assertEqual((result.stop_reason, result.restarts), (termination.STAGNATION, 2))
+
+    def test_vectorized_population(self):
+        population = VectorizedPopulation(100, seed=0, fitness=constant_fitness, chromosome_length=8)
+        stop = Termination(stagnation_window=5, restart=Restart(max_restarts=2))
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = population.evolve(verbose=False, termination=stop)
+        self.assertEqual((result.stop_reason, result.restarts), (termination.STAGNATION, 2))
+        self.assertEqual(result.best_fitness, 0.5)
+
+    def test_vectorized_population_solved(self):
+        population = VectorizedPopulation(500, "solved", seed=0)
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = population.evolve(verbose=False)
+        self.assertTrue(result.solved)
+        self.assertEqual(result.best, "solved")
+
+    def test_unsolvable_sudoku(self):
+        board = copy.deepcopy(config.valid_starting_position)
+        board[0][2] = board[0][0] = 5
+        sudoku = Sudoku(board)
+        stop = Termination(max_generations=5, stagnation_window=2, restart=Restart())
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = sudoku.evolve(50, termination=stop, seed=0)
+        self.assertEqual(result.stop_reason, termination.MAX_GENERATIONS)
+        self.assertLess(result.best_fitness, 1.0)
+        self.assertEqual(sudoku.board, board)
+
+    def test_sudoku_restart(self):
+        sudoku = Sudoku(config.almost_solved_board)
+        stop = Termination(stagnation_window=1, restart=Restart(reseed_fraction=0.2))
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = sudoku.evolve(100, encoding="permutation", termination=stop, seed=0)
+        self.assertTrue(result.solved)
+        self.assertEqual(sudoku.board, config.solved_board)
+
+    def test_batch_time_budget(self):
+        board = copy.deepcopy(config.valid_starting_position)
+        board[0][2] = board[0][0] = 5
+        line = parse.format_board(board)
+        solutions = batch.solve_puzzles([line], engine="evolve", workers=1, population_size=50,
+                                        termination=Termination(time_budget=0.05))
+        self.assertEqual(list(solutions), [line])
+
+
+if __name__ == '__main__':
+    unittest.main()
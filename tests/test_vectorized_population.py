@@ -0,0 +1,111 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+from genetic_algorithm_starter_kit.core import (Individual, Population,
+                                                VectorizedPopulation)
+
+
+class TestVectorizedPopulation(unittest.TestCase):
+
+    target_chromosome = "Hello, genetic world!"
+
+    def test_encode_decode(self):
+        genome = VectorizedPopulation.encode(self.target_chromosome)
+        self.assertEqual(VectorizedPopulation.decode(genome), self.target_chromosome)
+
+    def test_invalid_gene(self):
+        with self.assertRaises(ValueError):
+            VectorizedPopulation.encode("\t")
+
+    def test_fitness_scores(self):
+        """ Check vectorized scores against the reference implementation. """
+        population = VectorizedPopulation(50, self.target_chromosome, seed=0)
+        reference = Population(0, self.target_chromosome)
+        expected = [reference.fitness_score(individual) for individual in population.individuals]
+        self.assertEqual(list(population.fitness_scores()), expected)
+
+    def test_evolve(self):
+        population = VectorizedPopulation(500, self.target_chromosome, seed=0)
+        with contextlib.redirect_stdout(io.StringIO()):
+            population.evolve(verbose=False)
+        self.assertIsInstance(population.individuals[0], Individual)
+        self.assertEqual(population.individuals[0].chromosome, self.target_chromosome)
+
+    def test_evolve_without_target(self):
+        with self.assertRaises(ValueError):
+            VectorizedPopulation(10).evolve()
+
+    def test_seeded_population(self):
+        generation_counts = []
+        for _ in range(2):
+            population = Population(100, "seeded", seed=0)
+            with contextlib.redirect_stdout(io.StringIO()):
+                generation_counts.append(population.evolve(verbose=False).generations)
+        self.assertEqual(*generation_counts)
+
+
+class TestFitnessCaching(unittest.TestCase):
+
+    def test_chromosome_invalidates_fitness(self):
+        population = Population(10, "abc")
+        individual = Individual("abd")
+        self.assertEqual(population._fitness_scores([individual]), [2 / 3])
+        self.assertEqual(individual.fitness, 2 / 3)
+        individual.chromosome = "abc"
+        self.assertIsNone(individual.fitness)
+        self.assertEqual(population._fitness_scores([individual]), [1.0])
+
+    def test_mutate_scores_incrementally(self):
+        population = Population(10, "abcd")
+        individual = Individual("abxx")
+        population._fitness_scores([individual])
+        child = population.mutate(individual, {2: "c", 3: "y"})
+        self.assertEqual(child.chromosome, "abcy")
+        self.assertEqual(child.fitness, population.fitness_score(child))
+
+
+class Bits(Individual):
+
+    GENES = list("01")
+
+    @staticmethod
+    def batch_fitness(genomes):
+        return genomes.mean(axis=1)
+
+
+class Bases(Individual):
+
+    GENES = list("ACGT\t")
+
+
+class TestCustomGenes(unittest.TestCase):
+
+    def test_encode_decode(self):
+        self.assertEqual(Bits.encode("110").tolist(), [1, 1, 0])
+        self.assertEqual(Bases.decode(Bases.encode("GATTACA\t")), "GATTACA\t")
+        self.assertEqual(Individual.encode("a").tolist(), [0])
+        with self.assertRaises(ValueError):
+            Bits.encode("2")
+
+    def test_fitness_scores(self):
+        population = Population(0, organism=Bits)
+        self.assertEqual(population._fitness_scores([Bits("11100000")]), [3 / 8])
+
+    def test_evolve(self):
+        for organism, target in [(Bits, ""), (Bases, "GATTACA\t")]:
+            population = Population(100, target, organism=organism, chromosome_length=8, seed=0)
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                path = os.path.join(tmp_dir, "population.ckpt")
+                result = population.evolve(reporters=(), checkpoint_path=path, checkpoint_interval=1)
+                resumed = Population.resume(path, organism=organism)
+            self.assertTrue(result.solved)
+            self.assertEqual(result.best, target or "11111111")
+            self.assertIsInstance(resumed.individuals[0], organism)
+            self.assertEqual(resumed.evolve(reporters=()).best, result.best)
+
+
+if __name__ == '__main__':
+    unittest.main()